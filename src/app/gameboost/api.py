@@ -1,39 +1,155 @@
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Final
 import requests
 
 from . import logger
-from .models import OfferResponse, CurrencyOffer, AccountOffer, ItemOffer
+from .models import (
+    OfferResponse,
+    PricingResponse,
+    CurrencyOffer,
+    CurrencyOfferPricing,
+    AccountOffer,
+    AccountOfferPricing,
+    ItemOffer,
+    ItemOfferPricing,
+    OfferUpdateResult,
+)
+from .rate_limiter import AdaptiveLimiter, parse_retry_after
 
 from app.shared.decorators import retry_on_fail
 
 GAMEBOOST_API_BASE_URL: Final[str] = "https://api.gameboost.com/v2"
 
+# Client-side limits, the adaptive limiters settle below these when throttled
+READ_RATE_PER_SECOND: Final[float] = 5.0
+READ_BURST: Final[float] = 10.0
+READ_MAX_CONCURRENCY: Final[int] = 8
+# Writes are capped like reads: an account row fans out up to
+# ACCOUNT_UPDATE_MAX_WORKERS PATCHes at once, and a 429 halves both anyway
+WRITE_RATE_PER_SECOND: Final[float] = 5.0
+WRITE_BURST: Final[float] = 10.0
+WRITE_MAX_CONCURRENCY: Final[int] = 8
 
-class GameboostClient:
-    def __init__(self) -> None:
-        self.base_url: str = GAMEBOOST_API_BASE_URL
-        self.api_key: str = os.environ["GAMEBOOST_API_KEY"]
+# Fan-out for rows that link many account offers
+ACCOUNT_UPDATE_MAX_WORKERS: Final[int] = 8
+ACCOUNT_UPDATE_DEADLINE: Final[float] = 30.0
+ACCOUNT_UPDATE_MAX_ATTEMPTS: Final[int] = 4
+ACCOUNT_UPDATE_RETRY_INTERVAL: Final[float] = 2.0
 
-    @retry_on_fail(max_retries=3, sleep_interval=2, exceptions=(requests.HTTPError,))
-    def get_currency_offer(
+
+class DeadlineExceeded(Exception):
+    pass
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether a failed request may succeed when sent again.
+
+    Throttling (429), server errors (5xx) and connection problems are
+    transient; any other HTTP error (400, 401, 404, 422, ...) or exception
+    would fail the same way again.
+    """
+    if isinstance(error, requests.HTTPError):
+        status = error.response.status_code if error.response is not None else None
+        return status is not None and (status == 429 or status >= 500)
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+
+# Single-offer calls retry what is_retryable() deems transient, a 4xx fails fast
+retry_transient_errors = retry_on_fail(
+    max_retries=3,
+    sleep_interval=2,
+    exceptions=(requests.RequestException,),
+    retry_if=is_retryable,
+)
+
+
+class GameboostClient:
+    def __init__(
         self,
-        currency_offer_id: str,
-    ) -> OfferResponse[CurrencyOffer]:
-        path: str = f"{self.base_url}/currency-offers/{currency_offer_id}"
+        base_url: str = GAMEBOOST_API_BASE_URL,
+        api_key: str | None = None,
+    ) -> None:
+        self.base_url: str = base_url
+        self.api_key: str = api_key or os.environ["GAMEBOOST_API_KEY"]
+        self.read_limiter = AdaptiveLimiter(
+            name="gameboost-read",
+            rate=READ_RATE_PER_SECOND,
+            burst=READ_BURST,
+            max_concurrency=READ_MAX_CONCURRENCY,
+        )
+        self.write_limiter = AdaptiveLimiter(
+            name="gameboost-write",
+            rate=WRITE_RATE_PER_SECOND,
+            burst=WRITE_BURST,
+            max_concurrency=WRITE_MAX_CONCURRENCY,
+        )
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        limiter: AdaptiveLimiter,
+        expires_at: float | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        with limiter.slot():
+            started = time.monotonic()
+            # Waiting for a slot can take a while when throttled
+            if expires_at is not None:
+                if started >= expires_at:
+                    raise DeadlineExceeded(f"{method} {url}")
+                kwargs.setdefault("timeout", expires_at - started)
+            res = requests.request(method, url, **kwargs)
+            latency = time.monotonic() - started
+
+        if res.status_code == 429 or (
+            res.status_code == 503 and "Retry-After" in res.headers
+        ):
+            limiter.on_throttle(parse_retry_after(res.headers.get("Retry-After")))
+        elif res.status_code < 500:
+            # A failing upstream answers fast, that is no reason to speed up
+            limiter.on_success(latency)
+
+        return res
+
+    def _get_offer_body(self, resource: str, offer_id: str, label: str) -> bytes:
+        path: str = f"{self.base_url}/{resource}/{offer_id}"
 
         headers: dict = {"Authorization": f"Bearer {self.api_key}"}
 
-        res = requests.get(url=path, headers=headers)
+        res = self._send("GET", path, self.read_limiter, headers=headers)
         try:
             res.raise_for_status()
         except requests.HTTPError as e:
-            logger.exception(f"Error getting currency offer: {res.text}")
+            logger.exception(f"Error getting {label}: {res.text}")
             raise e
 
-        return OfferResponse[CurrencyOffer].model_validate(res.json())
+        return res.content
 
-    @retry_on_fail(max_retries=3, sleep_interval=2, exceptions=(requests.HTTPError,))
+    @retry_transient_errors
+    def get_currency_offer(
+        self,
+        currency_offer_id: str,
+    ) -> OfferResponse[CurrencyOffer]:
+        raw = self._get_offer_body(
+            "currency-offers", currency_offer_id, "currency offer"
+        )
+        return OfferResponse[CurrencyOffer].model_validate_json(raw)
+
+    @retry_transient_errors
+    def get_currency_offer_pricing(
+        self,
+        currency_offer_id: str,
+    ) -> PricingResponse[CurrencyOfferPricing]:
+        """Fetch an offer decoding only its price, see PricingResponse.full()."""
+        raw = self._get_offer_body(
+            "currency-offers", currency_offer_id, "currency offer"
+        )
+        return PricingResponse[CurrencyOfferPricing].decode(raw)
+
+    @retry_transient_errors
     def update_currency_offer(
         self,
         currency_offer_id: str,
@@ -55,7 +171,9 @@ class GameboostClient:
             "Content-Type": "application/json",
         }
 
-        res = requests.patch(url=path, json=payload, headers=headers)
+        res = self._send(
+            "PATCH", path, self.write_limiter, json=payload, headers=headers
+        )
         try:
             res.raise_for_status()
         except requests.HTTPError as e:
@@ -64,31 +182,29 @@ class GameboostClient:
 
         return res.json()
 
-    @retry_on_fail(max_retries=3, sleep_interval=2, exceptions=(requests.HTTPError,))
+    @retry_transient_errors
     def get_account_offer(
         self,
         account_offer_id: str,
     ) -> OfferResponse[AccountOffer]:
-        path: str = f"{self.base_url}/account-offers/{account_offer_id}"
-
-        headers: dict = {"Authorization": f"Bearer {self.api_key}"}
+        raw = self._get_offer_body("account-offers", account_offer_id, "account offer")
+        return OfferResponse[AccountOffer].model_validate_json(raw)
 
-        res = requests.get(url=path, headers=headers)
-        try:
-            res.raise_for_status()
-            # print(res.json())
-        except requests.HTTPError as e:
-            logger.exception(f"Error getting account offer: {res.text}")
-            raise e
-
-        return OfferResponse[AccountOffer].model_validate(res.json())
+    @retry_transient_errors
+    def get_account_offer_pricing(
+        self,
+        account_offer_id: str,
+    ) -> PricingResponse[AccountOfferPricing]:
+        """Fetch an offer decoding only its price, see PricingResponse.full()."""
+        raw = self._get_offer_body("account-offers", account_offer_id, "account offer")
+        return PricingResponse[AccountOfferPricing].decode(raw)
 
-    @retry_on_fail(max_retries=3, sleep_interval=2, exceptions=(requests.HTTPError,))
-    def update_account_offer(
+    def _patch_account_offer(
         self,
         account_offer_id: str,
         price: float,
-    ) -> dict:
+        **kwargs,
+    ) -> requests.Response:
         payload = {
             "price": f"{price:f}",
         }
@@ -100,7 +216,17 @@ class GameboostClient:
             "Content-Type": "application/json",
         }
 
-        res = requests.patch(url=path, json=payload, headers=headers)
+        return self._send(
+            "PATCH", path, self.write_limiter, json=payload, headers=headers, **kwargs
+        )
+
+    @retry_transient_errors
+    def update_account_offer(
+        self,
+        account_offer_id: str,
+        price: float,
+    ) -> dict:
+        res = self._patch_account_offer(account_offer_id, price)
         try:
             res.raise_for_status()
         except requests.HTTPError as e:
@@ -109,25 +235,118 @@ class GameboostClient:
 
         return res.json()
 
-    @retry_on_fail(max_retries=3, sleep_interval=2, exceptions=(requests.HTTPError,))
+    def update_account_offers(
+        self,
+        account_offer_ids: list[str],
+        price: float,
+        max_workers: int = ACCOUNT_UPDATE_MAX_WORKERS,
+        deadline: float = ACCOUNT_UPDATE_DEADLINE,
+    ) -> list[OfferUpdateResult]:
+        """PATCH the same price onto many account offers concurrently.
+
+        Every offer gets its own ``deadline`` (seconds) covering all of its
+        attempts, so one slow offer cannot hold the whole row. Failures are
+        reported per offer instead of raised.
+        """
+        if not account_offer_ids:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(account_offer_ids)),
+            thread_name_prefix="gameboost-account-update",
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda account_offer_id: self._update_account_offer_until(
+                        account_offer_id, price, deadline
+                    ),
+                    account_offer_ids,
+                )
+            )
+
+    def _update_account_offer_until(
+        self,
+        account_offer_id: str,
+        price: float,
+        deadline: float,
+    ) -> OfferUpdateResult:
+        """PATCH one account offer, retrying transient errors until ``deadline``.
+
+        The deadline is checked before every attempt, once a limiter slot is
+        acquired, and bounds each socket operation of the request. It is not
+        a hard cap on a single attempt: a server trickling its response can
+        overrun it by up to one socket timeout.
+        """
+        started = time.monotonic()
+        expires_at = started + deadline
+        attempts = 0
+        error: str | None = None
+        retryable = True
+
+        while True:
+            attempts += 1
+            try:
+                res = self._patch_account_offer(
+                    account_offer_id, price, expires_at=expires_at
+                )
+                res.raise_for_status()
+                logger.info(
+                    f"Updated account offer {account_offer_id} with price {price}\n Update response: {res.text}"
+                )
+                return OfferUpdateResult(
+                    offer_id=account_offer_id,
+                    success=True,
+                    attempts=attempts,
+                    elapsed=time.monotonic() - started,
+                )
+            except DeadlineExceeded:
+                # Never sent, the deadline passed while waiting for the limiter
+                attempts -= 1
+                error = f"deadline of {deadline:g}s exceeded"
+                break
+            except requests.RequestException as e:
+                error = str(e)
+                logger.warning(
+                    f"Error updating account offer {account_offer_id} (attempt {attempts}): {e}"
+                )
+                if not is_retryable(e):
+                    retryable = False
+                    break
+
+            if attempts >= ACCOUNT_UPDATE_MAX_ATTEMPTS:
+                break
+            if expires_at - time.monotonic() <= ACCOUNT_UPDATE_RETRY_INTERVAL:
+                error = f"deadline of {deadline:g}s exceeded ({error})"
+                break
+            time.sleep(ACCOUNT_UPDATE_RETRY_INTERVAL)
+
+        return OfferUpdateResult(
+            offer_id=account_offer_id,
+            success=False,
+            attempts=attempts,
+            elapsed=time.monotonic() - started,
+            error=error,
+            retryable=retryable,
+        )
+
+    @retry_transient_errors
     def get_item_offer(
         self,
         item_offer_id: str,
     ) -> OfferResponse[ItemOffer]:
-        path: str = f"{self.base_url}/item-offers/{item_offer_id}"
+        raw = self._get_offer_body("item-offers", item_offer_id, "item offer")
+        return OfferResponse[ItemOffer].model_validate_json(raw)
 
-        headers: dict = {"Authorization": f"Bearer {self.api_key}"}
-
-        res = requests.get(url=path, headers=headers)
-        try:
-            res.raise_for_status()
-        except requests.HTTPError as e:
-            logger.exception(f"Error getting item offer: {res.text}")
-            raise e
-
-        return OfferResponse[ItemOffer].model_validate(res.json())
+    @retry_transient_errors
+    def get_item_offer_pricing(
+        self,
+        item_offer_id: str,
+    ) -> PricingResponse[ItemOfferPricing]:
+        """Fetch an offer decoding only its price, see PricingResponse.full()."""
+        raw = self._get_offer_body("item-offers", item_offer_id, "item offer")
+        return PricingResponse[ItemOfferPricing].decode(raw)
 
-    @retry_on_fail(max_retries=3, sleep_interval=2, exceptions=(requests.HTTPError,))
+    @retry_transient_errors
     def update_item_offer(
         self,
         item_offer_id: str,
@@ -149,7 +368,9 @@ class GameboostClient:
             "Content-Type": "application/json",
         }
 
-        res = requests.patch(url=path, json=payload, headers=headers)
+        res = self._send(
+            "PATCH", path, self.write_limiter, json=payload, headers=headers
+        )
         try:
             res.raise_for_status()
         except requests.HTTPError as e:
@@ -163,7 +384,7 @@ class GameboostClient:
 
         headers: dict = {"Authorization": f"Bearer {self.api_key}"}
 
-        res = requests.get(url=path, headers=headers)
+        res = self._send("GET", path, self.read_limiter, headers=headers)
         try:
             res.raise_for_status()
         except requests.HTTPError as e:
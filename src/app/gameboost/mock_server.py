@@ -0,0 +1,236 @@
+"""Local stand-in for the GameBoost v2 API, for load tests and benchmarks.
+
+Serves ``/v2/currency-offers/{id}``, ``/v2/item-offers/{id}``,
+``/v2/account-offers/{id}`` (GET and PATCH) and ``/v2/payments/balance``
+with bodies built from the sample responses in ``samples/``. Latency, error
+rate and a server-side rate limit answering 429 + ``Retry-After`` are
+configurable.
+
+Example:
+    >>> with MockGameboostServer(latency=0.05, rate_limit=20) as server:
+    ...     client = GameboostClient(base_url=server.url, api_key="test")
+    ...     client.get_currency_offer("1")
+"""
+
+import copy
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Final
+
+from app.shared.paths import APP_PATH
+
+SAMPLES_PATH: Final = APP_PATH / "gameboost" / "samples"
+
+OFFER_PATH_RE: Final = re.compile(
+    r"^/v2/(currency-offers|item-offers|account-offers)/([^/?]+)$"
+)
+SAMPLE_FILES: Final[dict[str, str]] = {
+    "currency-offers": "currency_offer.json",
+    "item-offers": "item_offer.json",
+    "account-offers": "account_offer.json",
+}
+PRICE_FIELDS: Final[dict[str, str]] = {
+    "currency-offers": "price_eur",
+    "item-offers": "price_eur",
+    "account-offers": "price",
+}
+
+
+class MockGameboostServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.05,
+        jitter: float = 0.01,
+        error_rate: float = 0.0,
+        rate_limit: float | None = None,
+        retry_after: float = 1.0,
+        offer_errors: dict[str, int] | None = None,
+    ) -> None:
+        """
+        Args:
+            host: Interface to bind.
+            port: Port to bind, 0 picks a free one.
+            latency: Base response latency in seconds.
+            jitter: Uniform random latency added on top of ``latency``.
+            error_rate: Fraction of requests answered with a 500.
+            rate_limit: Requests per second accepted before answering 429,
+                None disables the limit.
+            retry_after: ``Retry-After`` seconds sent with 429 responses.
+            offer_errors: Status answered for given offer IDs, e.g.
+                ``{"7": 404}`` for an offer that was deleted.
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.offer_errors = dict(offer_errors or {})
+
+        self._samples = {
+            resource: json.loads((SAMPLES_PATH / file_name).read_text("utf-8"))
+            for resource, file_name in SAMPLE_FILES.items()
+        }
+        self._balance = (SAMPLES_PATH / "balance.json").read_bytes()
+        self._offers: dict[tuple[str, str], dict] = {}
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._blocked_until = 0.0
+        self.stats = {"requests": 0, "throttled": 0, "errors": 0}
+        self.requests_per_offer: dict[str, int] = {}
+
+        self._httpd = ThreadingHTTPServer((host, port), self.__handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v2"
+
+    def start(self) -> "MockGameboostServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, daemon=True, name="MockGameboostServer"
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MockGameboostServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _admit(self) -> bool:
+        """Count a request against the rate limit. False means answer 429."""
+        with self._lock:
+            self.stats["requests"] += 1
+            if self.rate_limit is None:
+                return True
+
+            now = time.monotonic()
+            if now < self._blocked_until:
+                self.stats["throttled"] += 1
+                return False
+            if now - self._window_start >= 1:
+                self._window_start = now
+                self._window_count = 0
+            self._window_count += 1
+            if self._window_count > self.rate_limit:
+                self._blocked_until = now + self.retry_after
+                self.stats["throttled"] += 1
+                return False
+            return True
+
+    def _offer(self, resource: str, offer_id: str) -> dict:
+        with self._lock:
+            key = (resource, offer_id)
+            if key not in self._offers:
+                offer = copy.deepcopy(self._samples[resource])
+                offer["data"]["id"] = int(offer_id) if offer_id.isdigit() else 0
+                self._offers[key] = offer
+            return self._offers[key]
+
+    def _patch(self, resource: str, offer_id: str, payload: dict) -> dict:
+        offer = self._offer(resource, offer_id)
+        with self._lock:
+            data = offer["data"]
+            if "price" in payload:
+                data[PRICE_FIELDS[resource]]["amount"] = float(payload["price"])
+            for field in ("stock", "min_quantity"):
+                if field in payload:
+                    data[field] = payload[field]
+            data["updated_at"] = int(time.time())
+            return {
+                "message": "Offer updated successfully.",
+                "data": {"id": data["id"]},
+            }
+
+    def __handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+            def _reply(
+                self, status: int, body: bytes, headers: dict | None = None
+            ) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _handle(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw_body = self.rfile.read(length) if length else b""
+
+                time.sleep(server.latency + random.uniform(0, server.jitter))
+
+                if not self.headers.get("Authorization", "").startswith("Bearer "):
+                    self._reply(401, b'{"message": "Unauthenticated."}')
+                    return
+
+                if not server._admit():
+                    self._reply(
+                        429,
+                        b'{"message": "Too Many Attempts."}',
+                        {"Retry-After": f"{server.retry_after:g}"},
+                    )
+                    return
+
+                if random.random() < server.error_rate:
+                    with server._lock:
+                        server.stats["errors"] += 1
+                    self._reply(500, b'{"message": "Server Error"}')
+                    return
+
+                if method == "GET" and self.path == "/v2/payments/balance":
+                    self._reply(200, server._balance)
+                    return
+
+                match = OFFER_PATH_RE.match(self.path)
+                if match is None:
+                    self._reply(404, b'{"message": "Not Found"}')
+                    return
+
+                resource, offer_id = match.groups()
+                with server._lock:
+                    server.requests_per_offer[offer_id] = (
+                        server.requests_per_offer.get(offer_id, 0) + 1
+                    )
+                status = server.offer_errors.get(offer_id)
+                if status is not None:
+                    self._reply(status, b'{"message": "Offer error"}')
+                    return
+
+                if method == "GET":
+                    body = server._offer(resource, offer_id)
+                else:
+                    body = server._patch(
+                        resource, offer_id, json.loads(raw_body or b"{}")
+                    )
+                self._reply(200, json.dumps(body).encode())
+
+            def do_GET(self) -> None:
+                self._handle("GET")
+
+            def do_PATCH(self) -> None:
+                self._handle("PATCH")
+
+        return Handler
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import TypeVar, Generic
+from pydantic import BaseModel, PrivateAttr
+from typing import ClassVar, Generic, Self, TypeVar
 from typing import List
 
 T = TypeVar("T", bound=BaseModel)
@@ -127,3 +127,83 @@ class ItemOffer(BaseModel):
     created_at: int
     updated_at: int
     # listed_at: int
+
+
+# Pricing views: only the fields the pricing path reads. The rest of the body
+# (descriptions, parameters, image URLs, dumps) is skipped while validating
+# and never turned into Python objects.
+
+
+class PriceAmount(BaseModel):
+    amount: float
+
+
+class CurrencyOfferPricing(BaseModel):
+    full_model: ClassVar[type[BaseModel]] = CurrencyOffer
+
+    id: int
+    price_eur: PriceAmount
+
+
+class AccountOfferPricing(BaseModel):
+    full_model: ClassVar[type[BaseModel]] = AccountOffer
+
+    id: int
+    price: PriceAmount
+
+
+class ItemOfferPricing(BaseModel):
+    full_model: ClassVar[type[BaseModel]] = ItemOffer
+
+    id: int
+    price_eur: PriceAmount
+
+
+P = TypeVar("P", CurrencyOfferPricing, AccountOfferPricing, ItemOfferPricing)
+
+
+class PricingResponse(BaseModel, Generic[P]):
+    """An offer response decoded into its pricing view.
+
+    The response body is kept, so the full offer can still be validated
+    from it with full() when a caller needs more than the price.
+    """
+
+    data: P
+    _raw: bytes = PrivateAttr(default=b"")
+
+    @classmethod
+    def decode(cls, raw: bytes) -> Self:
+        response = cls.model_validate_json(raw)
+        response._raw = raw
+        return response
+
+    def full(self) -> OfferResponse:
+        """Validate the full offer model from the same response body."""
+        return OfferResponse[self.data.full_model].model_validate_json(self._raw)
+
+
+class OfferUpdateResult(BaseModel):
+    offer_id: str
+    success: bool
+    attempts: int
+    elapsed: float
+    error: str | None = None
+    # False when sending it again would fail the same way, e.g. a 404
+    retryable: bool = True
+
+
+class OfferUpdateIntent(BaseModel):
+    offer_type: str
+    offer_id: str
+    price: float
+    stock: int | None = None
+    min_quantity: int | None = None
+    created_at: float
+    attempts: int = 0
+    last_error: str | None = None
+    next_attempt_at: float = 0
+
+    @property
+    def key(self) -> str:
+        return f"{self.offer_type}:{self.offer_id}"
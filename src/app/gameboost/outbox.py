@@ -0,0 +1,373 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Final
+
+from app.shared.enums import OfferType
+from app.shared.paths import SRC_PATH
+
+from . import logger
+from .api import GameboostClient, gameboost_api_client, is_retryable
+from .models import OfferUpdateIntent, OfferUpdateResult
+
+OUTBOX_PATH: Final[Path] = SRC_PATH / "data" / "price_update_outbox.jsonl"
+
+# Time the caller has to apply a freshly submitted intent before the writer takes over
+SUBMIT_GRACE_SECONDS: Final[float] = 120.0
+WRITER_INTERVAL_SECONDS: Final[float] = 5.0
+MAX_BACKOFF_SECONDS: Final[float] = 300.0
+# About 8 minutes of retries, by then a newer price has usually replaced it
+MAX_ATTEMPTS: Final[int] = 8
+# Failed intents kept for inspection, oldest dropped first
+DEAD_LETTER_LIMIT: Final[int] = 100
+
+
+class PriceUpdateOutbox:
+    """File-backed outbox of pending offer updates, one entry per offer.
+
+    Every price decision is persisted before it is sent to GameBoost and
+    removed once the API accepted it. A newer intent for the same offer
+    replaces the pending one, so only the latest price is ever sent. A
+    background writer retries whatever is left with exponential backoff and
+    replays the file on startup.
+
+    Intents rejected with a non-retryable error (e.g. 404 or 422), or still
+    failing after ``MAX_ATTEMPTS``, are moved to ``dead_letters`` instead.
+
+    The file is a JSON-lines log: every change appends one record for its
+    offer, so recording an intent costs the same however many are pending.
+    Replaying the log in order gives the current state, and :meth:`drain`
+    rewrites it down to one record per live entry once superseded records
+    pile up.
+    """
+
+    def __init__(
+        self,
+        path: Path = OUTBOX_PATH,
+        client: GameboostClient = gameboost_api_client,
+    ) -> None:
+        self.path = path
+        self.client = client
+        self._pending: dict[str, OfferUpdateIntent] = {}
+        self._dead_letters: list[OfferUpdateIntent] = []
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._writer: threading.Thread | None = None
+        # Records in the log, compacted once they outnumber the live entries
+        self._log_records = 0
+
+        self.__load()
+
+    def __load(self) -> None:
+        if not self.path.exists():
+            return
+
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            logger.exception(f"Could not read outbox {self.path}, starting empty")
+            return
+
+        for line in lines:
+            try:
+                self.__replay(json.loads(line))
+            except (ValueError, KeyError):
+                # Most likely the tail of a write cut short by a crash
+                logger.warning(f"Skipping unreadable outbox record: {line[:200]}")
+            self._log_records += 1
+
+        del self._dead_letters[:-DEAD_LETTER_LIMIT]
+        for intent in self._pending.values():
+            # Anything left over from a previous run is due right away
+            intent.next_attempt_at = 0
+
+        if self._pending:
+            logger.info(f"Replaying {len(self._pending)} pending offer update(s)")
+
+    def __replay(self, record: dict) -> None:
+        key = record["key"]
+        if "dead" in record:
+            self._pending.pop(key, None)
+            self._dead_letters.append(OfferUpdateIntent.model_validate(record["dead"]))
+        elif record["intent"] is None:
+            self._pending.pop(key, None)
+        else:
+            self._pending[key] = OfferUpdateIntent.model_validate(record["intent"])
+
+    @staticmethod
+    def __pending_record(intent: OfferUpdateIntent) -> dict:
+        return {"key": intent.key, "intent": intent.model_dump()}
+
+    @staticmethod
+    def __removed_record(intent: OfferUpdateIntent) -> dict:
+        return {"key": intent.key, "intent": None}
+
+    @staticmethod
+    def __dead_record(intent: OfferUpdateIntent) -> dict:
+        return {"key": intent.key, "dead": intent.model_dump()}
+
+    def __append(self, records: list[dict]) -> None:
+        """Durably append records to the log. Must be called with ``_lock`` held."""
+        if not records:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.writelines(json.dumps(record) + "\n" for record in records)
+            f.flush()
+            os.fsync(f.fileno())
+        self._log_records += len(records)
+
+    def __compact(self) -> None:
+        """Atomically rewrite the log with one record per live entry.
+
+        Must be called with ``_lock`` held.
+        """
+        records = [self.__pending_record(intent) for intent in self._pending.values()]
+        records += [self.__dead_record(intent) for intent in self._dead_letters]
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            f.writelines(json.dumps(record) + "\n" for record in records)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._log_records = len(records)
+
+    def __key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def dead_letters(self) -> list[OfferUpdateIntent]:
+        """Intents given up on, oldest first."""
+        with self._lock:
+            return list(self._dead_letters)
+
+    def put(self, *intents: OfferUpdateIntent) -> None:
+        """Record intents durably, replacing older ones for the same offers."""
+        with self._lock:
+            for intent in intents:
+                intent.next_attempt_at = time.time() + SUBMIT_GRACE_SECONDS
+                replaced = self._pending.get(intent.key)
+                if replaced is not None:
+                    logger.info(
+                        f"Coalescing update for {intent.key}: {replaced.price} -> {intent.price}"
+                    )
+                self._pending[intent.key] = intent
+            self.__append([self.__pending_record(intent) for intent in intents])
+
+    def __remove(self, intent: OfferUpdateIntent) -> dict | None:
+        """Drop an intent unless a newer one replaced it. Must be called with ``_lock`` held.
+
+        Returns:
+            dict | None: The log record of the change, None if nothing changed.
+        """
+        if self._pending.get(intent.key) is not intent:
+            return None
+        del self._pending[intent.key]
+        return self.__removed_record(intent)
+
+    def __fail(
+        self, intent: OfferUpdateIntent, error: str | None, retryable: bool
+    ) -> dict | None:
+        """Schedule a retry or give up on an intent. Must be called with ``_lock`` held.
+
+        Returns:
+            dict | None: The log record of the change, None if nothing changed.
+        """
+        if self._pending.get(intent.key) is not intent:
+            # Replaced by a newer intent meanwhile, which is sent instead
+            return None
+
+        intent.attempts += 1
+        intent.last_error = error
+        if retryable and intent.attempts < MAX_ATTEMPTS:
+            intent.next_attempt_at = time.time() + min(
+                MAX_BACKOFF_SECONDS, 2**intent.attempts
+            )
+            return self.__pending_record(intent)
+
+        logger.error(
+            f"Giving up on offer update {intent.key} after {intent.attempts} attempt(s): {error}"
+        )
+        del self._pending[intent.key]
+        self._dead_letters.append(intent)
+        del self._dead_letters[:-DEAD_LETTER_LIMIT]
+        return self.__dead_record(intent)
+
+    def ack(self, *intents: OfferUpdateIntent) -> None:
+        """Drop intents the API accepted, unless a newer one replaced them meanwhile."""
+        with self._lock:
+            removed = [self.__remove(intent) for intent in intents]
+            self.__append([record for record in removed if record is not None])
+
+    def fail(
+        self, intent: OfferUpdateIntent, error: str | None, retryable: bool = True
+    ) -> None:
+        with self._lock:
+            record = self.__fail(intent, error, retryable)
+            if record is not None:
+                self.__append([record])
+        self._wakeup.set()
+
+    def submit(self, intent: OfferUpdateIntent) -> dict:
+        """Persist an intent and apply it right away.
+
+        On failure the intent stays in the outbox for the writer to retry and
+        the error is re-raised to the caller.
+        """
+        self.put(intent)
+
+        with self.__key_lock(intent.key):
+            current = self._pending.get(intent.key)
+            if current is None:
+                # The writer already sent it
+                return {}
+            try:
+                res = self.__apply(current)
+            except Exception as e:
+                self.fail(current, str(e), retryable=is_retryable(e))
+                raise
+            self.ack(current)
+            return res
+
+    def record_results(
+        self,
+        intents: list[OfferUpdateIntent],
+        results: list[OfferUpdateResult],
+    ) -> None:
+        """Ack or fail intents that were sent in bulk outside :meth:`submit`."""
+        by_offer_id = {result.offer_id: result for result in results}
+        failed = False
+        with self._lock:
+            records = []
+            for intent in intents:
+                result = by_offer_id.get(intent.offer_id)
+                if result is None:
+                    failed = True
+                    record = self.__fail(intent, None, retryable=True)
+                elif result.success:
+                    record = self.__remove(intent)
+                else:
+                    failed = True
+                    record = self.__fail(intent, result.error, result.retryable)
+                if record is not None:
+                    records.append(record)
+            # One write for the whole batch
+            self.__append(records)
+        if failed:
+            self._wakeup.set()
+
+    def __apply(self, intent: OfferUpdateIntent) -> dict:
+        if intent.offer_type == OfferType.Currency.value:
+            return self.client.update_currency_offer(
+                currency_offer_id=intent.offer_id,
+                price=intent.price,
+                stock=intent.stock,
+                min_quantity=intent.min_quantity,
+            )
+        elif intent.offer_type == OfferType.Item.value:
+            return self.client.update_item_offer(
+                item_offer_id=intent.offer_id,
+                price=intent.price,
+                stock=intent.stock,
+                min_quantity=intent.min_quantity,
+            )
+        elif intent.offer_type == OfferType.Account.value:
+            return self.client.update_account_offer(
+                account_offer_id=intent.offer_id,
+                price=intent.price,
+            )
+
+        raise ValueError(f"Unknown offer type: {intent.offer_type}")
+
+    def drain(self) -> int:
+        """Send every due intent once, then compact the log.
+
+        Returns:
+            int: The number of intents applied.
+        """
+        now = time.time()
+        with self._lock:
+            due = [
+                intent
+                for intent in self._pending.values()
+                if intent.next_attempt_at <= now
+            ]
+
+        applied = 0
+        for intent in due:
+            key_lock = self.__key_lock(intent.key)
+            if not key_lock.acquire(blocking=False):
+                continue
+            try:
+                if self._pending.get(intent.key) is not intent:
+                    continue
+                try:
+                    res = self.__apply(intent)
+                except Exception as e:
+                    logger.warning(
+                        f"Outbox update {intent.key} failed (attempt {intent.attempts + 1}): {e}"
+                    )
+                    self.fail(intent, str(e), retryable=is_retryable(e))
+                    continue
+                self.ack(intent)
+                applied += 1
+                logger.info(f"Outbox applied {intent.key} price={intent.price}: {res}")
+            finally:
+                key_lock.release()
+
+        with self._lock:
+            if self._log_records > len(self._pending) + len(self._dead_letters):
+                self.__compact()
+
+        return applied
+
+    def __run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self.drain()
+            except Exception:
+                logger.exception("Outbox writer failed to drain")
+            self._wakeup.wait(timeout=WRITER_INTERVAL_SECONDS)
+            self._wakeup.clear()
+
+    def start(self) -> None:
+        """Start the background writer, replaying leftovers immediately."""
+        if self._writer is not None and self._writer.is_alive():
+            return
+
+        self._stopped.clear()
+        self._writer = threading.Thread(
+            target=self.__run, daemon=True, name="PriceUpdateOutbox"
+        )
+        self._writer.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stopped.set()
+        self._wakeup.set()
+        if self._writer is not None:
+            self._writer.join(timeout=timeout)
+
+
+_price_update_outbox: PriceUpdateOutbox | None = None
+_price_update_outbox_lock = threading.Lock()
+
+
+def get_price_update_outbox() -> PriceUpdateOutbox:
+    """Return the shared outbox, reading ``OUTBOX_PATH`` on first use."""
+    global _price_update_outbox
+
+    with _price_update_outbox_lock:
+        if _price_update_outbox is None:
+            _price_update_outbox = PriceUpdateOutbox()
+        return _price_update_outbox
@@ -0,0 +1,173 @@
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterator
+
+from . import logger
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at ``rate`` tokens/s."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    def set_rate(self, rate: float) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class AdaptiveLimiter:
+    """Token bucket plus an AIMD concurrency window shared by all threads.
+
+    Every request takes a token from the bucket and a slot from the
+    concurrency window. Successful, fast responses grow the window and the
+    bucket rate additively; a 429 (or a response slower than
+    ``latency_target``) shrinks them multiplicatively. A ``Retry-After``
+    blocks every caller until it expires, so threads stop piling requests
+    onto an endpoint that already asked us to back off.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        burst: float,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        min_rate: float = 0.2,
+        rate_step: float = 0.05,
+        decrease_factor: float = 0.5,
+        latency_target: float = 5.0,
+        default_penalty: float = 2.0,
+    ) -> None:
+        self.name = name
+        self.max_rate = rate
+        self.min_rate = min_rate
+        self.rate_step = rate_step
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.decrease_factor = decrease_factor
+        self.latency_target = latency_target
+        self.default_penalty = default_penalty
+
+        self._bucket = TokenBucket(rate=rate, capacity=burst)
+        self._limit: float = float(max_concurrency)
+        self._in_flight = 0
+        self._blocked_until = 0.0
+        self._last_decrease = float("-inf")
+        self._cond = threading.Condition()
+
+    @property
+    def concurrency_limit(self) -> int:
+        return max(self.min_concurrency, int(self._limit))
+
+    @property
+    def rate(self) -> float:
+        return self._bucket.rate
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        with self._cond:
+            while True:
+                wait = self._blocked_until - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(timeout=wait)
+                    continue
+                if self._in_flight < self.concurrency_limit:
+                    break
+                self._cond.wait()
+            self._in_flight += 1
+
+        try:
+            self._bucket.acquire()
+            yield
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def on_success(self, latency: float) -> None:
+        if latency > self.latency_target:
+            self._decrease(f"slow response ({latency:.2f}s)")
+            return
+
+        with self._cond:
+            # Additive increase: roughly one extra slot per full window of successes
+            self._limit = min(
+                float(self.max_concurrency), self._limit + 1 / max(self._limit, 1)
+            )
+            self._cond.notify_all()
+        self._bucket.set_rate(min(self.max_rate, self._bucket.rate + self.rate_step))
+
+    def on_throttle(self, retry_after: float | None) -> None:
+        penalty = retry_after if retry_after is not None else self.default_penalty
+        with self._cond:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + penalty)
+        logger.warning(
+            f"[{self.name}] Rate limited, pausing requests for {penalty:.2f}s"
+        )
+        self._decrease("429 Too Many Requests", window=penalty)
+
+    def _decrease(self, reason: str, window: float = 1.0) -> None:
+        with self._cond:
+            now = time.monotonic()
+            # Responses already in flight report the same congestion, only react once
+            if now - self._last_decrease < window:
+                return
+            self._last_decrease = now
+            self._limit = max(
+                float(self.min_concurrency), self._limit * self.decrease_factor
+            )
+        self._bucket.set_rate(
+            max(self.min_rate, self._bucket.rate * self.decrease_factor)
+        )
+        logger.info(
+            f"[{self.name}] {reason}: concurrency={self.concurrency_limit}, rate={self.rate:.2f}/s"
+        )
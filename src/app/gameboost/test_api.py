@@ -0,0 +1,152 @@
+import pytest
+import requests
+from tenacity import wait_none
+
+from . import api as api_module
+from .api import ACCOUNT_UPDATE_MAX_ATTEMPTS, GameboostClient
+from .mock_server import MockGameboostServer
+
+
+class RecordingLimiter:
+    """Stands in for an AdaptiveLimiter, recording the feedback it gets."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, float | None]] = []
+
+    def slot(self):
+        return _NoSlot()
+
+    def on_success(self, latency: float) -> None:
+        self.events.append(("success", None))
+
+    def on_throttle(self, retry_after: float | None) -> None:
+        self.events.append(("throttle", retry_after))
+
+
+class _NoSlot:
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+class FakeTransport:
+    """Answers every request the client sends with the same status."""
+
+    def __init__(self) -> None:
+        self.status = 200
+        self.headers: dict[str, str] = {}
+        self.sent: list[str] = []
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        self.sent.append(url)
+        res = requests.Response()
+        res.status_code = self.status
+        res.headers.update(self.headers)
+        res._content = b"{}"
+        return res
+
+
+@pytest.fixture
+def transport(monkeypatch) -> FakeTransport:
+    transport = FakeTransport()
+    monkeypatch.setattr(api_module.requests, "request", transport.request)
+    return transport
+
+
+@pytest.mark.parametrize(
+    ("status", "headers", "expected"),
+    [
+        (200, {}, [("success", None)]),
+        (404, {}, [("success", None)]),
+        (429, {"Retry-After": "3"}, [("throttle", 3.0)]),
+        (429, {}, [("throttle", None)]),
+        (503, {"Retry-After": "1"}, [("throttle", 1.0)]),
+        (503, {}, []),
+        (500, {}, []),
+        (502, {}, []),
+        (504, {}, []),
+    ],
+)
+def test_send_classifies_responses_for_the_limiter(
+    transport, status, headers, expected
+):
+    transport.status, transport.headers = status, headers
+    limiter = RecordingLimiter()
+
+    GameboostClient(base_url="http://gameboost", api_key="test")._send(
+        "GET", "http://gameboost/x", limiter
+    )
+
+    assert limiter.events == expected
+
+
+@pytest.mark.parametrize(("status", "sent"), [(404, 1), (422, 1), (500, 4), (429, 4)])
+def test_single_offer_calls_retry_only_transient_errors(transport, status, sent):
+    # Retry-After: 0 keeps the limiter from pausing between the 429s
+    transport.status, transport.headers = status, {"Retry-After": "0"}
+    client = GameboostClient(base_url="http://gameboost", api_key="test")
+    get_offer = GameboostClient.get_currency_offer.retry_with(wait=wait_none())
+
+    with pytest.raises(requests.HTTPError):
+        get_offer(client, "1")
+
+    assert len(transport.sent) == sent
+
+
+@pytest.fixture
+def gameboost_server():
+    with MockGameboostServer(latency=0.0, jitter=0.0) as server:
+        yield server
+
+
+@pytest.fixture
+def client(gameboost_server, monkeypatch) -> GameboostClient:
+    monkeypatch.setattr(api_module, "ACCOUNT_UPDATE_RETRY_INTERVAL", 0.01)
+    return GameboostClient(base_url=gameboost_server.url, api_key="test")
+
+
+def test_account_fan_out_reports_each_offer(gameboost_server, client):
+    gameboost_server.offer_errors = {"2": 404, "3": 503}
+
+    results = client.update_account_offers(["1", "2", "3"], price=9.5)
+
+    assert [result.offer_id for result in results] == ["1", "2", "3"]
+    assert [result.success for result in results] == [True, False, False]
+    # The 404 fails for good, the 503 is retried up to the attempt limit
+    assert (results[1].attempts, results[1].retryable) == (1, False)
+    assert (results[2].attempts, results[2].retryable) == (
+        ACCOUNT_UPDATE_MAX_ATTEMPTS,
+        True,
+    )
+    assert gameboost_server.requests_per_offer == {
+        "1": 1,
+        "2": 1,
+        "3": ACCOUNT_UPDATE_MAX_ATTEMPTS,
+    }
+    offer = client.get_account_offer("1")
+    assert offer.data.price.amount == 9.5
+
+
+def test_account_fan_out_deadline_expires_waiting_for_the_limiter(
+    gameboost_server, client
+):
+    # A 429 seen by another row pauses every write for half a second
+    client.write_limiter.on_throttle(retry_after=0.5)
+
+    (result,) = client.update_account_offers(["1"], price=9.5, deadline=0.1)
+
+    assert not result.success
+    assert result.attempts == 0
+    assert "deadline" in result.error
+    assert gameboost_server.requests_per_offer == {}
+
+
+def test_pricing_call_reads_the_price_of_an_offer(client):
+    client.update_currency_offer("5", price=3.25, stock=10)
+
+    offer = client.get_currency_offer_pricing("5")
+
+    assert offer.data.price_eur.amount == 3.25
+    assert offer.full().data.stock == 10
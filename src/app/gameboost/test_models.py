@@ -0,0 +1,55 @@
+import json
+
+import pydantic
+import pytest
+
+from app.shared.paths import APP_PATH
+
+from .models import (
+    AccountOffer,
+    AccountOfferPricing,
+    CurrencyOffer,
+    CurrencyOfferPricing,
+    ItemOffer,
+    ItemOfferPricing,
+    OfferResponse,
+    PricingResponse,
+)
+
+SAMPLES_PATH = APP_PATH / "gameboost" / "samples"
+
+CASES = [
+    ("currency_offer.json", CurrencyOffer, CurrencyOfferPricing, "price_eur"),
+    ("item_offer.json", ItemOffer, ItemOfferPricing, "price_eur"),
+    ("account_offer.json", AccountOffer, AccountOfferPricing, "price"),
+]
+
+
+@pytest.mark.parametrize(("file_name", "model", "pricing", "price_field"), CASES)
+def test_pricing_view_matches_the_full_model(file_name, model, pricing, price_field):
+    raw = (SAMPLES_PATH / file_name).read_bytes()
+
+    lean = PricingResponse[pricing].decode(raw)
+    full = OfferResponse[model].model_validate_json(raw)
+
+    assert lean.data.id == full.data.id
+    assert getattr(lean.data, price_field).amount == (
+        getattr(full.data, price_field).amount
+    )
+    assert lean.full() == full
+
+
+@pytest.mark.parametrize(("file_name", "model", "pricing", "price_field"), CASES)
+def test_pricing_view_skips_fields_it_does_not_read(
+    file_name, model, pricing, price_field
+):
+    body = json.loads((SAMPLES_PATH / file_name).read_bytes())
+    body["data"]["title"] = None
+    raw = json.dumps(body).encode()
+
+    lean = PricingResponse[pricing].decode(raw)
+
+    assert getattr(lean.data, price_field).amount > 0
+    # The full model is only validated, and fails, on demand
+    with pytest.raises(pydantic.ValidationError):
+        lean.full()
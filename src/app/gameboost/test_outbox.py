@@ -0,0 +1,222 @@
+import json
+import time
+
+import pytest
+import requests
+
+from app.shared.enums import OfferType
+
+from . import outbox as outbox_module
+from .models import OfferUpdateIntent, OfferUpdateResult
+from .outbox import MAX_ATTEMPTS, PriceUpdateOutbox
+
+
+def http_error(status: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"{status} error", response=response)
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.errors: list[Exception] = []
+        self.sent: list[tuple[str, float]] = []
+
+    def update_currency_offer(self, currency_offer_id, price, stock, min_quantity):
+        if self.errors:
+            raise self.errors.pop(0)
+        self.sent.append((currency_offer_id, price))
+        return {"id": currency_offer_id}
+
+
+def intent(offer_id: str = "1", price: float = 1.0) -> OfferUpdateIntent:
+    return OfferUpdateIntent(
+        offer_type=OfferType.Currency.value,
+        offer_id=offer_id,
+        price=price,
+        stock=10,
+        created_at=time.time(),
+    )
+
+
+def key(offer_id: str = "1") -> str:
+    return f"{OfferType.Currency.value}:{offer_id}"
+
+
+def make_due(outbox: PriceUpdateOutbox) -> None:
+    for pending in outbox._pending.values():
+        pending.next_attempt_at = 0
+
+
+def records(outbox: PriceUpdateOutbox) -> list[dict]:
+    lines = outbox.path.read_text(encoding="utf-8").splitlines()
+    return [json.loads(line) for line in lines]
+
+
+def saved(outbox: PriceUpdateOutbox) -> dict:
+    """The state a restart would replay from the log."""
+    pending, dead_letters = {}, []
+    for record in records(outbox):
+        if "dead" in record:
+            pending.pop(record["key"], None)
+            dead_letters.append(record["dead"])
+        elif record["intent"] is None:
+            pending.pop(record["key"], None)
+        else:
+            pending[record["key"]] = record["intent"]
+    return {"pending": pending, "dead_letters": dead_letters}
+
+
+@pytest.fixture
+def client() -> FakeClient:
+    return FakeClient()
+
+
+@pytest.fixture
+def outbox(tmp_path, client) -> PriceUpdateOutbox:
+    return PriceUpdateOutbox(path=tmp_path / "outbox.jsonl", client=client)
+
+
+@pytest.fixture
+def fsyncs(monkeypatch) -> list[int]:
+    calls = []
+    monkeypatch.setattr(outbox_module.os, "fsync", calls.append)
+    return calls
+
+
+def test_put_coalesces_intents_for_the_same_offer(outbox):
+    outbox.put(intent(price=1.0))
+    outbox.put(intent(price=2.0), intent(offer_id="2"))
+
+    assert len(outbox) == 2
+    assert saved(outbox)["pending"][key("1")]["price"] == 2.0
+
+
+def test_submit_sends_and_removes_the_intent(outbox, client):
+    outbox.submit(intent(price=3.0))
+
+    assert client.sent == [("1", 3.0)]
+    assert len(outbox) == 0
+    assert saved(outbox)["pending"] == {}
+
+
+def test_transient_failure_is_retried_by_drain(outbox, client):
+    client.errors = [http_error(503)]
+    with pytest.raises(requests.HTTPError):
+        outbox.submit(intent())
+
+    assert outbox._pending[key("1")].attempts == 1
+    assert outbox.drain() == 0  # backing off
+
+    make_due(outbox)
+    assert outbox.drain() == 1
+    assert client.sent == [("1", 1.0)]
+    assert len(outbox) == 0
+
+
+@pytest.mark.parametrize("status", [400, 404, 422])
+def test_non_retryable_failure_is_dead_lettered(outbox, client, status):
+    client.errors = [http_error(status)]
+    with pytest.raises(requests.HTTPError):
+        outbox.submit(intent())
+
+    assert len(outbox) == 0
+    assert [dead.key for dead in outbox.dead_letters] == [key("1")]
+    assert saved(outbox)["dead_letters"][0]["attempts"] == 1
+
+
+def test_gives_up_after_max_attempts(outbox, client):
+    client.errors = [requests.ConnectionError("down")] * MAX_ATTEMPTS
+    outbox.put(intent())
+
+    for _ in range(MAX_ATTEMPTS):
+        make_due(outbox)
+        outbox.drain()
+
+    assert len(outbox) == 0
+    assert outbox.dead_letters[0].attempts == MAX_ATTEMPTS
+    assert client.sent == []
+
+
+def test_failure_of_a_replaced_intent_is_ignored(outbox):
+    old = intent(price=1.0)
+    outbox.put(old)
+    outbox.put(intent(price=2.0))
+
+    outbox.fail(old, "late failure")
+
+    assert outbox._pending[key("1")].attempts == 0
+
+
+def test_record_results_persists_once(outbox, fsyncs):
+    intents = [intent(offer_id=str(i)) for i in range(5)]
+    outbox.put(*intents)
+    fsyncs.clear()
+
+    outbox.record_results(
+        intents,
+        [
+            OfferUpdateResult(offer_id="0", success=True, attempts=1, elapsed=0),
+            OfferUpdateResult(offer_id="1", success=False, attempts=1, elapsed=0),
+            OfferUpdateResult(
+                offer_id="2", success=False, attempts=1, elapsed=0, retryable=False
+            ),
+        ],
+    )
+
+    assert len(fsyncs) == 1
+    assert sorted(outbox._pending) == [key("1"), key("3"), key("4")]
+    assert [dead.key for dead in outbox.dead_letters] == [key("2")]
+
+
+def test_ack_without_removal_does_not_persist(outbox, fsyncs):
+    outbox.put(intent(price=1.0))
+    fsyncs.clear()
+
+    outbox.ack(intent(price=1.0))  # an equal but different intent
+
+    assert fsyncs == []
+    assert len(outbox) == 1
+
+
+def test_pending_intents_are_replayed_on_startup(outbox, tmp_path, client):
+    outbox.put(intent(price=5.0))
+
+    replayed = PriceUpdateOutbox(path=outbox.path, client=client)
+
+    assert replayed.drain() == 1
+    assert client.sent == [("1", 5.0)]
+
+
+def test_put_appends_instead_of_rewriting(outbox):
+    for price in range(1, 4):
+        outbox.put(intent(price=float(price)))
+
+    assert [record["intent"]["price"] for record in records(outbox)] == [1.0, 2.0, 3.0]
+
+
+def test_drain_compacts_the_log(outbox, client):
+    outbox.put(intent(price=1.0))
+    outbox.put(intent(price=2.0), intent(offer_id="2"))
+    outbox.submit(intent(offer_id="3"))
+    assert len(records(outbox)) == 5
+
+    outbox.drain()  # nothing due yet
+
+    assert [
+        (record["key"], record["intent"]["price"]) for record in records(outbox)
+    ] == [
+        (key("1"), 2.0),
+        (key("2"), 1.0),
+    ]
+
+
+def test_unreadable_tail_is_skipped_on_startup(outbox, client):
+    outbox.put(intent(price=5.0))
+    with outbox.path.open("a", encoding="utf-8") as f:
+        f.write('{"key": "Curr')
+
+    replayed = PriceUpdateOutbox(path=outbox.path, client=client)
+
+    assert replayed.drain() == 1
+    assert client.sent == [("1", 5.0)]
@@ -0,0 +1,116 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from . import rate_limiter
+from .rate_limiter import AdaptiveLimiter, TokenBucket, parse_retry_after
+
+
+class FakeTime:
+    """A monotonic clock that only moves when the code under test sleeps."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeTime:
+    clock = FakeTime()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    return clock
+
+
+def test_bucket_spends_its_burst_then_waits_for_refill(clock):
+    bucket = TokenBucket(rate=2.0, capacity=2)
+
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == []
+
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_bucket_refill_is_capped_at_capacity(clock):
+    bucket = TokenBucket(rate=1.0, capacity=2)
+    bucket.acquire()
+    bucket.acquire()
+
+    clock.now += 60
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == []
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+def limiter(**kwargs) -> AdaptiveLimiter:
+    return AdaptiveLimiter(
+        name="test", rate=4.0, burst=4, max_concurrency=8, **kwargs
+    )
+
+
+def test_throttle_halves_concurrency_and_rate_once_per_window(clock):
+    adaptive = limiter()
+
+    adaptive.on_throttle(retry_after=3)
+    assert (adaptive.concurrency_limit, adaptive.rate) == (4, 2.0)
+
+    # Other responses of the same burst report the same congestion
+    clock.now += 1
+    adaptive.on_throttle(retry_after=3)
+    assert (adaptive.concurrency_limit, adaptive.rate) == (4, 2.0)
+
+    clock.now += 3
+    adaptive.on_throttle(retry_after=3)
+    assert (adaptive.concurrency_limit, adaptive.rate) == (2, 1.0)
+
+
+def test_slow_response_decreases_like_a_throttle(clock):
+    adaptive = limiter(latency_target=1.0)
+
+    adaptive.on_success(latency=2.0)
+
+    assert (adaptive.concurrency_limit, adaptive.rate) == (4, 2.0)
+
+
+def test_success_increases_additively_up_to_the_limits(clock):
+    adaptive = limiter(rate_step=0.5)
+    adaptive.on_throttle(retry_after=None)
+
+    # About one slot per window of successes
+    for _ in range(4):
+        adaptive.on_success(latency=0.1)
+    assert adaptive.concurrency_limit == 4
+    adaptive.on_success(latency=0.1)
+    assert adaptive.concurrency_limit == 5
+
+    for _ in range(50):
+        adaptive.on_success(latency=0.1)
+    assert (adaptive.concurrency_limit, adaptive.rate) == (8, 4.0)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(None, None), ("", None), ("3", 3.0), (" 1.5 ", 1.5), ("-2", 0.0), ("soon", None)],
+)
+def test_parse_retry_after_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == pytest.approx(
+        30, abs=2
+    )
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
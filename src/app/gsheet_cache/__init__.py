@@ -6,15 +6,20 @@ automatic key rotation and rate limit handling.
 Features:
     - Local CSV caching for fast read operations
     - Batch write operations to minimize API calls
-    - Random service account key selection
-    - Automatic key rotation on rate limits
-    - Exponential backoff retry logic
+    - Requests balanced over service account keys by per-minute quota
+    - Rate limited keys cool down and return to the pool automatically
     - Support for multiple sheets and spreadsheets
 
 Main Classes:
     CacheSheet: Core class for caching a single Google Sheet.
     GSheetCacheManager: Manager for multiple cached sheets.
     GSheetCacheConfig: Configuration for cache and keys directories.
+    RefreshPolicy: How often a cached sheet is refreshed.
+    ColumnView: Lazy view over one column of a cached sheet.
+    DirtyRows: Rows of a sheet to reprocess after reloads.
+    RowDiff: Rows that differ between two loads of a sheet.
+    RevisionSource: Interface of spreadsheet change marker providers.
+    KeyPool: Quota-aware pool of service account keys.
 
 Quick Start:
     >>> from pathlib import Path
@@ -41,9 +46,25 @@ Quick Start:
 For more information, see the README.md file or the individual module documentation.
 """
 
-from .config import GSheetCacheConfig
+from .changes import DirtyRows
+from .config import GSheetCacheConfig, RefreshPolicy
+from .keys import KeyPool
 from .manager import GSheetCacheManager
+from .revisions import DriveRevisionSource, RevisionSource
+from .schemas import RowDiff
 from .sheet import CacheSheet
+from .views import ColumnView
 
 __version__ = "0.1.0"
-__all__ = ["GSheetCacheConfig", "GSheetCacheManager", "CacheSheet"]
\ No newline at end of file
+__all__ = [
+    "GSheetCacheConfig",
+    "GSheetCacheManager",
+    "CacheSheet",
+    "ColumnView",
+    "DirtyRows",
+    "DriveRevisionSource",
+    "KeyPool",
+    "RefreshPolicy",
+    "RevisionSource",
+    "RowDiff",
+]
\ No newline at end of file
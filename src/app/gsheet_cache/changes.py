@@ -0,0 +1,142 @@
+"""Rows to reprocess after sheet reloads.
+
+A sheet whose rows each describe a job (e.g. one offer per row of the main
+sheet) only needs to revisit the rows whose inputs changed: the rows that
+differ in its own reload, and the rows referencing a cell of another sheet
+whose value changed. DirtyRows collects both from CacheSheet change
+notifications, so each round can process just those rows.
+
+Classes:
+    DirtyRows: Collects the rows of a sheet that changed or whose
+        dependencies changed.
+
+Example:
+    >>> dirty = DirtyRows(main_sheet)
+    >>> dirty.depend(12, min_sheet, "B5")  # row 12 is priced from Min!B5
+    >>> manager.refresh_stale()
+    >>> for row in sorted(dirty.take()):
+    ...     process(row)
+"""
+
+import threading
+from typing import Callable, Iterable
+
+from gspread.utils import rowcol_to_a1
+
+from .schemas import RowDiff
+from .sheet import CacheSheet
+from .utils import a1_to_indices
+
+# A watched cell: spreadsheet ID, sheet name, 0-based (row, col)
+_CellKey = tuple[str, str, tuple[int, int]]
+
+
+class DirtyRows:
+    """Collects the rows of a sheet that changed or whose dependencies changed.
+
+    Rows are 0-based indices of the tracked sheet. A row is marked dirty
+    when a load of the sheet changes or adds it (see CacheSheet.subscribe())
+    or when a cell it depends on changes in another sheet (see
+    CacheSheet.watch_cells()). The first load is not tracked, callers
+    process every row once and then only take() the dirty ones.
+
+    Rows are positions, as in RowDiff: a row inserted or deleted in the
+    tracked sheet marks every row below it dirty, and the dependencies of
+    those rows still point at their old positions until they are forgotten
+    and registered again.
+
+    Attributes:
+        sheet: The tracked sheet.
+    """
+
+    def __init__(self, sheet: CacheSheet) -> None:
+        """Start tracking the row changes of a sheet.
+
+        Args:
+            sheet: The sheet whose rows are processed.
+        """
+        self.sheet = sheet
+        self._lock = threading.Lock()
+        self._dirty: set[int] = set()
+        # Rows depending on each watched cell, and the rows' dependencies
+        self._dependents: dict[_CellKey, set[int]] = {}
+        self._dependencies: dict[int, set[_CellKey]] = {}
+        # Cells already watched, each is watched once however many rows use it
+        self._watching: set[_CellKey] = set()
+        self._unsubscribes: list[Callable[[], None]] = [sheet.subscribe(self.__on_rows)]
+
+    def __on_rows(self, sheet: CacheSheet, diff: RowDiff) -> None:
+        with self._lock:
+            self._dirty.update(diff.rows)
+            # Rows cut off the sheet have nothing left to process
+            self._dirty.difference_update(diff.removed)
+
+    def __on_cells(
+        self, sheet: CacheSheet, changes: dict[tuple[int, int], str | None]
+    ) -> None:
+        with self._lock:
+            for cell in changes:
+                self._dirty.update(
+                    self._dependents.get((sheet.sheet_id, sheet.sheet_name, cell), ())
+                )
+
+    def depend(self, row: int, source: CacheSheet, cells: str | Iterable[str]) -> None:
+        """Mark ``row`` dirty whenever one of ``cells`` of ``source`` changes.
+
+        Args:
+            row: The 0-based row of the tracked sheet.
+            source: The sheet holding the cells, e.g. a min price tab.
+            cells: Cell references in A1 notation.
+        """
+        if isinstance(cells, str):
+            cells = [cells]
+        keys = [
+            (source.sheet_id, source.sheet_name, a1_to_indices(cell)) for cell in cells
+        ]
+
+        new_cells = []
+        with self._lock:
+            for key in keys:
+                self._dependents.setdefault(key, set()).add(row)
+                self._dependencies.setdefault(row, set()).add(key)
+                if key not in self._watching:
+                    self._watching.add(key)
+                    new_cells.append(rowcol_to_a1(key[2][0] + 1, key[2][1] + 1))
+
+        if new_cells:
+            self._unsubscribes.append(source.watch_cells(new_cells, self.__on_cells))
+
+    def forget(self, row: int) -> None:
+        """Drop the dependencies of a row, e.g. before registering new ones.
+
+        Args:
+            row: The 0-based row of the tracked sheet.
+        """
+        with self._lock:
+            for key in self._dependencies.pop(row, set()):
+                self._dependents.get(key, set()).discard(row)
+
+    def mark(self, rows: Iterable[int]) -> None:
+        """Mark rows dirty by hand, e.g. rows whose processing failed.
+
+        Args:
+            rows: 0-based rows of the tracked sheet.
+        """
+        with self._lock:
+            self._dirty.update(rows)
+
+    def take(self) -> set[int]:
+        """Return the dirty rows and start collecting anew.
+
+        Returns:
+            The 0-based rows marked dirty since the last call.
+        """
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        return dirty
+
+    def close(self) -> None:
+        """Stop listening to the sheets' changes."""
+        for unsubscribe in self._unsubscribes:
+            unsubscribe()
+        self._unsubscribes = []
@@ -4,6 +4,7 @@ This module provides configuration classes for managing gsheet-cache settings,
 including directory paths for cache storage and service account keys.
 
 Classes:
+    RefreshPolicy: How often a cached sheet is refreshed.
     GSheetCacheConfig: Configuration container for cache and keys directories.
 
 Example:
@@ -17,11 +18,74 @@ Example:
     .cache
 """
 
+import os
 from pathlib import Path
 
 from pydantic import BaseModel, Field
 
 
+class RefreshPolicy(BaseModel):
+    """How often a cached sheet is refreshed and in which order.
+
+    Attributes:
+        refresh_interval: Seconds after which the sheet is re-fetched by the
+            manager's background revalidation.
+        max_age: Hard limit in seconds. Older snapshots are re-fetched
+            synchronously the next time the sheet is passed to add_sheets()
+            or add_sparse_sheets(). None means no hard limit.
+        priority: Sheets with a higher priority are loaded and refreshed
+            first.
+        check_revision: Skip the fetch when the spreadsheet's revision has
+            not changed, if the manager checks revisions. Disable it for
+            tabs computed by formulas such as IMPORTRANGE or GOOGLEFINANCE,
+            whose results change without changing the revision.
+
+    Example:
+        >>> # A tab that changes weekly
+        >>> RefreshPolicy(refresh_interval=3600)
+        >>> # A tab that must never be more than two minutes old
+        >>> RefreshPolicy(refresh_interval=30, max_age=120, priority=10)
+        >>> # A tab of IMPORTRANGE formulas
+        >>> RefreshPolicy(refresh_interval=30, check_revision=False)
+    """
+
+    refresh_interval: float = Field(
+        default=120.0,
+        description="Seconds after which the sheet is refreshed in the background"
+    )
+    max_age: float | None = Field(
+        default=None,
+        description="Seconds after which the sheet is refreshed before being used"
+    )
+    priority: int = Field(
+        default=0,
+        description="Sheets with a higher priority are loaded and refreshed first"
+    )
+    check_revision: bool = Field(
+        default=True,
+        description="Skip the fetch when the spreadsheet's revision is unchanged"
+    )
+
+    @classmethod
+    def strictest(cls, policies: list["RefreshPolicy"]) -> "RefreshPolicy":
+        """Combine the policies of a sheet that serves several roles.
+
+        Args:
+            policies: At least one policy.
+
+        Returns:
+            The shortest interval and max age and the highest priority.
+            Revisions are only checked if every policy allows it.
+        """
+        max_ages = [p.max_age for p in policies if p.max_age is not None]
+        return cls(
+            refresh_interval=min(p.refresh_interval for p in policies),
+            max_age=min(max_ages) if max_ages else None,
+            priority=max(p.priority for p in policies),
+            check_revision=all(p.check_revision for p in policies),
+        )
+
+
 class GSheetCacheConfig(BaseModel):
     """Configuration for gsheet-cache directories.
 
@@ -33,6 +97,41 @@ class GSheetCacheConfig(BaseModel):
             Defaults to ".gsheet_cache" in the current directory.
         keys_dir: Directory path containing Google Service Account JSON key files.
             Defaults to "keys" in the current directory.
+        sparse_max_ranges: Maximum number of ranges fetched for one tab in
+            sparse mode. Tabs referenced by more ranges are loaded in full.
+        sparse_max_cells: Maximum number of cells fetched for one tab in
+            sparse mode. Tabs referenced by more cells are loaded in full.
+        refresh_policy: Refresh policy of sheets without a role or policy of
+            their own.
+        role_policies: Refresh policies by sheet role (e.g. "main",
+            "stock"). Roles are assigned with GSheetCacheManager.assign_role().
+        revalidate_interval: Seconds between two checks for stale sheets
+            by the manager's background revalidation.
+        write_behind_interval: Seconds between two flushes of the manager's
+            write-behind thread.
+        write_behind_max_cells: Number of edits after which the write-behind
+            thread flushes without waiting for the interval.
+        journal_max_entries: Number of journaled cell edits after which a
+            sheet's journal is compacted into its CSV cache file.
+        warm_start: Load sheets from their last binary snapshot when they
+            are added to the manager, and refresh them in the background.
+        check_revisions: Read the spreadsheet's Drive modified time before a
+            refresh and skip the data fetch when it has not changed. Off by
+            default: formula results (IMPORTRANGE, GOOGLEFINANCE, NOW, ...)
+            change without changing the modified time, see
+            RefreshPolicy.check_revision.
+        key_requests_per_minute: Requests allowed per service account key
+            and minute, the Sheets API per-user quota.
+        key_cooldown: Seconds a rate limited key is left out of the pool.
+        load_parallelism: Maximum number of spreadsheets the manager loads
+            at the same time.
+        memory_budget_mb: Approximate memory the manager's cached grids may
+            use, in megabytes. Least recently used sheets past it are
+            evicted to disk and reloaded on their next read. None for no
+            limit.
+        api_url: Base URL receiving the Sheets and Drive API requests
+            instead of Google, e.g. a MockSheetsServer. Defaults to the
+            GSHEET_CACHE_API_URL environment variable.
 
     Example:
         >>> config = GSheetCacheConfig()  # Use defaults
@@ -54,3 +153,63 @@ class GSheetCacheConfig(BaseModel):
         default=Path("keys"),
         description="Directory containing service account JSON keys"
     )
+    sparse_max_ranges: int = Field(
+        default=100,
+        description="Maximum ranges per tab before falling back to a full load"
+    )
+    sparse_max_cells: int = Field(
+        default=20_000,
+        description="Maximum cells per tab before falling back to a full load"
+    )
+    refresh_policy: RefreshPolicy = Field(
+        default_factory=RefreshPolicy,
+        description="Refresh policy of sheets without a role"
+    )
+    role_policies: dict[str, RefreshPolicy] = Field(
+        default_factory=dict,
+        description="Refresh policies by sheet role"
+    )
+    revalidate_interval: float = Field(
+        default=5.0,
+        description="Seconds between two checks for stale sheets"
+    )
+    write_behind_interval: float = Field(
+        default=5.0,
+        description="Seconds between two write-behind flushes"
+    )
+    write_behind_max_cells: int = Field(
+        default=200,
+        description="Edits that trigger a write-behind flush before the interval"
+    )
+    journal_max_entries: int = Field(
+        default=5000,
+        description="Journaled edits that trigger a compaction into the CSV cache"
+    )
+    warm_start: bool = Field(
+        default=True,
+        description="Serve sheets from their last snapshot while they are refreshed"
+    )
+    check_revisions: bool = Field(
+        default=False,
+        description="Skip refreshing spreadsheets whose modified time is unchanged"
+    )
+    key_requests_per_minute: int = Field(
+        default=60,
+        description="Requests allowed per service account key and minute"
+    )
+    key_cooldown: float = Field(
+        default=60.0,
+        description="Seconds a rate limited key is left out of the pool"
+    )
+    load_parallelism: int = Field(
+        default=4,
+        description="Spreadsheets loaded at the same time by the manager"
+    )
+    memory_budget_mb: float | None = Field(
+        default=None,
+        description="Memory of the cached grids above which sheets are evicted"
+    )
+    api_url: str | None = Field(
+        default_factory=lambda: os.environ.get("GSHEET_CACHE_API_URL") or None,
+        description="Server receiving the API requests instead of Google"
+    )
@@ -0,0 +1,41 @@
+import logging
+
+import pytest
+
+from .config import GSheetCacheConfig
+from .mock_server import MockSheetsServer
+
+# google-auth looks up credential metadata online, which fails offline
+logging.getLogger("urllib3").setLevel(logging.ERROR)
+
+
+@pytest.fixture(scope="session")
+def sheets_server():
+    with MockSheetsServer(latency=0.0, jitter=0.0) as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def keys_dir(sheets_server, tmp_path_factory):
+    keys_dir = tmp_path_factory.mktemp("keys")
+    sheets_server.write_keys(keys_dir, 2)
+    return keys_dir
+
+
+@pytest.fixture
+def sheet_id(request) -> str:
+    """A spreadsheet ID of the test's own, the mock server is shared."""
+    return request.node.name
+
+
+@pytest.fixture
+def config(sheets_server, keys_dir, tmp_path) -> GSheetCacheConfig:
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    return GSheetCacheConfig(
+        cache_dir=cache_dir,
+        keys_dir=keys_dir,
+        api_url=sheets_server.url,
+        key_requests_per_minute=10_000,
+        warm_start=False,
+    )
@@ -0,0 +1,110 @@
+"""Deduplicated in-memory storage of cached grids.
+
+Values decoded from an API response or a snapshot are separate string
+objects, even when a column repeats the same few values on every row, and
+rows are growable lists. intern_rows() shares one string object per
+distinct value and stores each row as an exact-size tuple. Rows stay
+tuples of str objects, nothing is packed into arrays: the saving comes from
+repeated values, about two thirds of the memory on a pricing tab whose
+columns repeat a few regions, flags and prices, and little on a tab of
+unique values.
+
+Functions:
+    intern_rows: Deduplicate the values of a grid and freeze its rows.
+    sparse_size: Estimate the memory of a sparse cell map.
+    row_hashes: Hash every row of a grid, to diff it against a later load.
+    diff_rows: Compare the row hashes of two loads.
+
+Example:
+    >>> rows, size = intern_rows([["1", "EU"], ["1", "EU"]])
+    >>> rows[0][1] is rows[1][1]
+    True
+"""
+
+import sys
+from array import array
+from typing import Mapping, Sequence
+
+from .schemas import RowDiff
+
+
+def intern_rows(rows: list[list[str]]) -> tuple[list[Sequence[str]], int]:
+    """Deduplicate the values of a grid and store its rows as tuples.
+
+    Args:
+        rows: The 2D list of values, left unchanged.
+
+    Returns:
+        The interned rows, and an estimate of their memory in bytes.
+    """
+    strings: dict[str, str] = {}
+    # setdefault(value, value) returns the first object seen for each value
+    interned: list[Sequence[str]] = [
+        tuple(map(strings.setdefault, row, row)) for row in rows
+    ]
+    size = (
+        sys.getsizeof(interned)
+        + sum(map(sys.getsizeof, interned))
+        + sum(map(sys.getsizeof, strings))
+    )
+    return interned, size
+
+
+def sparse_size(cells: Mapping[tuple[int, int], str]) -> int:
+    """Estimate the memory of a sparse cell map in bytes.
+
+    Args:
+        cells: Values keyed by 0-based (row, col).
+    """
+    return (
+        sys.getsizeof(cells)
+        + sum(map(sys.getsizeof, cells))
+        + sum(map(sys.getsizeof, cells.values()))
+    )
+
+
+def row_hashes(rows: Sequence[Sequence[str]]) -> array:
+    """Hash every row of a grid, to diff it against a later load.
+
+    Hashes come from the built-in hash(), whose string hashing is salted
+    per process: they are only comparable within one process and are never
+    stored. Keeping them across restarts would need a stable digest.
+
+    Args:
+        rows: The interned rows (see intern_rows()).
+
+    Returns:
+        One signed 64-bit hash per row.
+    """
+    return array("q", map(hash, map(tuple, rows)))
+
+
+def diff_rows(old: array | None, new: array) -> RowDiff:
+    """Compare the row hashes of two loads.
+
+    Rows are matched by position, not by content or key: inserting or
+    deleting a row reports every row below it as changed. Callers such as
+    DirtyRows track rows by position too, so the result over-reports after
+    a structural edit but never misses a changed row.
+
+    Args:
+        old: Row hashes of the previous load, None if there was none.
+        new: Row hashes of the new load.
+
+    Returns:
+        The rows that changed, were added or removed. Without a previous
+        load every row is added.
+    """
+    if old is None:
+        return RowDiff(added=list(range(len(new))))
+    if old == new:
+        return RowDiff()
+
+    common = min(len(old), len(new))
+    return RowDiff(
+        changed=[
+            row for row, (before, after) in enumerate(zip(old, new)) if before != after
+        ],
+        added=list(range(common, len(new))),
+        removed=list(range(common, len(old))),
+    )
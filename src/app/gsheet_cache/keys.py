@@ -0,0 +1,331 @@
+"""Service account key pool shared by every cached sheet.
+
+Each key gets a token bucket sized to the per-minute Sheets API quota of one
+service account. Requests lease the least loaded key that has quota left, so
+the load is spread over all keys instead of using them one at a time. A key
+that hits a rate limit cools down for a while and then returns to the pool.
+
+Classes:
+    KeyPool: Token-bucket balanced pool of service account keys.
+    RedirectedHTTPClient: gspread HTTP client talking to another API server.
+
+Example:
+    >>> pool = KeyPool.shared(config)
+    >>> with pool.lease() as (key, client):
+    ...     client.values_get(id=sheet_id, range="'Sheet1'")
+    >>> pool.status()["available_keys"]
+    3
+"""
+
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+from typing import Any, ClassVar, Iterator
+
+from gspread import service_account
+from gspread.http_client import HTTPClient
+from requests import Response
+
+from .config import GSheetCacheConfig
+
+logger = logging.getLogger(__name__)
+
+# Base URLs of the Sheets and Drive APIs, replaced by a configured api_url
+GOOGLE_API_URLS = ("https://sheets.googleapis.com", "https://www.googleapis.com")
+
+
+class RedirectedHTTPClient(HTTPClient):
+    """gspread HTTP client sending Google API requests to another server.
+
+    Used when ``GSheetCacheConfig.api_url`` is set, e.g. to run against
+    MockSheetsServer.
+    """
+
+    def __init__(self, auth, session=None, api_url: str = "") -> None:
+        super().__init__(auth, session)
+        self.api_url = api_url.rstrip("/")
+
+    def request(self, method: str, endpoint: str, *args, **kwargs) -> Response:
+        for base_url in GOOGLE_API_URLS:
+            if endpoint.startswith(base_url):
+                endpoint = self.api_url + endpoint[len(base_url) :]
+                break
+        return super().request(method, endpoint, *args, **kwargs)
+
+
+class KeyPool:
+    """Token-bucket balanced pool of service account keys.
+
+    Every key holds up to ``requests_per_minute`` tokens, refilled
+    continuously. Each request takes one token from the key with the most
+    tokens left (ties go to the key with fewer requests in flight), and waits
+    when every key is out of tokens or cooling down.
+
+    Attributes:
+        keys: The service account JSON key files.
+        requests_per_minute: Requests allowed per key and minute.
+        cooldown: Seconds a rate limited key is left out of the pool.
+        api_url: Server receiving the requests instead of Google, if any.
+    """
+
+    _shared: ClassVar[dict[Path, "KeyPool"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        keys: list[Path],
+        requests_per_minute: int = 60,
+        cooldown: float = 60.0,
+        api_url: str | None = None,
+    ) -> None:
+        """Initialize a KeyPool.
+
+        Args:
+            keys: The service account JSON key files.
+            requests_per_minute: Requests allowed per key and minute.
+            cooldown: Seconds a rate limited key is left out of the pool.
+            api_url: Server receiving the Sheets and Drive API requests
+                instead of Google, if any.
+
+        Raises:
+            ValueError: If no key is given.
+        """
+        if not keys:
+            raise ValueError("A key pool needs at least one key")
+
+        self.keys = list(keys)
+        self.requests_per_minute = requests_per_minute
+        self.cooldown = cooldown
+        self.api_url = api_url
+        self._condition = threading.Condition()
+        # Authorized clients by key index, created once and shared by every
+        # sheet, so each key reads its JSON and fetches OAuth tokens once
+        self._clients: dict[int, HTTPClient] = {}
+        self._clients_lock = threading.Lock()
+        self._auth_count = 0
+        self._auth_seconds = 0.0
+
+        now = time.monotonic()
+        self._tokens = [float(requests_per_minute)] * len(self.keys)
+        self._refilled_at = [now] * len(self.keys)
+        self._cooldown_until = [0.0] * len(self.keys)
+        self._in_flight = [0] * len(self.keys)
+        self._requests = [0] * len(self.keys)
+        self._rate_limits = [0] * len(self.keys)
+
+    @classmethod
+    def shared(cls, config: GSheetCacheConfig) -> "KeyPool":
+        """Return the pool of the keys in ``config.keys_dir``.
+
+        All sheets using the same keys directory share one pool, so quotas
+        are accounted for across the whole process. The pool is created with
+        the quota settings of the first config that asks for it.
+
+        Args:
+            config: Configuration containing the keys directory path.
+
+        Returns:
+            The shared KeyPool.
+
+        Raises:
+            FileNotFoundError: If the keys directory does not exist.
+            ValueError: If no valid key files are found.
+        """
+        keys_dir = config.keys_dir.resolve()
+        with cls._shared_lock:
+            pool = cls._shared.get(keys_dir)
+            if pool is not None:
+                return pool
+
+            if not keys_dir.exists():
+                raise FileNotFoundError(f"Keys directory does not exist: {keys_dir}")
+
+            keys = sorted(
+                f for f in keys_dir.iterdir() if f.is_file() and f.suffix == ".json"
+            )
+            if not keys:
+                raise ValueError(f"No JSON key files found in {keys_dir}")
+
+            logger.info(f"Loaded {len(keys)} service account key(s)")
+            pool = cls(
+                keys,
+                requests_per_minute=config.key_requests_per_minute,
+                cooldown=config.key_cooldown,
+                api_url=config.api_url,
+            )
+            cls._shared[keys_dir] = pool
+            return pool
+
+    def __refill(self, index: int, now: float) -> None:
+        """Add the tokens earned by a key since its last refill."""
+        elapsed = now - self._refilled_at[index]
+        self._tokens[index] = min(
+            float(self.requests_per_minute),
+            self._tokens[index] + elapsed * self.requests_per_minute / 60,
+        )
+        self._refilled_at[index] = now
+
+    def __ready_at(self, index: int, now: float) -> float:
+        """Return when a key will be out of cooldown with a token to spend."""
+        missing = max(1.0 - self._tokens[index], 0.0)
+        return max(
+            self._cooldown_until[index],
+            now + missing * 60 / self.requests_per_minute,
+        )
+
+    def acquire(self) -> int:
+        """Take a token from the least loaded available key.
+
+        Blocks until a key has quota left. Every acquire() must be followed
+        by a release() of the returned index.
+
+        Returns:
+            The index of the key in ``keys``.
+        """
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                candidates = []
+                for index in range(len(self.keys)):
+                    self.__refill(index, now)
+                    if self._cooldown_until[index] <= now and self._tokens[index] >= 1:
+                        candidates.append(index)
+
+                if candidates:
+                    index = max(
+                        candidates,
+                        key=lambda i: (
+                            int(self._tokens[i]),
+                            -self._in_flight[i],
+                            random.random(),
+                        ),
+                    )
+                    self._tokens[index] -= 1
+                    self._in_flight[index] += 1
+                    self._requests[index] += 1
+                    return index
+
+                wait = min(self.__ready_at(i, now) for i in range(len(self.keys))) - now
+                self._condition.wait(timeout=max(wait, 0.01))
+
+    def release(self, index: int) -> None:
+        """Return a key leased with acquire() once its request is over.
+
+        Args:
+            index: The index returned by acquire().
+        """
+        with self._condition:
+            self._in_flight[index] -= 1
+            self._condition.notify()
+
+    def cool_down(self, index: int) -> None:
+        """Leave a rate limited key out of the pool for ``cooldown`` seconds.
+
+        Args:
+            index: The index of the key in ``keys``.
+        """
+        with self._condition:
+            self._cooldown_until[index] = time.monotonic() + self.cooldown
+            self._tokens[index] = 0.0
+            self._rate_limits[index] += 1
+        logger.warning(
+            f"Key {self.keys[index].name} is rate limited, cooling down for {self.cooldown:.0f}s"
+        )
+
+    def client(self, index: int) -> HTTPClient:
+        """Return the authorized HTTP client of a key, created once.
+
+        The client and its credentials are shared by every request made with
+        the key: the key file is parsed once, and an expired access token is
+        refreshed by whichever request notices it first, for all sheets.
+
+        Args:
+            index: The index of the key in ``keys``.
+        """
+        client = self._clients.get(index)
+        if client is not None:
+            return client
+
+        with self._clients_lock:
+            client = self._clients.get(index)
+            if client is None:
+                logger.info(f"Using key: {self.keys[index].name}")
+                started_at = time.perf_counter()
+                http_client = (
+                    partial(RedirectedHTTPClient, api_url=self.api_url)
+                    if self.api_url
+                    else HTTPClient
+                )
+                client = service_account(
+                    filename=str(self.keys[index]), http_client=http_client
+                ).http_client
+                credentials = getattr(client, "auth", None)
+                if hasattr(credentials, "with_non_blocking_refresh"):
+                    # Refresh a token close to expiry on one background
+                    # thread while other requests keep using the current one
+                    credentials.with_non_blocking_refresh()
+                self._auth_seconds += time.perf_counter() - started_at
+                self._auth_count += 1
+                self._clients[index] = client
+        return client
+
+    @contextmanager
+    def lease(self) -> Iterator[tuple[int, HTTPClient]]:
+        """Lease the least loaded key for one request.
+
+        Yields:
+            The index of the key and its HTTP client.
+        """
+        index = self.acquire()
+        try:
+            yield index, self.client(index)
+        finally:
+            self.release(index)
+
+    def reset_cooldowns(self) -> None:
+        """Return every cooling down key to the pool right away."""
+        with self._condition:
+            self._cooldown_until = [0.0] * len(self.keys)
+            self._condition.notify_all()
+        logger.info("Key cooldowns have been reset")
+
+    def status(self) -> dict[str, Any]:
+        """Get the quota and usage of every key.
+
+        Returns:
+            A dictionary containing:
+            - total_keys: Total number of keys
+            - available_keys: Number of keys not cooling down
+            - failed_keys: Names of the keys cooling down
+            - keys: Per key name, the tokens left, requests in flight,
+              requests made and rate limits hit
+            - authentications: Number of authorized clients created
+            - auth_seconds: Time spent creating them
+        """
+        with self._condition:
+            now = time.monotonic()
+            cooling = []
+            usage = {}
+            for index, key in enumerate(self.keys):
+                self.__refill(index, now)
+                if self._cooldown_until[index] > now:
+                    cooling.append(key.name)
+                usage[key.name] = {
+                    "tokens": int(self._tokens[index]),
+                    "in_flight": self._in_flight[index],
+                    "requests": self._requests[index],
+                    "rate_limits": self._rate_limits[index],
+                }
+
+        return {
+            "total_keys": len(self.keys),
+            "available_keys": len(self.keys) - len(cooling),
+            "failed_keys": cooling,
+            "keys": usage,
+            "authentications": self._auth_count,
+            "auth_seconds": round(self._auth_seconds, 3),
+        }
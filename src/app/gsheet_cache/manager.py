@@ -16,8 +16,27 @@ Example:
     >>> value = manager.get_value("spreadsheet_id_1", "Sheet1", "A1")
 """
 
-from .config import GSheetCacheConfig
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Iterable, Iterator, Mapping
+
+from .config import GSheetCacheConfig, RefreshPolicy
+from .keys import KeyPool
+from .revisions import DriveRevisionSource, RevisionSource
+from .schemas import GridRange
 from .sheet import CacheSheet
+from .utils import grid_range_to_a1, plan_sparse_ranges
+from .views import ColumnView
+
+logger = logging.getLogger(__name__)
+
+# Longest wait between two write-behind attempts for a failing sheet
+WRITE_BEHIND_MAX_BACKOFF = 300.0
+# Window of get_revalidation_stats() and period of its log line
+REVALIDATION_STATS_WINDOW = 3600.0
 
 
 class GSheetCacheManager:
@@ -31,6 +50,8 @@ class GSheetCacheManager:
     Attributes:
         config: The GSheetCacheConfig containing directory paths.
         sheets: Dictionary mapping (sheet_id, sheet_name) tuples to CacheSheet instances.
+        revision_source: Source of the change markers checked before a
+            refresh, or None to always re-fetch.
 
     Example:
         >>> config = GSheetCacheConfig()
@@ -49,11 +70,18 @@ class GSheetCacheManager:
         >>> manager.flush_to_sheet("spreadsheet_1", "Sales", ["A1"])
     """
 
-    def __init__(self, config: GSheetCacheConfig):
+    def __init__(
+        self,
+        config: GSheetCacheConfig,
+        revision_source: RevisionSource | None = None,
+    ):
         """Initialize the GSheetCacheManager.
 
         Args:
             config: Configuration containing cache and keys directory paths.
+            revision_source: Source of the spreadsheets' change markers.
+                Defaults to DriveRevisionSource when
+                ``config.check_revisions`` is set.
 
         Raises:
             FileNotFoundError: If the keys directory does not exist.
@@ -68,6 +96,34 @@ class GSheetCacheManager:
         self.config = config
         # A dict to hold CacheSheet instances, keyed by (sheet_id, sheet_name)
         self.sheets: dict[tuple[str, str], CacheSheet] = {}
+        # Roles and explicit refresh policies, keyed by (sheet_id, sheet_name)
+        self._roles: dict[tuple[str, str], frozenset[str]] = {}
+        self._policies: dict[tuple[str, str], RefreshPolicy] = {}
+        # Rows per request for tabs loaded page by page
+        self._page_rows: dict[tuple[str, str], int] = {}
+        # Seconds the last load of each sheet took
+        self._load_timings: dict[tuple[str, str], float] = {}
+        # Loads in flight, so concurrent requesters of a sheet share one fetch
+        self._loading: dict[tuple[str, str], Future[CacheSheet]] = {}
+        self._loading_lock = threading.Lock()
+        self._revalidate_stop = threading.Event()
+        self._revalidator: threading.Thread | None = None
+        # Write-behind flusher state
+        self._write_wakeup = threading.Event()
+        self._write_stop = threading.Event()
+        self._writer: threading.Thread | None = None
+        self._edits_since_flush = 0
+        self._write_failures: dict[tuple[str, str], int] = {}
+        self._write_retry_at: dict[tuple[str, str], float] = {}
+        if revision_source is None and config.check_revisions:
+            revision_source = DriveRevisionSource()
+        self.revision_source = revision_source
+        # (time.monotonic(), reloaded) per spreadsheet revalidation
+        self._revalidations: deque[tuple[float, bool]] = deque()
+        # Sheet keys from least to most recently used, for the memory budget
+        self._recent: OrderedDict[tuple[str, str], None] = OrderedDict()
+        self._memory_lock = threading.Lock()
+        self._evictions = 0
 
         # Ensure cache directory exists
         self.config.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -89,7 +145,9 @@ class GSheetCacheManager:
         """Add a new CacheSheet to the manager.
 
         If a sheet with the same ID and name already exists, returns the
-        existing instance instead of creating a new one.
+        existing instance instead of creating a new one. Threads asking for a
+        sheet that another thread is loading wait for that load instead of
+        fetching it again.
 
         Args:
             sheet_id: The Google Sheets spreadsheet ID.
@@ -106,9 +164,843 @@ class GSheetCacheManager:
             >>> assert sheet is same_sheet
         """
         key = (sheet_id, sheet_name)
-        if key not in self.sheets:
-            self.sheets[key] = CacheSheet(sheet_id, sheet_name, self.config)
-        return self.sheets[key]
+        self.__touch(key)
+        sheet = self.sheets.get(key)
+        if sheet is not None:
+            return sheet
+
+        claimed, in_flight = self.__claim([key])
+        if in_flight:
+            return in_flight[key].result()
+        if not claimed:
+            # Another thread finished loading it since the lookup above
+            return self.sheets[key]
+
+        try:
+            if self.__load_snapshots(claimed):
+                sheet = self.sheets[key]
+            else:
+                sheet = CacheSheet(
+                    sheet_id, sheet_name, self.config, page_rows=self._page_rows.get(key)
+                )
+        except BaseException as e:
+            self.__release(claimed, error=e)
+            raise
+        self.sheets[key] = sheet
+        self.__release(claimed)
+        self.__enforce_memory_budget(keep=key)
+        return sheet
+
+    def __touch(self, key: tuple[str, str]) -> None:
+        """Mark a sheet as the most recently used one."""
+        # Reads on other threads reorder it while an eviction walks it
+        with self._memory_lock:
+            try:
+                self._recent.move_to_end(key)
+            except KeyError:
+                self._recent[key] = None
+
+    def __enforce_memory_budget(
+        self, keep: tuple[str, str] | None = None, incoming: int = 0
+    ) -> None:
+        """Evict least recently used sheets until the grids fit the budget.
+
+        Args:
+            keep: A sheet that must stay in memory, e.g. the one being read.
+            incoming: Bytes about to be loaded on top of the resident grids.
+        """
+        if self.config.memory_budget_mb is None:
+            return
+        budget = int(self.config.memory_budget_mb * 1024 * 1024)
+
+        with self._memory_lock:
+            sheets = dict(self.sheets)
+            resident = incoming + sum(
+                sheet.grid_bytes for sheet in sheets.values() if sheet.is_resident
+            )
+            if resident <= budget:
+                return
+
+            # Sheets never read through the manager count as the oldest
+            order = [key for key in sheets if key not in self._recent]
+            order += [key for key in list(self._recent) if key in sheets]
+            candidates = [
+                (key, sheets[key])
+                for key in order
+                if key != keep and not sheets[key].is_sparse and sheets[key].is_resident
+            ]
+
+        # Evicting writes to disk, reads touching the LRU order must not wait on it
+        for key, sheet in candidates:
+            if resident <= budget:
+                break
+            # Removed, reloaded sparse or evicted by another thread meanwhile
+            if (
+                key == keep
+                or self.sheets.get(key) is not sheet
+                or sheet.is_sparse
+                or not sheet.is_resident
+            ):
+                continue
+            if sheet.evict():
+                resident -= sheet.grid_bytes
+                with self._memory_lock:
+                    self._evictions += 1
+                logger.info(
+                    f"Evicted {key[0]} - {key[1]} ({sheet.grid_bytes / 2**20:.1f} MB) "
+                    "to stay within the memory budget"
+                )
+
+        if resident > budget:
+            logger.warning(
+                f"Cached sheets use {resident / 2**20:.1f} MB, over the "
+                f"{self.config.memory_budget_mb} MB budget"
+            )
+
+    def get_memory_stats(self) -> dict[str, Any]:
+        """Get the estimated memory of the cached grids.
+
+        Returns:
+            A dictionary containing:
+            - budget_mb: The configured budget, None for no limit
+            - resident_mb: Estimated memory of the grids in memory
+            - resident_sheets: Number of sheets with their grid in memory
+            - evicted_sheets: Number of sheets evicted to disk
+            - evictions: Number of evictions since the manager was created
+
+        Example:
+            >>> manager.get_memory_stats()["resident_mb"]
+            201.4
+        """
+        sheets = list(self.sheets.values())
+        resident = [sheet for sheet in sheets if sheet.is_resident]
+        return {
+            "budget_mb": self.config.memory_budget_mb,
+            "resident_mb": round(sum(sheet.grid_bytes for sheet in resident) / 2**20, 1),
+            "resident_sheets": len(resident),
+            "evicted_sheets": len(sheets) - len(resident),
+            "evictions": self._evictions,
+        }
+
+    def __claim(
+        self, keys: Iterable[tuple[str, str]]
+    ) -> tuple[list[tuple[str, str]], dict[tuple[str, str], Future[CacheSheet]]]:
+        """Register the caller as loader of the keys nobody is loading yet.
+
+        Args:
+            keys: (sheet_id, sheet_name) pairs the caller wants to load.
+
+        Returns:
+            The keys the caller must load and release(), and the futures of
+            keys another thread is already loading.
+        """
+        claimed = []
+        in_flight = {}
+        with self._loading_lock:
+            for key in keys:
+                if key in self.sheets:
+                    continue
+                if key in self._loading:
+                    in_flight[key] = self._loading[key]
+                else:
+                    self._loading[key] = Future()
+                    claimed.append(key)
+        return claimed, in_flight
+
+    def __release(
+        self, keys: list[tuple[str, str]], error: BaseException | None = None
+    ) -> None:
+        """Wake up threads waiting on claimed keys once the load is over.
+
+        Args:
+            keys: Keys returned by __claim().
+            error: The load error, re-raised to waiters of keys that did not
+                end up in the manager.
+        """
+        with self._loading_lock:
+            futures = {key: self._loading.pop(key) for key in keys}
+
+        for key, future in futures.items():
+            sheet = self.sheets.get(key)
+            if sheet is not None:
+                future.set_result(sheet)
+            else:
+                future.set_exception(
+                    error or ValueError(f"Sheet not loaded: {key[0]} - {key[1]}")
+                )
+
+    def add_sheets(self, sheets: Iterable[tuple[str, str]]) -> list[CacheSheet]:
+        """Add many sheets, loading tabs of the same spreadsheet together.
+
+        Sheets that are not cached yet are grouped by spreadsheet ID and each
+        group is fetched with a single values batch-get, so a round costs one
+        API call per spreadsheet instead of one per tab, in order of refresh
+        priority. Up to ``config.load_parallelism`` spreadsheets load at the
+        same time, spread over the key pool, and each sheet's load time is
+        kept (see get_load_timings()). Sheets already in the manager are kept, unless they are
+        older than the max_age of their refresh policy, in which case they
+        are refreshed first. With ``config.warm_start``, sheets that have a
+        snapshot from a previous run are served from it and refreshed in the
+        background instead of being fetched first.
+
+        A spreadsheet whose batch request fails is logged and skipped; its
+        tabs are loaded one by one on the next add_sheet() instead.
+
+        Args:
+            sheets: (sheet_id, sheet_name) pairs to load.
+
+        Returns:
+            The CacheSheet instances that are available after loading.
+
+        Example:
+            >>> manager.add_sheets([
+            ...     ("spreadsheet_1", "Min"),
+            ...     ("spreadsheet_1", "Stock"),
+            ...     ("spreadsheet_2", "Blacklist"),
+            ... ])  # two API calls
+        """
+        keys = list(dict.fromkeys(sheets))
+        for key in keys:
+            self.__touch(key)
+        self.__refresh_expired(keys)
+
+        claimed, in_flight = self.__claim(keys)
+        try:
+            warm = self.__load_snapshots(claimed)
+            missing: dict[str, list[str]] = {}
+            for sheet_id, sheet_name in claimed:
+                if (sheet_id, sheet_name) not in warm:
+                    missing.setdefault(sheet_id, []).append(sheet_name)
+
+            self.__load_in_parallel(
+                {
+                    sheet_id: dict.fromkeys(sheet_names)
+                    for sheet_id, sheet_names in missing.items()
+                }
+            )
+        finally:
+            self.__release(claimed)
+
+        self.__wait_for(in_flight)
+        self.__enforce_memory_budget()
+        return [self.sheets[key] for key in keys if key in self.sheets]
+
+    def __load_in_parallel(
+        self, plans: Mapping[str, Mapping[str, list[GridRange] | None]]
+    ) -> None:
+        """Load groups of tabs on up to ``config.load_parallelism`` threads.
+
+        Tabs of one spreadsheet share a batch-get, except tabs loaded page by
+        page which get a request group of their own. Groups start in order
+        of refresh priority and requests go through the shared key pool, so
+        a cold start takes about as long as the slowest group. A group that
+        fails is logged and skipped. Load times are kept per sheet, see
+        get_load_timings().
+
+        Args:
+            plans: Per spreadsheet ID, the sparse ranges to fetch per tab
+                name, or None for tabs loaded in full.
+        """
+        groups: list[tuple[str, dict[str, list[GridRange] | None]]] = []
+        for sheet_id in self.__by_priority(plans):
+            batched: dict[str, list[GridRange] | None] = {}
+            for sheet_name, grid_ranges in plans[sheet_id].items():
+                if grid_ranges is None and self._page_rows.get((sheet_id, sheet_name)):
+                    groups.append((sheet_id, {sheet_name: None}))
+                else:
+                    batched[sheet_name] = grid_ranges
+            if batched:
+                groups.append((sheet_id, batched))
+
+        if not groups:
+            return
+
+        def _load(group: tuple[str, dict[str, list[GridRange] | None]]) -> None:
+            sheet_id, group_plans = group
+            started_at = time.perf_counter()
+            try:
+                self.__load_group(sheet_id, group_plans)
+            except Exception as e:
+                logger.warning(f"Failed to load {list(group_plans)} of {sheet_id}: {e}")
+                return
+            elapsed = time.perf_counter() - started_at
+            for sheet_name in group_plans:
+                self._load_timings[(sheet_id, sheet_name)] = elapsed
+
+        started_at = time.perf_counter()
+        workers = min(self.config.load_parallelism, len(groups))
+        if workers <= 1:
+            for group in groups:
+                _load(group)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="GSheetCacheLoad"
+            ) as executor:
+                list(executor.map(_load, groups))
+
+        timings = [
+            self._load_timings[(sheet_id, sheet_name)]
+            for sheet_id, group_plans in groups
+            for sheet_name in group_plans
+            if (sheet_id, sheet_name) in self._load_timings
+        ]
+        logger.info(
+            f"Loaded {len(timings)} sheet(s) in {len(groups)} request group(s) "
+            f"on {workers} thread(s) in {time.perf_counter() - started_at:.2f}s "
+            f"(slowest {max(timings, default=0.0):.2f}s)"
+        )
+
+    def __load_group(
+        self, sheet_id: str, plans: Mapping[str, list[GridRange] | None]
+    ) -> None:
+        """Load tabs of one spreadsheet, with one request when possible.
+
+        Args:
+            sheet_id: The Google Sheets spreadsheet ID.
+            plans: The sparse ranges to fetch per tab name, or None for tabs
+                loaded in full.
+        """
+        sparse_ranges = {
+            sheet_name: grid_ranges
+            for sheet_name, grid_ranges in plans.items()
+            if grid_ranges is not None
+        }
+        if len(plans) == 1 and not sparse_ranges:
+            (sheet_name,) = plans
+            key = (sheet_id, sheet_name)
+            self.sheets[key] = CacheSheet(
+                sheet_id, sheet_name, self.config, page_rows=self._page_rows.get(key)
+            )
+            return
+
+        loaded = CacheSheet.load_many(
+            sheet_id, list(plans), self.config, sparse_ranges=sparse_ranges
+        )
+        for sheet in loaded:
+            key = (sheet.sheet_id, sheet.sheet_name)
+            # Used if the tab is later loaded in full
+            sheet.page_rows = self._page_rows.get(key)
+            self.sheets[key] = sheet
+        if sparse_ranges:
+            logger.info(
+                f"Loaded {sheet_id}: {len(sparse_ranges)} sparse tab(s), "
+                f"{len(plans) - len(sparse_ranges)} full tab(s)"
+            )
+
+    def get_load_timings(self) -> dict[tuple[str, str], float]:
+        """Return how long the last load of each sheet took.
+
+        Tabs fetched with the same request share its duration. Sheets served
+        from a snapshot or still loading are not included.
+
+        Returns:
+            Seconds per (sheet_id, sheet_name).
+
+        Example:
+            >>> manager.add_sheets(sheets)
+            >>> max(manager.get_load_timings().items(), key=lambda kv: kv[1])
+            (('spreadsheet_1', 'Prices'), 1.8)
+        """
+        return dict(self._load_timings)
+
+    def __load_snapshots(self, keys: list[tuple[str, str]]) -> list[tuple[str, str]]:
+        """Load claimed sheets from their last snapshot, if warm starts are on.
+
+        Snapshots older than the max_age of the sheet's refresh policy are
+        ignored. Sheets loaded from a snapshot are refreshed in a background
+        thread, so callers get the cached values right away.
+
+        Args:
+            keys: Keys returned by __claim().
+
+        Returns:
+            The keys that were loaded from a snapshot.
+        """
+        if not self.config.warm_start:
+            return []
+
+        warm = []
+        for key in keys:
+            sheet = CacheSheet.from_snapshot(*key, self.config)
+            if sheet is None:
+                continue
+            max_age = self.get_refresh_policy(*key).max_age
+            if max_age is not None and sheet.age >= max_age:
+                logger.info(f"Snapshot of {key[0]} - {key[1]} is past its max age")
+                continue
+            sheet.page_rows = self._page_rows.get(key)
+            self.sheets[key] = sheet
+            warm.append(sheet)
+
+        if warm:
+            threading.Thread(
+                target=self.__refresh,
+                args=(warm,),
+                daemon=True,
+                name="GSheetCacheWarmStart",
+            ).start()
+
+        return [(sheet.sheet_id, sheet.sheet_name) for sheet in warm]
+
+    def __wait_for(self, in_flight: dict[tuple[str, str], Future[CacheSheet]]) -> None:
+        """Wait for loads other threads have in flight; their errors are theirs to log."""
+        for future in in_flight.values():
+            try:
+                future.result()
+            except Exception:
+                pass
+
+    def add_sparse_sheets(
+        self, references: Mapping[tuple[str, str], Iterable[str]]
+    ) -> list[CacheSheet]:
+        """Add sheets fetching only the cells and ranges that will be read.
+
+        For every tab, the referenced cells are planned with
+        plan_sparse_ranges(): few, small, bounded ranges are fetched on their
+        own; dense, unbounded or very large references fall back to loading
+        the full tab. All tabs of a spreadsheet still go into a single
+        values batch-get, and spreadsheets load concurrently like in
+        add_sheets(). Reads outside the fetched ranges load the full tab
+        on demand, so a missing reference only costs an extra request; a
+        warning names the reference that missed.
+        Sheets already cached are kept unless some references fall outside
+        their fetched ranges, in which case they are reloaded with both, or
+        they are older than the max_age of their refresh policy.
+
+        Args:
+            references: Cell or range references in A1 notation (without
+                sheet name), keyed by (sheet_id, sheet_name).
+
+        Returns:
+            The CacheSheet instances that are available after loading.
+
+        Example:
+            >>> manager.add_sparse_sheets({
+            ...     ("spreadsheet_1", "Min"): ["B5", "B9"],
+            ...     ("spreadsheet_1", "Blacklist"): ["A:A"],  # full tab
+            ... })
+        """
+        for key in references:
+            self.__touch(key)
+        self.__refresh_expired(list(references))
+        claimed, in_flight = self.__claim(references)
+        try:
+            warm = self.__load_snapshots(claimed)
+        except BaseException as e:
+            self.__release(claimed, error=e)
+            raise
+
+        missing: dict[str, dict[str, list[GridRange] | None]] = {}
+        for (sheet_id, sheet_name), a1_ranges in references.items():
+            if (sheet_id, sheet_name) in in_flight or (sheet_id, sheet_name) in warm:
+                continue
+            a1_ranges = list(a1_ranges)
+            sheet = self.sheets.get((sheet_id, sheet_name))
+            if sheet is not None:
+                if all(sheet.covers(a1_range) for a1_range in a1_ranges):
+                    continue
+                # New references outside the fetched ranges: reload the tab
+                # now rather than on first read from a worker thread
+                a1_ranges += [grid_range_to_a1(r) for r in sheet.sparse_ranges]
+            missing.setdefault(sheet_id, {})[sheet_name] = plan_sparse_ranges(
+                a1_ranges,
+                max_ranges=self.config.sparse_max_ranges,
+                max_cells=self.config.sparse_max_cells,
+            )
+
+        try:
+            self.__load_in_parallel(missing)
+        finally:
+            self.__release(claimed)
+
+        self.__wait_for(in_flight)
+        self.__enforce_memory_budget()
+        return [self.sheets[key] for key in references if key in self.sheets]
+
+    def assign_role(self, sheet_id: str, sheet_name: str, role: str) -> None:
+        """Give a sheet a role whose refresh policy it should follow.
+
+        Roles are looked up in ``config.role_policies``. A sheet that serves
+        several roles follows the strictest of their policies.
+
+        Args:
+            sheet_id: The Google Sheets spreadsheet ID.
+            sheet_name: The name of the sheet/tab.
+            role: Role name, e.g. "main", "stock" or "blacklist".
+
+        Example:
+            >>> config = GSheetCacheConfig(role_policies={
+            ...     "blacklist": RefreshPolicy(refresh_interval=3600),
+            ... })
+            >>> manager = GSheetCacheManager(config)
+            >>> manager.assign_role("1BxiMV...", "Blacklist", "blacklist")
+        """
+        key = (sheet_id, sheet_name)
+        # Swap in a new set so the revalidation thread never sees it change
+        self._roles[key] = self._roles.get(key, frozenset()) | {role}
+
+    def set_refresh_policy(
+        self, sheet_id: str, sheet_name: str, policy: RefreshPolicy
+    ) -> None:
+        """Set the refresh policy of one sheet, overriding its roles.
+
+        Args:
+            sheet_id: The Google Sheets spreadsheet ID.
+            sheet_name: The name of the sheet/tab.
+            policy: The policy to apply.
+
+        Example:
+            >>> manager.set_refresh_policy(
+            ...     "1BxiMV...", "Min", RefreshPolicy(refresh_interval=15, priority=10)
+            ... )
+        """
+        self._policies[(sheet_id, sheet_name)] = policy
+
+    def set_page_rows(
+        self, sheet_id: str, sheet_name: str, page_rows: int | None
+    ) -> None:
+        """Load a very large tab page by page instead of in one response.
+
+        Full loads and refreshes of the tab, and the full download of a
+        sparse tab read outside its ranges, then request ``page_rows`` rows
+        at a time, so only one page of the API response is decoded in
+        memory next to the grid. A full tab is no longer part of the
+        batch-get of its spreadsheet.
+
+        Args:
+            sheet_id: The Google Sheets spreadsheet ID.
+            sheet_name: The name of the sheet/tab within the spreadsheet.
+            page_rows: Rows per request, or None to load the tab in one
+                response again.
+
+        Example:
+            >>> manager.set_page_rows("spreadsheet_1", "Prices", 5000)
+            >>> manager.add_sheet("spreadsheet_1", "Prices")
+        """
+        key = (sheet_id, sheet_name)
+        if page_rows:
+            self._page_rows[key] = page_rows
+        else:
+            self._page_rows.pop(key, None)
+
+        sheet = self.sheets.get(key)
+        if sheet is not None:
+            sheet.page_rows = page_rows or None
+
+    def get_refresh_policy(self, sheet_id: str, sheet_name: str) -> RefreshPolicy:
+        """Return the refresh policy that applies to a sheet.
+
+        An explicit policy set with set_refresh_policy() wins, then the
+        strictest policy of the sheet's roles, then ``config.refresh_policy``.
+
+        Args:
+            sheet_id: The Google Sheets spreadsheet ID.
+            sheet_name: The name of the sheet/tab.
+
+        Returns:
+            The RefreshPolicy for the sheet.
+        """
+        key = (sheet_id, sheet_name)
+        if key in self._policies:
+            return self._policies[key]
+
+        role_policies = [
+            self.config.role_policies[role]
+            for role in self._roles.get(key, ())
+            if role in self.config.role_policies
+        ]
+        if role_policies:
+            return RefreshPolicy.strictest(role_policies)
+
+        return self.config.refresh_policy
+
+    def __by_priority(self, groups: Mapping[str, Iterable[str]]) -> list[str]:
+        """Order spreadsheet IDs by the highest priority among their tabs."""
+        return sorted(
+            groups,
+            key=lambda sheet_id: max(
+                self.get_refresh_policy(sheet_id, sheet_name).priority
+                for sheet_name in groups[sheet_id]
+            ),
+            reverse=True,
+        )
+
+    def __refresh(self, sheets: list[CacheSheet]) -> int:
+        """Refresh sheets with one batch-get per spreadsheet, by priority.
+
+        Spreadsheets whose revision is unchanged are skipped, for groups
+        whose policies all allow it.
+
+        Args:
+            sheets: Cached sheets to refresh.
+
+        Returns:
+            The number of sheets refreshed.
+        """
+        by_sheet_id: dict[str, list[CacheSheet]] = {}
+        for sheet in sheets:
+            by_sheet_id.setdefault(sheet.sheet_id, []).append(sheet)
+
+        refreshed = 0
+        for sheet_id in self.__by_priority(
+            {
+                sheet_id: [sheet.sheet_name for sheet in group]
+                for sheet_id, group in by_sheet_id.items()
+            }
+        ):
+            group = by_sheet_id[sheet_id]
+            revisions = self.revision_source
+            if revisions is not None and not all(
+                self.get_refresh_policy(sheet_id, sheet.sheet_name).check_revision
+                for sheet in group
+            ):
+                revisions = None
+            try:
+                reloaded = CacheSheet.refresh_many(group, revisions)
+                self._revalidations.append((time.monotonic(), reloaded))
+                refreshed += len(group)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to refresh {[sheet.sheet_name for sheet in group]} of {sheet_id}: {e}"
+                )
+
+        # Refreshing an evicted sheet brings its grid back into memory
+        self.__enforce_memory_budget()
+        return refreshed
+
+    def get_revalidation_stats(self) -> dict[str, int]:
+        """Count the spreadsheet revalidations of the last hour.
+
+        Returns:
+            A dictionary with the number of spreadsheets that were
+            revalidated (``checked``), re-fetched (``reloaded``) and found
+            unchanged so their re-fetch was skipped (``reloads_avoided``).
+
+        Example:
+            >>> manager.get_revalidation_stats()
+            {'checked': 120, 'reloaded': 7, 'reloads_avoided': 113}
+        """
+        cutoff = time.monotonic() - REVALIDATION_STATS_WINDOW
+        while self._revalidations and self._revalidations[0][0] < cutoff:
+            self._revalidations.popleft()
+
+        reloaded = sum(1 for _, was_reloaded in self._revalidations if was_reloaded)
+        return {
+            "checked": len(self._revalidations),
+            "reloaded": reloaded,
+            "reloads_avoided": len(self._revalidations) - reloaded,
+        }
+
+    def __refresh_expired(self, keys: list[tuple[str, str]]) -> None:
+        """Synchronously refresh cached sheets older than their policy's max_age.
+
+        Spreadsheets are revalidated like in refresh_stale(): an unchanged
+        revision makes their sheets fresh again without a fetch, and only
+        a revision that cannot be read forces one.
+        """
+        expired = []
+        for key in keys:
+            sheet = self.sheets.get(key)
+            if sheet is None:
+                continue
+            max_age = self.get_refresh_policy(*key).max_age
+            if max_age is not None and sheet.age >= max_age:
+                expired.append(sheet)
+
+        if expired:
+            logger.info(f"Refreshing {len(expired)} sheet(s) past their max age")
+            self.__refresh(expired)
+
+    def refresh_stale(self, force: bool = False) -> int:
+        """Re-fetch every sheet due according to its refresh policy.
+
+        A sheet is due once it is older than the refresh_interval of its
+        policy (see get_refresh_policy()). Due tabs of the same spreadsheet
+        are refreshed together with a single values batch-get, spreadsheets
+        with higher priority first. Each sheet keeps serving its current
+        snapshot until the new one is swapped in, so readers never wait on
+        the Sheets API. A spreadsheet whose refresh fails is logged and kept
+        as it is until the next attempt. With a ``revision_source``, a
+        spreadsheet whose change marker has not moved since its last load
+        is not fetched again, its sheets count as refreshed (see
+        get_revalidation_stats()) and are next due a refresh_interval
+        later. Sheets whose policy sets check_revision=False are always
+        fetched.
+
+        Args:
+            force: Refresh every sheet regardless of its age.
+
+        Returns:
+            The number of sheets refreshed or found unchanged.
+
+        Example:
+            >>> manager.refresh_stale()  # refresh what is due
+            >>> manager.refresh_stale(force=True)  # refresh everything
+        """
+        stale = [
+            sheet
+            for (sheet_id, sheet_name), sheet in list(self.sheets.items())
+            if force
+            or sheet.age
+            >= self.get_refresh_policy(sheet_id, sheet_name).refresh_interval
+        ]
+
+        refreshed = self.__refresh(stale)
+        if refreshed:
+            logger.info(f"Refreshed {refreshed} stale sheet(s)")
+        return refreshed
+
+    def start_revalidation(self) -> None:
+        """Start refreshing stale sheets in a background thread.
+
+        Every ``config.revalidate_interval`` seconds the thread calls
+        refresh_stale(). Calling it again while the thread runs is a no-op.
+
+        Example:
+            >>> manager.start_revalidation()
+            >>> # Sheets stay cached and are refreshed as their policies say
+            >>> manager.stop_revalidation()
+        """
+        if self._revalidator is not None and self._revalidator.is_alive():
+            return
+
+        def _run():
+            reported_at = time.monotonic()
+            while not self._revalidate_stop.wait(self.config.revalidate_interval):
+                try:
+                    self.refresh_stale()
+                except Exception:
+                    logger.exception("Background revalidation failed")
+
+                if time.monotonic() - reported_at >= REVALIDATION_STATS_WINDOW:
+                    reported_at = time.monotonic()
+                    stats = self.get_revalidation_stats()
+                    logger.info(
+                        f"Last hour: {stats['reloads_avoided']} of {stats['checked']} "
+                        "spreadsheet reload(s) avoided as unchanged"
+                    )
+
+        self._revalidate_stop.clear()
+        self._revalidator = threading.Thread(
+            target=_run, daemon=True, name="GSheetCacheRevalidator"
+        )
+        self._revalidator.start()
+
+    def stop_revalidation(self, timeout: float | None = None) -> None:
+        """Stop the background revalidation thread.
+
+        Args:
+            timeout: Maximum number of seconds to wait for the thread.
+        """
+        self._revalidate_stop.set()
+        if self._revalidator is not None:
+            self._revalidator.join(timeout=timeout)
+
+    @property
+    def write_behind_running(self) -> bool:
+        """True while the write-behind flusher thread is running."""
+        return self._writer is not None and self._writer.is_alive()
+
+    def start_write_behind(self) -> None:
+        """Start flushing dirty cells to Google Sheets in a background thread.
+
+        The thread flushes every sheet with dirty cells each
+        ``config.write_behind_interval`` seconds, or as soon as
+        ``config.write_behind_max_cells`` edits were made through
+        update_value(). A sheet whose flush fails keeps its dirty cells and
+        is retried with exponential backoff without holding up the others.
+        Callers no longer need flush_to_sheet(); use flush_and_wait() before
+        shutting down.
+
+        Example:
+            >>> manager.start_write_behind()
+            >>> manager.update_value("1BxiMV...", "Sheet1", "A1", "Value")
+            >>> # ... written within write_behind_interval seconds
+            >>> manager.flush_and_wait(timeout=30)
+        """
+        if self.write_behind_running:
+            return
+
+        def _run():
+            while not self._write_stop.is_set():
+                self._write_wakeup.wait(self.config.write_behind_interval)
+                self._write_wakeup.clear()
+                self.__flush_dirty()
+
+        self._write_stop.clear()
+        self._writer = threading.Thread(
+            target=_run, daemon=True, name="GSheetCacheWriteBehind"
+        )
+        self._writer.start()
+
+    def stop_write_behind(self, timeout: float | None = None) -> None:
+        """Flush what is dirty and stop the write-behind flusher thread.
+
+        Args:
+            timeout: Maximum number of seconds to wait for the thread.
+        """
+        self._write_stop.set()
+        self._write_wakeup.set()
+        if self._writer is not None:
+            self._writer.join(timeout=timeout)
+        self.__flush_dirty()
+
+    def flush_and_wait(self, timeout: float | None = None) -> bool:
+        """Write every dirty cell of every sheet now and wait until done.
+
+        Pending retries are attempted immediately. Without a write-behind
+        thread the sheets are flushed from the calling thread.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait
+                until everything is written.
+
+        Returns:
+            True if no dirty cells are left.
+
+        Example:
+            >>> if not manager.flush_and_wait(timeout=60):
+            ...     print("Some sheet updates could not be written")
+        """
+        self._write_retry_at.clear()
+        if not self.write_behind_running:
+            self.__flush_dirty()
+            return not self.__has_dirty_sheets()
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self._write_wakeup.set()
+        while self.__has_dirty_sheets():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.1)
+            if not self._write_retry_at:
+                self._write_wakeup.set()
+        return True
+
+    def __has_dirty_sheets(self) -> bool:
+        return any(sheet.dirty_cells for sheet in list(self.sheets.values()))
+
+    def __flush_dirty(self) -> None:
+        """Flush every sheet with dirty cells that is not waiting for a retry."""
+        self._edits_since_flush = 0
+        now = time.monotonic()
+        for key, sheet in list(self.sheets.items()):
+            if not sheet.dirty_cells or self._write_retry_at.get(key, 0) > now:
+                continue
+            try:
+                sheet.flush_to_sheet()
+            except Exception as e:
+                failures = self._write_failures.get(key, 0) + 1
+                self._write_failures[key] = failures
+                delay = min(WRITE_BEHIND_MAX_BACKOFF, 2**failures)
+                self._write_retry_at[key] = time.monotonic() + delay
+                logger.warning(
+                    f"Write-behind flush of {key[0]} - {key[1]} failed "
+                    f"(attempt {failures}), retrying in {delay:.0f}s: {e}"
+                )
+                continue
+            self._write_failures.pop(key, None)
+            self._write_retry_at.pop(key, None)
 
     def remove_sheet(self, sheet_id: str, sheet_name: str) -> None:
         """Remove a CacheSheet from the manager.
@@ -128,6 +1020,8 @@ class GSheetCacheManager:
         key = (sheet_id, sheet_name)
         if key in self.sheets:
             del self.sheets[key]
+        with self._memory_lock:
+            self._recent.pop(key, None)
 
     def clear_all_sheets(self) -> None:
         """Clear all CacheSheet instances from the manager.
@@ -143,10 +1037,31 @@ class GSheetCacheManager:
             0
         """
         self.sheets.clear()
+        with self._memory_lock:
+            self._recent.clear()
+
+    def get_key_status(self) -> dict[str, Any]:
+        """Get the quota and usage of the service account keys.
+
+        Every sheet of the manager shares one KeyPool, which spreads requests
+        over the keys by remaining per-minute quota.
+
+        Returns:
+            The status of the key pool, see KeyPool.status().
+
+        Raises:
+            FileNotFoundError: If the keys directory does not exist.
+            ValueError: If no valid key files are found.
+        """
+        return KeyPool.shared(self.config).status()
 
     def get_sheet(self, sheet_id: str, sheet_name: str) -> CacheSheet:
         """Get a CacheSheet instance from the manager.
 
+        The sheet becomes the most recently used one for the memory budget
+        (see ``config.memory_budget_mb``). An evicted sheet is reloaded from
+        disk by its next read, after older sheets are evicted to make room.
+
         Args:
             sheet_id: The Google Sheets spreadsheet ID.
             sheet_name: The name of the sheet/tab.
@@ -167,6 +1082,10 @@ class GSheetCacheManager:
             raise ValueError(f"Sheet not found: {sheet_id} - {sheet_name}")
 
         sheet = self.sheets[key]
+        self.__touch(key)
+        if not sheet.is_resident:
+            # Make room before the read reloads it from disk
+            self.__enforce_memory_budget(keep=key, incoming=sheet.grid_bytes)
         return sheet
 
     def get_value(self, sheet_id: str, sheet_name: str, cell: str) -> str | None:
@@ -193,10 +1112,51 @@ class GSheetCacheManager:
         sheet = self.get_sheet(sheet_id, sheet_name)
         return sheet.get_value(cell)
 
+    def get_float(self, sheet_id: str, sheet_name: str, cell: str) -> float | None:
+        """Get a cell as a float, parsed once per loaded snapshot.
+
+        Args:
+            sheet_id: The Google Sheets spreadsheet ID.
+            sheet_name: The name of the sheet/tab.
+            cell: Cell reference in A1 notation (e.g., "A1", "B5").
+
+        Returns:
+            The parsed value, or None if the cell is empty or out of bounds.
+
+        Raises:
+            ValueError: If the sheet is not found or the cell is not a number.
+
+        Example:
+            >>> price = manager.get_float("1BxiMV...", "Min", "B5")
+        """
+        sheet = self.get_sheet(sheet_id, sheet_name)
+        return sheet.get_float(cell)
+
+    def get_int(self, sheet_id: str, sheet_name: str, cell: str) -> int | None:
+        """Get a cell as an int, parsed once per loaded snapshot.
+
+        Args:
+            sheet_id: The Google Sheets spreadsheet ID.
+            sheet_name: The name of the sheet/tab.
+            cell: Cell reference in A1 notation (e.g., "A1", "B5").
+
+        Returns:
+            The parsed value, or None if the cell is empty or out of bounds.
+
+        Raises:
+            ValueError: If the sheet is not found or the cell is not an integer.
+
+        Example:
+            >>> stock = manager.get_int("1BxiMV...", "Stock", "C2")
+        """
+        sheet = self.get_sheet(sheet_id, sheet_name)
+        return sheet.get_int(cell)
+
     def update_value(self, sheet_id: str, sheet_name: str, cell: str, value: str) -> None:
         """Update a value in a specific sheet and cell.
 
-        Updates only the local cache. Call flush_to_sheet() to sync to Google Sheets.
+        Updates only the local cache. Call flush_to_sheet() to sync to Google
+        Sheets, or let the write-behind flusher do it (see start_write_behind()).
 
         Args:
             sheet_id: The Google Sheets spreadsheet ID.
@@ -215,16 +1175,24 @@ class GSheetCacheManager:
         sheet = self.get_sheet(sheet_id, sheet_name)
         sheet.update_value(cell, value)
 
-    def flush_to_sheet(self, sheet_id: str, sheet_name: str, cells: list[str]) -> None:
+        self._edits_since_flush += 1
+        if self._edits_since_flush >= self.config.write_behind_max_cells:
+            self._write_wakeup.set()
+
+    def flush_to_sheet(
+        self, sheet_id: str, sheet_name: str, cells: list[str] | None = None
+    ) -> None:
         """Flush updated values to the Google Sheet.
 
-        Syncs the specified cells from the local cache back to the remote
-        Google Sheet. Uses automatic key rotation on rate limits.
+        Syncs changed cells from the local cache back to the remote Google
+        Sheet in one batch update, merging adjacent cells into ranges. Uses
+        automatic key rotation on rate limits.
 
         Args:
             sheet_id: The Google Sheets spreadsheet ID.
             sheet_name: The name of the sheet/tab.
-            cells: List of cell references in A1 notation to sync.
+            cells: List of cell references in A1 notation to sync. Defaults
+                to every dirty cell of the sheet.
 
         Raises:
             ValueError: If the sheet is not found.
@@ -233,12 +1201,14 @@ class GSheetCacheManager:
         Example:
             >>> manager.update_value("1BxiMV...", "Sheet1", "A1", "Value 1")
             >>> manager.update_value("1BxiMV...", "Sheet1", "B1", "Value 2")
-            >>> manager.flush_to_sheet("1BxiMV...", "Sheet1", ["A1", "B1"])
+            >>> manager.flush_to_sheet("1BxiMV...", "Sheet1")  # writes A1:B1
         """
         sheet = self.get_sheet(sheet_id, sheet_name)
         sheet.flush_to_sheet(cells)
 
-    def get_range(self, sheet_id: str, sheet_name: str, a1_range: str) -> list[list[str]]:
+    def get_range(
+        self, sheet_id: str, sheet_name: str, a1_range: str
+    ) -> list[list[str | None]]:
         """Get a range of values from a specific sheet.
 
         Convenience method that combines get_sheet() and CacheSheet.get_range().
@@ -249,8 +1219,8 @@ class GSheetCacheManager:
             a1_range: Range in A1 notation (e.g., "A1:B5", "A:A", "1:1").
 
         Returns:
-            A 2D list of strings representing the range values.
-            Empty cells are represented as empty strings.
+            A 2D list of the range values. Empty cells, and cells past the
+            end of their row, are None.
 
         Raises:
             ValueError: If the sheet is not found.
@@ -273,3 +1243,53 @@ class GSheetCacheManager:
         """
         sheet = self.get_sheet(sheet_id, sheet_name)
         return sheet.get_range(a1_range)
+
+    def iter_range(
+        self, sheet_id: str, sheet_name: str, a1_range: str
+    ) -> Iterator[list[str | None]]:
+        """Lazily yield the rows of a range from a specific sheet.
+
+        Convenience method that combines get_sheet() and CacheSheet.iter_range().
+
+        Args:
+            sheet_id: The Google Sheets spreadsheet ID.
+            sheet_name: The name of the sheet/tab.
+            a1_range: Range in A1 notation (e.g., "A1:B5", "A:A", "1:1").
+
+        Returns:
+            An iterator over the rows, empty cells as None.
+
+        Raises:
+            ValueError: If the sheet is not found.
+
+        Example:
+            >>> for row in manager.iter_range("1BxiMV...", "Blacklist", "A1:B500"):
+            ...     print(row)
+        """
+        sheet = self.get_sheet(sheet_id, sheet_name)
+        return sheet.iter_range(a1_range)
+
+    def get_column(self, sheet_id: str, sheet_name: str, a1_range: str) -> ColumnView:
+        """Get a lazy view over a single-column range of a specific sheet.
+
+        Convenience method that combines get_sheet() and CacheSheet.get_column().
+
+        Args:
+            sheet_id: The Google Sheets spreadsheet ID.
+            sheet_name: The name of the sheet/tab.
+            a1_range: Single-column range in A1 notation (e.g., "A:A").
+
+        Returns:
+            A ColumnView over the column, empty cells as None.
+
+        Raises:
+            ValueError: If the sheet is not found or the range is not a
+                single column.
+
+        Example:
+            >>> checks = manager.get_column("1BxiMV...", "Sheet1", "A:A")
+            >>> checks[0]
+            'CHECK'
+        """
+        sheet = self.get_sheet(sheet_id, sheet_name)
+        return sheet.get_column(a1_range)
@@ -0,0 +1,432 @@
+"""Local stand-in for the Google Sheets API, for integration tests and benchmarks.
+
+Serves the calls CacheSheet makes through gspread: values get, batch-get and
+batch-update, spreadsheet metadata, the Drive modifiedTime and the OAuth
+token endpoint of the service account keys it writes. Latency, a per-key
+quota answering 429 (or 403) and large synthetic tabs are configurable.
+
+Point a cache at it with ``GSheetCacheConfig(api_url=server.url)`` or the
+GSHEET_CACHE_API_URL environment variable, and keys from write_keys().
+
+Example:
+    >>> with MockSheetsServer(latency=0.05, quota_per_minute=60) as server:
+    ...     server.add_synthetic_sheet("spreadsheet_1", "Main", rows=50_000, cols=20)
+    ...     server.write_keys(keys_dir, count=3)
+    ...     config = GSheetCacheConfig(keys_dir=keys_dir, api_url=server.url)
+    ...     sheet = CacheSheet("spreadsheet_1", "Main", config)
+"""
+
+import base64
+import functools
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Final
+from urllib.parse import parse_qs, unquote, urlsplit
+
+# Signs the token requests of generated keys, see the dev dependency group
+import rsa
+from gspread.utils import a1_range_to_grid_range
+
+VALUES_PATH_RE: Final = re.compile(r"^/v4/spreadsheets/([^/]+)/values/(.+)$")
+BATCH_GET_PATH_RE: Final = re.compile(r"^/v4/spreadsheets/([^/]+)/values:batchGet$")
+BATCH_UPDATE_PATH_RE: Final = re.compile(
+    r"^/v4/spreadsheets/([^/]+)/values:batchUpdate$"
+)
+SPREADSHEET_PATH_RE: Final = re.compile(r"^/v4/spreadsheets/([^/:]+)$")
+DRIVE_FILE_PATH_RE: Final = re.compile(r"^/drive/v3/files/([^/]+)$")
+
+# Grid size reported for tabs smaller than a new Google Sheets tab
+DEFAULT_ROW_COUNT: Final = 1000
+DEFAULT_COLUMN_COUNT: Final = 26
+
+
+def split_range(range_name: str) -> tuple[str, str | None]:
+    """Split "'Sheet 1'!A1:B2" into the sheet name and the A1 range."""
+    if range_name.startswith("'"):
+        end = 1
+        while True:
+            end = range_name.index("'", end)
+            if range_name[end + 1 : end + 2] == "'":
+                end += 2
+                continue
+            break
+        sheet_name = range_name[1:end].replace("''", "'")
+        rest = range_name[end + 1 :]
+    else:
+        sheet_name, _, rest = range_name.partition("!")
+        rest = "!" + rest if rest else ""
+    return sheet_name, rest[1:] or None
+
+
+@functools.cache
+def _private_key_pem() -> str:
+    """One RSA key for every generated key file, a 2048-bit keygen takes seconds."""
+    _, private_key = rsa.newkeys(2048)
+    return private_key.save_pkcs1().decode()
+
+
+class MockSheetsServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.05,
+        jitter: float = 0.01,
+        quota_per_minute: int | None = None,
+        quota_status: int = 429,
+    ) -> None:
+        """
+        Args:
+            host: Interface to bind.
+            port: Port to bind, 0 picks a free one.
+            latency: Base response latency in seconds.
+            jitter: Uniform random latency added on top of ``latency``.
+            quota_per_minute: Requests accepted per service account key in
+                any 60 second window, None disables the quota.
+            quota_status: Status answered over quota, 429 or 403.
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.quota_per_minute = quota_per_minute
+        self.quota_status = quota_status
+
+        # Tabs by (spreadsheet ID, sheet name), and modifiedTime per spreadsheet
+        self._sheets: dict[tuple[str, str], list[list[str]]] = {}
+        self._modified: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._windows: dict[str, deque[float]] = {}
+        self.stats: dict[str, int] = {
+            "requests": 0,
+            "throttled": 0,
+            "tokens": 0,
+            "values_get": 0,
+            "batch_get": 0,
+            "batch_update": 0,
+            "metadata": 0,
+            "cells_read": 0,
+            "cells_written": 0,
+        }
+        self.requests_per_key: dict[str, int] = {}
+
+        self._httpd = ThreadingHTTPServer((host, port), self.__handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockSheetsServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, daemon=True, name="MockSheetsServer"
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MockSheetsServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def add_sheet(self, sheet_id: str, sheet_name: str, values: list[list[str]]) -> None:
+        """Serve a tab with the given values."""
+        with self._lock:
+            self._sheets[(sheet_id, sheet_name)] = [list(row) for row in values]
+            self.__touch(sheet_id)
+
+    def add_synthetic_sheet(
+        self, sheet_id: str, sheet_name: str, rows: int, cols: int
+    ) -> None:
+        """Serve a large tab filled with "r{row}c{col}" values."""
+        self.add_sheet(
+            sheet_id,
+            sheet_name,
+            [[f"r{r}c{c}" for c in range(cols)] for r in range(rows)],
+        )
+
+    def get_sheet(self, sheet_id: str, sheet_name: str) -> list[list[str]]:
+        """Return a copy of a tab's current values."""
+        with self._lock:
+            return [list(row) for row in self._sheets[(sheet_id, sheet_name)]]
+
+    def write_keys(
+        self, keys_dir: Path, count: int = 1, prefix: str = "mock"
+    ) -> list[Path]:
+        """Write service account keys whose tokens are issued by this server.
+
+        Args:
+            keys_dir: Directory to write the JSON key files to.
+            count: Number of keys.
+            prefix: Name of the keys, the quota is counted per key name.
+
+        Returns:
+            The written key files.
+        """
+        keys_dir.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for i in range(count):
+            pem = _private_key_pem()
+            path = keys_dir / f"{prefix}-{i}.json"
+            path.write_text(
+                json.dumps(
+                    {
+                        "type": "service_account",
+                        "project_id": prefix,
+                        "private_key_id": f"{prefix}-{i}",
+                        "private_key": pem,
+                        "client_email": f"{prefix}-{i}@mock.iam.gserviceaccount.com",
+                        "client_id": str(i),
+                        "token_uri": f"{self.url}/token",
+                    }
+                ),
+                encoding="utf-8",
+            )
+            paths.append(path)
+        return paths
+
+    def __touch(self, sheet_id: str) -> None:
+        # Drive reports modifiedTime in RFC 3339 with milliseconds
+        self._modified[sheet_id] = (
+            datetime.now(timezone.utc).isoformat(timespec="microseconds")
+        )
+
+    def _admit(self, key: str) -> bool:
+        """Count a request against the key's quota. False means throttle it."""
+        with self._lock:
+            self.stats["requests"] += 1
+            self.requests_per_key[key] = self.requests_per_key.get(key, 0) + 1
+            if self.quota_per_minute is None:
+                return True
+
+            now = time.monotonic()
+            window = self._windows.setdefault(key, deque())
+            while window and window[0] <= now - 60:
+                window.popleft()
+            if len(window) >= self.quota_per_minute:
+                self.stats["throttled"] += 1
+                return False
+            window.append(now)
+            return True
+
+    def _read(self, sheet_id: str, range_name: str) -> dict:
+        """Answer one range the way values.get does, trimming empty cells."""
+        sheet_name, a1_range = split_range(range_name)
+        with self._lock:
+            grid = self._sheets.get((sheet_id, sheet_name))
+            if grid is None:
+                raise KeyError(range_name)
+
+            bounds = a1_range_to_grid_range(a1_range) if a1_range else {}
+            row_start = bounds.get("startRowIndex", 0)
+            row_count = max(len(grid), DEFAULT_ROW_COUNT)
+            if row_start >= row_count:
+                raise ValueError(
+                    f"Range ({range_name}) exceeds grid limits. Max rows: {row_count}"
+                )
+            row_end = bounds.get("endRowIndex", len(grid))
+            col_start = bounds.get("startColumnIndex", 0)
+            col_end = bounds.get("endColumnIndex")
+            values = []
+            for row in grid[row_start:row_end]:
+                cells = row[col_start:col_end]
+                while cells and cells[-1] == "":
+                    cells.pop()
+                values.append(cells)
+            while values and not values[-1]:
+                values.pop()
+            self.stats["cells_read"] += sum(len(row) for row in values)
+
+        body: dict = {"range": range_name, "majorDimension": "ROWS"}
+        if values:
+            body["values"] = values
+        return body
+
+    def _write(self, sheet_id: str, data: list[dict]) -> dict:
+        """Apply a values.batchUpdate request."""
+        updated = 0
+        with self._lock:
+            for entry in data:
+                sheet_name, a1_range = split_range(entry["range"])
+                grid = self._sheets.setdefault((sheet_id, sheet_name), [])
+                bounds = a1_range_to_grid_range(a1_range or "A1")
+                row_start = bounds.get("startRowIndex", 0)
+                col_start = bounds.get("startColumnIndex", 0)
+                for row_offset, row in enumerate(entry.get("values", [])):
+                    row_index = row_start + row_offset
+                    while len(grid) <= row_index:
+                        grid.append([])
+                    target = grid[row_index]
+                    for col_offset, value in enumerate(row):
+                        col_index = col_start + col_offset
+                        while len(target) <= col_index:
+                            target.append("")
+                        target[col_index] = "" if value is None else str(value)
+                        updated += 1
+            self.stats["cells_written"] += updated
+            self.__touch(sheet_id)
+        return {"spreadsheetId": sheet_id, "totalUpdatedCells": updated}
+
+    def _metadata(self, sheet_id: str) -> dict:
+        with self._lock:
+            sheets = [
+                {
+                    "properties": {
+                        "sheetId": index,
+                        "title": sheet_name,
+                        "gridProperties": {
+                            "rowCount": max(len(grid), DEFAULT_ROW_COUNT),
+                            "columnCount": max(
+                                max((len(row) for row in grid), default=0),
+                                DEFAULT_COLUMN_COUNT,
+                            ),
+                        },
+                    }
+                }
+                for index, ((grid_sheet_id, sheet_name), grid) in enumerate(
+                    self._sheets.items()
+                )
+                if grid_sheet_id == sheet_id
+            ]
+        return {"spreadsheetId": sheet_id, "sheets": sheets}
+
+    def _token(self, raw_body: bytes) -> dict:
+        """Issue an access token naming the key that signed the assertion."""
+        form = parse_qs(raw_body.decode())
+        assertion = form.get("assertion", [""])[0]
+        try:
+            payload = assertion.split(".")[1]
+            claims = json.loads(
+                base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+            )
+            email = claims["iss"]
+        except (IndexError, KeyError, ValueError):
+            email = "unknown"
+        with self._lock:
+            self.stats["tokens"] += 1
+        return {
+            "access_token": f"mock.{email}",
+            "expires_in": 3600,
+            "token_type": "Bearer",
+        }
+
+    def __handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+            def _reply(self, status: int, body: dict) -> None:
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _error(self, status: int, message: str, reason: str) -> None:
+                self._reply(
+                    status,
+                    {"error": {"code": status, "message": message, "status": reason}},
+                )
+
+            def _handle(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw_body = self.rfile.read(length) if length else b""
+                url = urlsplit(self.path)
+
+                if method == "POST" and url.path == "/token":
+                    self._reply(200, server._token(raw_body))
+                    return
+
+                time.sleep(server.latency + random.uniform(0, server.jitter))
+
+                authorization = self.headers.get("Authorization", "")
+                if not authorization.startswith("Bearer "):
+                    self._error(401, "Request is missing authentication", "UNAUTHENTICATED")
+                    return
+
+                if not server._admit(authorization.removeprefix("Bearer ")):
+                    metric = "Write requests" if method == "POST" else "Read requests"
+                    self._error(
+                        server.quota_status,
+                        f"Quota exceeded for quota metric '{metric}' and limit "
+                        f"'{metric} per minute per user'",
+                        "RESOURCE_EXHAUSTED",
+                    )
+                    return
+
+                try:
+                    self._route(method, url.path, parse_qs(url.query), raw_body)
+                except KeyError as e:
+                    self._error(400, f"Unable to parse range: {e}", "INVALID_ARGUMENT")
+                except ValueError as e:
+                    self._error(400, str(e), "INVALID_ARGUMENT")
+
+            def _route(
+                self, method: str, path: str, query: dict, raw_body: bytes
+            ) -> None:
+                if method == "GET" and (match := BATCH_GET_PATH_RE.match(path)):
+                    sheet_id = match.group(1)
+                    with server._lock:
+                        server.stats["batch_get"] += 1
+                    self._reply(
+                        200,
+                        {
+                            "spreadsheetId": sheet_id,
+                            "valueRanges": [
+                                server._read(sheet_id, range_name)
+                                for range_name in query.get("ranges", [])
+                            ],
+                        },
+                    )
+                elif method == "POST" and (match := BATCH_UPDATE_PATH_RE.match(path)):
+                    with server._lock:
+                        server.stats["batch_update"] += 1
+                    body = json.loads(raw_body or b"{}")
+                    self._reply(200, server._write(match.group(1), body.get("data", [])))
+                elif method == "GET" and (match := VALUES_PATH_RE.match(path)):
+                    with server._lock:
+                        server.stats["values_get"] += 1
+                    self._reply(
+                        200, server._read(match.group(1), unquote(match.group(2)))
+                    )
+                elif method == "GET" and (match := SPREADSHEET_PATH_RE.match(path)):
+                    with server._lock:
+                        server.stats["metadata"] += 1
+                    self._reply(200, server._metadata(match.group(1)))
+                elif method == "GET" and (match := DRIVE_FILE_PATH_RE.match(path)):
+                    sheet_id = match.group(1)
+                    with server._lock:
+                        modified = server._modified.get(sheet_id)
+                    if modified is None:
+                        self._error(404, f"File not found: {sheet_id}", "NOT_FOUND")
+                        return
+                    self._reply(
+                        200, {"id": sheet_id, "name": sheet_id, "modifiedTime": modified}
+                    )
+                else:
+                    self._error(404, f"Not found: {path}", "NOT_FOUND")
+
+            def do_GET(self) -> None:
+                self._handle("GET")
+
+            def do_POST(self) -> None:
+                self._handle("POST")
+
+        return Handler
@@ -0,0 +1,52 @@
+"""Change markers of spreadsheets, used to skip reloading unchanged ones.
+
+Before re-fetching the tabs of a spreadsheet, CacheSheet.refresh_many() asks a
+RevisionSource for a cheap marker of the spreadsheet's current state. When it
+matches the marker recorded at the last load, the data fetch is skipped.
+
+Classes:
+    RevisionSource: Interface of change marker providers.
+    DriveRevisionSource: Reads the spreadsheet's modified time from Drive.
+
+Example:
+    >>> class FixedRevisions:
+    ...     def __init__(self, revisions):
+    ...         self.revisions = revisions
+    ...     def get_revision(self, sheet):
+    ...         return self.revisions.get(sheet.sheet_id)
+    >>> manager = GSheetCacheManager(config, revision_source=FixedRevisions({}))
+"""
+
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from .sheet import CacheSheet
+
+
+class RevisionSource(Protocol):
+    """Provides a marker that changes whenever a spreadsheet changes."""
+
+    def get_revision(self, sheet: "CacheSheet") -> str | None:
+        """Return the current change marker of the sheet's spreadsheet.
+
+        Args:
+            sheet: A cached tab of the spreadsheet, whose credentials may be
+                used for the request.
+
+        Returns:
+            The marker, or None if it is unknown, in which case the
+            spreadsheet is reloaded.
+        """
+        ...
+
+
+class DriveRevisionSource:
+    """Uses the spreadsheet's Drive modifiedTime as change marker.
+
+    It costs one small Drive API request per spreadsheet instead of
+    downloading every tab.
+    """
+
+    def get_revision(self, sheet: "CacheSheet") -> str | None:
+        """Return the spreadsheet's modifiedTime, see CacheSheet.fetch_revision()."""
+        return sheet.fetch_revision()
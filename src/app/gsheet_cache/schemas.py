@@ -5,6 +5,8 @@ primarily for representing Google Sheets data structures.
 
 Classes:
     GridRange: Represents a rectangular range of cells in a Google Sheet.
+    SnapshotHeader: Describes the content of a binary sheet snapshot.
+    RowDiff: Rows that differ between two loads of a sheet.
 
 Example:
     >>> from gsheet_cache.schemas import GridRange
@@ -18,7 +20,7 @@ Example:
     Range: rows 0-10
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class GridRange(BaseModel):
@@ -56,8 +58,12 @@ class GridRange(BaseModel):
         - Indices are 0-based
         - End indices are exclusive
         - None values represent unbounded ranges
+
+        Instances are immutable, so parsed ranges can be cached and shared.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     startRowIndex: int | None = Field(
         default=None,
         description="Start row (inclusive, 0-based). None for first row."
@@ -74,3 +80,61 @@ class GridRange(BaseModel):
         default=None,
         description="End column (exclusive, 0-based). None for last column."
     )
+
+
+class SnapshotHeader(BaseModel):
+    """Header of a binary sheet snapshot (see the snapshot module).
+
+    Attributes:
+        sheet_id: The Google Sheets spreadsheet ID.
+        sheet_name: The name of the sheet/tab.
+        fetched_at: Unix time at which the values were fetched from the sheet.
+        revision: Change marker of the spreadsheet at fetch time, if known.
+        rows: Number of rows in the snapshot.
+        cols: Length of the longest row.
+        body_size: Size in bytes of the encoded cells following the header.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    sheet_id: str = Field(description="Spreadsheet ID")
+    sheet_name: str = Field(description="Sheet/tab name")
+    fetched_at: float = Field(description="Unix time of the fetch")
+    revision: str | None = Field(default=None, description="Change marker at fetch time")
+    rows: int = Field(ge=0, description="Number of rows")
+    cols: int = Field(ge=0, description="Length of the longest row")
+    body_size: int = Field(ge=0, description="Size of the encoded cells in bytes")
+
+
+class RowDiff(BaseModel):
+    """Rows that differ between two loads of a sheet.
+
+    Rows are compared by position, so inserting a row reports every row
+    below it as changed. All indices are 0-based.
+
+    Attributes:
+        changed: Rows present in both loads with different values.
+        added: Rows past the end of the previous load.
+        removed: Rows past the end of the new load.
+
+    Example:
+        >>> diff = sheet.last_diff
+        >>> for row in diff.rows:
+        ...     reprocess(row + 1)
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    changed: list[int] = Field(default_factory=list, description="Rows with new values")
+    added: list[int] = Field(default_factory=list, description="Rows that were appended")
+    removed: list[int] = Field(default_factory=list, description="Rows that were cut off")
+
+    @property
+    def rows(self) -> list[int]:
+        """Rows of the new load that need processing: changed and added."""
+        return self.changed + self.added
+
+    @property
+    def is_empty(self) -> bool:
+        """True if both loads hold the same rows."""
+        return not (self.changed or self.added or self.removed)
@@ -18,25 +18,45 @@ Example:
     >>> sheet.flush_to_sheet(["A1"])
 """
 
-from typing import Any, MutableMapping
+from typing import Any, Callable, Iterable, Iterator, MutableMapping, Sequence
 
 from pathlib import Path
 
+from contextlib import contextmanager
+
 import csv
-import random
+import json
+import os
 import logging
+import threading
 import time
 
-from gspread import service_account
-from gspread.utils import ValueInputOption, absolute_range_name, a1_to_rowcol
+from array import array
+
+from gspread.utils import ValueInputOption, absolute_range_name, rowcol_to_a1
 from gspread.http_client import HTTPClient
 from gspread.exceptions import APIError
 
 from .config import GSheetCacheConfig
-from .utils import a1_range_to_grid_range_custom
+from .grid import diff_rows, intern_rows, row_hashes, sparse_size
+from .keys import KeyPool
+from .revisions import RevisionSource
+from .schemas import GridRange, RowDiff
+from .snapshot import read_snapshot, write_snapshot
+from .views import ColumnView
+from .utils import (
+    a1_range_to_grid_range_custom,
+    a1_to_indices,
+    coalesce_cells,
+    grid_range_to_a1,
+    is_bounded,
+)
 
 logger = logging.getLogger(__name__)
 
+# Value of a watched cell that is not in memory, e.g. outside sparse ranges
+_UNKNOWN = object()
+
 
 class CacheSheet:
     """A cached interface to Google Sheets.
@@ -46,9 +66,15 @@ class CacheSheet:
     remote sheet.
 
     Features:
-    - Random key selection from available service account keys
-    - Automatic key rotation on rate limits or API errors
-    - Retry logic with exponential backoff
+    - Requests spread over all service account keys by a shared,
+      quota-aware key pool (see KeyPool)
+    - Rate limited keys cool down while retries go to other keys
+    - Safe to share between threads: edits replace whole rows under a
+      writer lock, so readers never see a row half-updated
+    - Deduplicated grids: rows are tuples sharing one string per distinct value,
+      and a grid can be evicted to disk and is reloaded on the next read
+    - Change tracking: each load is diffed row by row against the previous
+      one (last_diff), and listeners are told about changed rows and cells
 
     Attributes:
         sheet_id: The Google Sheets spreadsheet ID.
@@ -56,7 +82,15 @@ class CacheSheet:
         config: Configuration object containing cache and keys directories.
         cache_file: Path to the local CSV cache file.
         keys: List of available service account JSON key files.
+        key_pool: The KeyPool shared by sheets using the same keys directory.
         max_retries: Maximum number of retry attempts on API errors (default: 3).
+        page_rows: Number of rows per request when the full tab is loaded,
+            or None to load it with a single request.
+        grid_bytes: Estimated memory of the cached values, kept while the
+            grid is evicted.
+        last_diff: Rows that changed with the last load of the full tab,
+            every row counting as added on the first one. None for sheets
+            loaded sparsely or from a snapshot and not refreshed yet.
     """
 
     def __init__(
@@ -65,6 +99,8 @@ class CacheSheet:
         sheet_name: str,
         config: GSheetCacheConfig,
         max_retries: int = 3,
+        values: list[list[str]] | None = None,
+        page_rows: int | None = None,
     ) -> None:
         """Initialize a CacheSheet instance.
 
@@ -73,57 +109,390 @@ class CacheSheet:
             sheet_name: The name of the sheet/tab to cache.
             config: Configuration containing cache and keys directory paths.
             max_retries: Maximum number of retry attempts on API errors.
+            values: Already fetched values for the tab. When given, the
+                sheet is not downloaded again.
+            page_rows: Download the full tab in pages of this many rows
+                instead of a single request.
 
         Raises:
             FileNotFoundError: If the keys directory does not exist.
             ValueError: If no valid key files are found.
         """
+        self.__setup(sheet_id, sheet_name, config, max_retries)
+        self.page_rows = page_rows
+
+        if values is None:
+            self.__load_values_from_sheet()
+        else:
+            self.__store_values(values)
+
+    def __setup(
+        self,
+        sheet_id: str,
+        sheet_name: str,
+        config: GSheetCacheConfig,
+        max_retries: int,
+    ) -> None:
+        """Set up attributes, cache file and keys without loading any values."""
         self.sheet_id = sheet_id
         self.config = config
         self.sheet_name = sheet_name
         self.cache_path = config.cache_dir
         self.max_retries = max_retries
-        self._http_client: HTTPClient | None = None
-        self._current_key_index: int | None = None
-        self._failed_keys: set[int] = set()
-        self._cache_data: list[list[str]] | None = None
-        self._dirty: bool = False
+        # Index of the key leased by the current thread's request
+        self._active_key = threading.local()
+        self._cache_data: list[Sequence[str]] | None = None
+        # Bumped whenever a new grid is swapped in, and recorded when it is
+        # written to disk, so eviction knows if the files are up to date
+        self._grid_version = 0
+        self._persisted_version = 0
+        self.grid_bytes = 0
+        # Edits not written to the journal yet, by 0-based (row, col)
+        self._journal_pending: dict[tuple[int, int], str] = {}
+        self._journal_entries = 0
+        # Sparse mode: only these ranges were fetched, values keyed by (row, col)
+        self._sparse_data: dict[tuple[int, int], str] | None = None
+        self._sparse_ranges: list[GridRange] = []
+        # Serializes CSV snapshot writes, journal appends and compactions
+        self._persist_lock = threading.RLock()
+        # At most one background writer per sheet, loads arriving while it
+        # runs only ask it to go again (see __persist_in_background())
+        self._persist_thread: threading.Thread | None = None
+        self._persist_requested = False
+        self._persist_state_lock = threading.Lock()
+        # Guards snapshot swaps against concurrent edits
+        self._edit_lock = threading.RLock()
+        # Lets a single thread download the full tab after a sparse miss,
+        # taken without holding _edit_lock
+        self._load_lock = threading.Lock()
+        # Local edits by 0-based (row, col): value and when it was flushed
+        # to the sheet (None while pending), re-applied on refresh
+        self._local_edits: dict[tuple[int, int], tuple[str, float | None]] = {}
+        # Last value known to be in the sheet for edited cells, so edits that
+        # restore it are not written
+        self._remote_values: dict[tuple[int, int], str] = {}
+        # Last time the snapshot was fetched or found current by a revision
+        # check, refresh intervals and max ages count from here
+        self.loaded_at: float | None = None
+        # Full loads of very large tabs go page by page, bounding the size
+        # of each response held in memory next to the grid
+        self.page_rows: int | None = None
+        # Grid row count seen by the last paged load, reused instead of
+        # reading the sheet metadata again on every refresh
+        self._grid_rows: int | None = None
+        # Change marker of the spreadsheet when the snapshot was fetched
+        self.revision: str | None = None
+        # Parsed numeric cells of the current snapshot, keyed by (row, col, type)
+        self._typed: dict[tuple[int, int, type], float | int | None] = {}
+        # Hash of every row of the full grid, kept up to date by local edits
+        # so a reload only reports rows that differ from what was served
+        self._row_hashes: array | None = None
+        self.last_diff: RowDiff | None = None
+        self._row_listeners: list[Callable[["CacheSheet", RowDiff], None]] = []
+        # Watched cells by 0-based (row, col): callbacks and last loaded value
+        self._cell_watchers: dict[
+            tuple[int, int],
+            list[Callable[["CacheSheet", dict[tuple[int, int], str | None]], None]],
+        ] = {}
+        self._watched_values: dict[tuple[int, int], Any] = {}
 
         self.__init_cache_file()
         self.__load_keys()
-        self.__load_values_from_sheet()
 
-    def __check_keys_dir(self) -> None:
-        """Raise an error if the keys directory does not exist."""
-        if not self.config.keys_dir.exists():
-            raise FileNotFoundError(
-                f"Keys directory does not exist: {self.config.keys_dir}"
-            )
+    @property
+    def is_sparse(self) -> bool:
+        """True if only some ranges of the tab are cached (see load_many)."""
+        return self._sparse_data is not None
 
-    def __load_keys(self) -> None:
-        """Load API keys from the keys directory.
+    @property
+    def sparse_ranges(self) -> list[GridRange]:
+        """The ranges fetched in sparse mode, empty if the full tab is cached."""
+        return list(self._sparse_ranges)
+
+    @property
+    def is_resident(self) -> bool:
+        """False while the grid is evicted to disk (see evict())."""
+        return self._cache_data is not None or self._sparse_data is not None
+
+    def covers(self, a1_range: str) -> bool:
+        """Return True if a range can be read without fetching anything.
+
+        Args:
+            a1_range: Range in A1 notation (e.g., "B5", "A1:C10").
+        """
+        if self._sparse_data is None:
+            return True
+        return self.__sparse_covers(a1_range_to_grid_range_custom(a1_range))
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was fetched or found current by a revision check."""
+        if self.loaded_at is None:
+            return float("inf")
+        return time.monotonic() - self.loaded_at
+
+    def refresh(self) -> None:
+        """Re-fetch the tab and swap the new snapshot in.
+
+        Sparse sheets re-fetch only their ranges. Reads keep being served
+        from the current snapshot until the new one is in place.
+
+        Raises:
+            APIError: If the API call fails after all retries.
+        """
+        self.refresh_many([self])
+
+    @classmethod
+    def load_many(
+        cls,
+        sheet_id: str,
+        sheet_names: list[str],
+        config: GSheetCacheConfig,
+        max_retries: int = 3,
+        sparse_ranges: dict[str, list[GridRange]] | None = None,
+    ) -> list["CacheSheet"]:
+        """Load several tabs of one spreadsheet with a single values batch-get.
+
+        Tabs listed in ``sparse_ranges`` are loaded in sparse mode: only the
+        given ranges are fetched, and reads outside them transparently load
+        the full tab first.
+
+        Args:
+            sheet_id: The Google Sheets spreadsheet ID.
+            sheet_names: Names of the tabs to load.
+            config: Configuration containing cache and keys directory paths.
+            max_retries: Maximum number of retry attempts on API errors.
+            sparse_ranges: Bounded ranges to fetch per tab name, for tabs
+                that should be loaded sparsely.
+
+        Returns:
+            One CacheSheet per tab, in the order of ``sheet_names``.
+
+        Raises:
+            APIError: If the batch-get fails after all retries.
+        """
+        sheets = []
+        for sheet_name in sheet_names:
+            sheet = cls.__new__(cls)
+            sheet.__setup(sheet_id, sheet_name, config, max_retries)
+            sheets.append(sheet)
+
+        cls.__batch_load(sheets, sparse_ranges or {})
+
+        logger.info(f"Loaded {len(sheets)} tab(s) of {sheet_id} with one batch request")
+        return sheets
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        sheet_id: str,
+        sheet_name: str,
+        config: GSheetCacheConfig,
+        max_retries: int = 3,
+    ) -> "CacheSheet | None":
+        """Load a tab from its last binary snapshot, without any API call.
+
+        The snapshot written by the previous process is memory-mapped and
+        the edits journaled after it are replayed on top, so reads are
+        served right away. Replayed edits count as not flushed yet: they are
+        listed by dirty_cells, sent by the next flush_to_sheet() and kept
+        over refreshes until then. The sheet keeps the snapshot's fetch time as
+        ``loaded_at``, callers should refresh() it when it is too old.
+
+        Args:
+            sheet_id: The Google Sheets spreadsheet ID.
+            sheet_name: The name of the sheet/tab.
+            config: Configuration containing cache and keys directory paths.
+            max_retries: Maximum number of retry attempts on API errors.
+
+        Returns:
+            The CacheSheet, or None if there is no usable snapshot.
 
         Raises:
             FileNotFoundError: If the keys directory does not exist.
-            ValueError: If no valid JSON key files are found.
+            ValueError: If no valid key files are found.
+        """
+        sheet = cls.__new__(cls)
+        sheet.__setup(sheet_id, sheet_name, config, max_retries)
+
+        try:
+            header, rows = read_snapshot(sheet.snapshot_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring snapshot {sheet.snapshot_file.name}: {e}")
+            return None
+
+        if (header.sheet_id, header.sheet_name) != (sheet_id, sheet_name):
+            logger.warning(f"Ignoring snapshot {sheet.snapshot_file.name} of another sheet")
+            return None
+
+        # A new process, so every journaled edit may still have to reach the sheet
+        sheet._journal_entries = sheet.__replay_journal(rows, restore_edits=True)
+        sheet._cache_data, sheet.grid_bytes = intern_rows(rows)
+        # Baseline for the diff of the first refresh
+        sheet._row_hashes = row_hashes(sheet._cache_data)
+        sheet.revision = header.revision
+        # Keep the age of the data across the restart
+        sheet.loaded_at = time.monotonic() - max(time.time() - header.fetched_at, 0.0)
+
+        logger.info(
+            f"Loaded {sheet_id}_{sheet_name} from snapshot "
+            f"({header.rows}x{header.cols}, {sheet.age:.0f}s old)"
+        )
+        return sheet
+
+    @classmethod
+    def refresh_many(
+        cls,
+        sheets: list["CacheSheet"],
+        revisions: RevisionSource | None = None,
+    ) -> bool:
+        """Re-fetch several tabs of one spreadsheet with a single batch-get.
+
+        Each sheet keeps its mode: sparse sheets re-fetch their ranges, full
+        sheets the whole tab. Readers keep being served from the current
+        snapshot until the new one is swapped in, and local edits that have
+        not reached the sheet yet are carried over.
+
+        When ``revisions`` is given, the spreadsheet's change marker is read
+        first. If every sheet was loaded at that same revision, nothing is
+        fetched and the sheets count as refreshed: their ``loaded_at`` moves
+        to the time of the check. If the marker cannot be read, the tabs
+        are fetched.
+
+        Args:
+            sheets: Loaded CacheSheet instances sharing the same sheet_id.
+            revisions: Source of the spreadsheet's change marker.
+
+        Returns:
+            True if the tabs were re-fetched, False if they were unchanged.
+
+        Raises:
+            APIError: If the batch-get fails after all retries.
         """
-        self.__check_keys_dir()
+        if not sheets:
+            return False
+
+        # Read before fetching, so changes made during the fetch show up as
+        # a new revision next time
+        checked_at = time.monotonic()
+        revision = revisions.get_revision(sheets[0]) if revisions else None
+        if revision is not None and all(
+            sheet.revision == revision for sheet in sheets
+        ):
+            for sheet in sheets:
+                with sheet._edit_lock:
+                    sheet.loaded_at = checked_at
+            return False
+
+        # Paged tabs would defeat their paging inside one batch response
+        paged = [sheet for sheet in sheets if sheet.page_rows and not sheet.is_sparse]
+        batched = [sheet for sheet in sheets if sheet not in paged]
+        if batched:
+            cls.__batch_load(
+                batched,
+                {
+                    sheet.sheet_name: list(sheet._sparse_ranges)
+                    for sheet in batched
+                    if sheet.is_sparse
+                },
+                revision,
+            )
+        for sheet in paged:
+            sheet.__load_values_from_sheet(revision, revisions)
+        return True
 
-        keys_dir = self.config.keys_dir
-        self.keys = [
-            f for f in keys_dir.iterdir() if f.is_file() and f.suffix == ".json"
-        ]
+    def fetch_revision(self) -> str | None:
+        """Return the spreadsheet's Drive modifiedTime, a cheap change marker.
 
-        if not self.keys:
-            raise ValueError(f"No JSON key files found in {keys_dir}")
+        The request is not retried: a failed check only means the
+        spreadsheet is reloaded.
 
-        logger.info(f"Loaded {len(self.keys)} service account key(s)")
+        Returns:
+            The modifiedTime, or None if it could not be read.
+        """
+        try:
+            with self.__use_key():
+                metadata = self.__get_http_client().get_file_drive_metadata(
+                    self.sheet_id
+                )
+        except APIError as e:
+            logger.warning(f"Could not read the revision of {self.sheet_id}: {e}")
+            return None
+        return (metadata or {}).get("modifiedTime")
+
+    @classmethod
+    def __batch_load(
+        cls,
+        sheets: list["CacheSheet"],
+        sparse_ranges: dict[str, list[GridRange]],
+        revision: str | None = None,
+    ) -> None:
+        """Fetch the given tabs of one spreadsheet and store their values.
+
+        Args:
+            sheets: CacheSheet instances sharing the same sheet_id.
+            sparse_ranges: Bounded ranges to fetch per tab name, for tabs
+                that should be loaded sparsely.
+            revision: Change marker of the spreadsheet read before the fetch.
+        """
+        sheet_id = sheets[0].sheet_id
+        ranges: list[str] = []
+        for sheet in sheets:
+            if sheet.sheet_name in sparse_ranges:
+                ranges.extend(
+                    absolute_range_name(sheet.sheet_name, grid_range_to_a1(grid_range))
+                    for grid_range in sparse_ranges[sheet.sheet_name]
+                )
+            else:
+                ranges.append(absolute_range_name(sheet.sheet_name))
+
+        # The first sheet's key handling drives the request for the whole group
+        loader = sheets[0]
+
+        def _fetch():
+            gsheet_http_client = loader.__get_http_client()
+            return gsheet_http_client.values_batch_get(id=sheet_id, ranges=ranges)
+
+        fetched_at = time.monotonic()
+        res = loader.__execute_with_retry(_fetch)
+
+        if not res or len(res.get("valueRanges", [])) != len(ranges):
+            raise ValueError("Failed to batch fetch data from Google Sheet")
+
+        value_ranges = iter(res["valueRanges"])
+        for sheet in sheets:
+            if sheet.sheet_name in sparse_ranges:
+                grid_ranges = sparse_ranges[sheet.sheet_name]
+                sheet.__store_sparse_values(
+                    grid_ranges,
+                    [next(value_ranges).get("values", []) for _ in grid_ranges],
+                    fetched_at,
+                    revision,
+                )
+            else:
+                sheet.__store_values(
+                    next(value_ranges).get("values", []), fetched_at, revision
+                )
+
+    def __load_keys(self) -> None:
+        """Join the key pool shared by every sheet using the same keys directory.
+
+        Raises:
+            FileNotFoundError: If the keys directory does not exist.
+            ValueError: If no valid JSON key files are found.
+        """
+        self.key_pool = KeyPool.shared(self.config)
+        self.keys = self.key_pool.keys
 
     def __init_cache_file(self) -> None:
-        """Initialize the cache file path."""
+        """Initialize the cache file, snapshot and edit journal paths."""
         self.cache_file: Path = (
             self.cache_path / f"{self.sheet_id}_{self.sheet_name}.csv"
         )
+        self.journal_file: Path = self.cache_file.with_suffix(".journal")
+        self.snapshot_file: Path = self.cache_file.with_suffix(".snap")
 
     def __ensure_cache_dir_exists(self) -> None:
         """Ensure the cache directory exists.
@@ -137,52 +506,36 @@ class CacheSheet:
             )
 
     def __get_http_client(self) -> HTTPClient:
-        """Get or create the HTTP client for Google Sheets API.
+        """Get the HTTP client of the key leased for the current request.
 
         Returns:
             An authenticated HTTPClient instance.
         """
-        if self._http_client is None:
-            self.__select_random_key()
-            assert self._current_key_index is not None
-            key_path = self.keys[self._current_key_index]
-            logger.info(f"Using key: {key_path.name}")
-            self._http_client = service_account(filename=str(key_path)).http_client
-        return self._http_client
-
-    def __select_random_key(self) -> None:
-        """Select a random key from available keys, excluding failed ones."""
-        available_indices = [
-            i for i in range(len(self.keys)) if i not in self._failed_keys
-        ]
-
-        if not available_indices:
-            # Reset failed keys if all have failed
-            logger.warning("All keys have failed, resetting failed keys list")
-            self._failed_keys.clear()
-            available_indices = list(range(len(self.keys)))
-
-        self._current_key_index = random.choice(available_indices)
-
-    def __rotate_key(self) -> None:
-        """Rotate to a different key after a failure.
-
-        This method marks the current key as failed and selects a new one.
-        """
-        if self._current_key_index is not None:
-            self._failed_keys.add(self._current_key_index)
-            logger.warning(
-                f"Marking key {self.keys[self._current_key_index].name} as failed"
-            )
+        index = getattr(self._active_key, "index", None)
+        assert index is not None, "requests must be made inside __use_key()"
+        return self.key_pool.client(index)
+
+    @contextmanager
+    def __use_key(self) -> Iterator[int]:
+        """Lease the least loaded key of the pool for the requests made inside.
 
-        # Reset HTTP client to force new connection with new key
-        self._http_client = None
-        self.__select_random_key()
+        A rate limited key is put in cooldown so the next lease picks
+        another one.
 
-        assert self._current_key_index is not None
-        new_key_path = self.keys[self._current_key_index]
-        logger.info(f"Rotating to new key: {new_key_path.name}")
-        self._http_client = service_account(filename=str(new_key_path)).http_client
+        Yields:
+            The index of the leased key.
+        """
+        index = self.key_pool.acquire()
+        self._active_key.index = index
+        try:
+            yield index
+        except APIError as e:
+            if self.__is_rate_limit_error(e):
+                self.key_pool.cool_down(index)
+            raise
+        finally:
+            self._active_key.index = None
+            self.key_pool.release(index)
 
     def __is_rate_limit_error(self, error: APIError) -> bool:
         """Check if an API error is due to rate limiting.
@@ -215,6 +568,10 @@ class CacheSheet:
     def __execute_with_retry(self, operation, *args, **kwargs):
         """Execute an operation with automatic retry and key rotation on failure.
 
+        Every attempt leases a key from the pool. A rate limited key cools
+        down and the retry goes to another key, waiting only if no key has
+        quota left.
+
         Args:
             operation: The function to execute.
             *args: Positional arguments for the operation.
@@ -230,7 +587,8 @@ class CacheSheet:
 
         for attempt in range(self.max_retries):
             try:
-                return operation(*args, **kwargs)
+                with self.__use_key():
+                    return operation(*args, **kwargs)
             except APIError as e:
                 last_error = e
                 if self.__is_rate_limit_error(e):
@@ -239,13 +597,8 @@ class CacheSheet:
                     )
 
                     if attempt < self.max_retries - 1:
-                        # Rotate key and retry
-                        self.__rotate_key()
-
-                        # Exponential backoff
-                        wait_time = 2**attempt
-                        logger.info(f"Waiting {wait_time}s before retry...")
-                        time.sleep(wait_time)
+                        # The key pool hands out another key, or waits for one
+                        logger.info("Retrying with another key...")
                     else:
                         logger.error("Max retries reached, all keys exhausted")
                         raise
@@ -258,37 +611,290 @@ class CacheSheet:
         if last_error:
             raise last_error
 
-    def __read_cache_data(self) -> list[list[str]]:
+    def __read_cache_data(self, reference: str | tuple[int, int]) -> list[Sequence[str]]:
         """Read all data from the cache file with in-memory caching.
 
+        A sparse sheet read outside its ranges is loaded in full first. The
+        download runs without the edit lock, reads of the sparse ranges are
+        served meanwhile and the full grid is swapped in once fetched.
+
+        Args:
+            reference: The range or 0-based (row, col) being read, logged
+                when it misses the sparse ranges.
+
         Returns:
-            A 2D list of strings representing the cached sheet data.
+            A list of rows of strings representing the cached sheet data.
 
         Raises:
             FileNotFoundError: If the cache directory does not exist.
         """
-        if self._cache_data is None:
-            self.__ensure_cache_dir_exists()
-
-            with self.cache_file.open("r", newline="", encoding="utf-8") as f:
-                reader = csv.reader(f)
-                self._cache_data = list(reader)
+        data = self._cache_data
+        if data is not None and self._sparse_data is None:
+            return data
+
+        while True:
+            if self._sparse_data is not None:
+                # Only one thread downloads, the others wait and reuse its result
+                with self._load_lock:
+                    if self._sparse_data is not None:
+                        if isinstance(reference, tuple):
+                            reference = rowcol_to_a1(reference[0] + 1, reference[1] + 1)
+                        logger.warning(
+                            f"{reference} is outside the sparse ranges of "
+                            f"{self.sheet_id}_{self.sheet_name}, loading full tab"
+                        )
+                        self.__load_values_from_sheet()
+
+            with self._edit_lock:
+                if self._sparse_data is not None:
+                    # A sparse refresh swapped its ranges back in meanwhile
+                    continue
+
+                if self._cache_data is None:
+                    self.__ensure_cache_dir_exists()
+
+                    data = self.__read_snapshot_rows()
+                    if data is None:
+                        with self.cache_file.open("r", newline="", encoding="utf-8") as f:
+                            reader = csv.reader(f)
+                            data = list(reader)
+                    self.__replay_journal(data)
+                    self._cache_data, self.grid_bytes = intern_rows(data)
+
+                return self._cache_data
+
+    def __read_snapshot_rows(self) -> list[list[str]] | None:
+        """Read the rows of the binary snapshot if it matches the CSV cache.
+
+        The snapshot is written right after the CSV by each compaction, so
+        one older than the CSV missed the last compaction and is ignored.
 
-        return self._cache_data
+        Returns:
+            The rows, or None if the CSV cache has to be parsed instead.
+        """
+        try:
+            if self.snapshot_file.stat().st_mtime_ns < self.cache_file.stat().st_mtime_ns:
+                return None
+            header, rows = read_snapshot(self.snapshot_file)
+        except (OSError, ValueError):
+            return None
+        if (header.sheet_id, header.sheet_name) != (self.sheet_id, self.sheet_name):
+            return None
+        return rows
 
-    def __write_cache_data(self, data: list[list[str]]) -> None:
-        """Write data to the cache file.
+    def __write_cache_file(self, rows: list[list[str]]) -> None:
+        """Atomically replace the CSV cache file with rows.
 
         Args:
-            data: A 2D list of strings to write to the cache.
+            rows: A 2D list of strings to write.
         """
-        with self.cache_file.open("w", newline="", encoding="utf-8") as f:
+        tmp_file = self.cache_file.with_suffix(".csv.tmp")
+        with tmp_file.open("w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
-            writer.writerows(data)
+            writer.writerows(rows)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.cache_file)
+
+    def __append_journal(self, edits: dict[tuple[int, int], str]) -> None:
+        """Append cell edits to the journal in a single write.
+
+        Each edit is one JSON line ``[row, col, value]``. A line cut short by
+        a crash is ignored on replay, so a batch is either fully applied or
+        dropped together with the edits after it.
+
+        Args:
+            edits: Values by 0-based (row, col).
+        """
+        lines = "".join(
+            json.dumps([row, col, value], ensure_ascii=False) + "\n"
+            for (row, col), value in edits.items()
+        )
+        with self.journal_file.open("a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_entries += len(edits)
+
+    def __write_journal(self, edits: dict[tuple[int, int], str]) -> None:
+        """Atomically replace the journal with the given edits.
+
+        Args:
+            edits: Values by 0-based (row, col).
+        """
+        tmp_file = self.cache_file.with_suffix(".journal.tmp")
+        with tmp_file.open("w", encoding="utf-8") as f:
+            f.writelines(
+                json.dumps([row, col, value], ensure_ascii=False) + "\n"
+                for (row, col), value in edits.items()
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.journal_file)
+
+    def __replay_journal(
+        self, data: list[list[str]], restore_edits: bool = False
+    ) -> int:
+        """Apply the journaled edits on top of rows read from a snapshot.
+
+        Args:
+            data: The 2D list read from the CSV cache or snapshot file.
+            restore_edits: Also record the edits as local edits not flushed
+                to the sheet yet, for a sheet that knows none of them.
+
+        Returns:
+            The number of edits applied.
+        """
+        if not self.journal_file.exists():
+            return 0
+
+        applied = 0
+        with self.journal_file.open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    row, col, value = json.loads(line)
+                except ValueError:
+                    logger.warning(
+                        f"Ignoring truncated entry in {self.journal_file.name}"
+                    )
+                    break
+                self.__ensure_cell_exists(data, row, col)
+                data[row][col] = value
+                if restore_edits:
+                    self._local_edits[(row, col)] = (value, None)
+                applied += 1
+        return applied
+
+    def __compact(self) -> None:
+        """Write the in-memory grid as the new snapshots and empty the journal.
+
+        The grid is written both to the CSV cache file and to the binary
+        snapshot used for warm starts (see from_snapshot()). Edits not
+        flushed to the sheet yet are journaled again on top of it, so a
+        restart still knows they have to be sent.
+        """
+        with self._persist_lock:
+            with self._edit_lock:
+                if self._cache_data is None:
+                    return
+                # Rows are replaced on edit, never mutated, so a copy of the
+                # row list is a consistent snapshot
+                rows = list(self._cache_data)
+                pending = self._journal_pending
+                self._journal_pending = {}
+                dirty = {
+                    cell: value
+                    for cell, (value, flushed_at) in self._local_edits.items()
+                    if flushed_at is None
+                }
+                fetched_at = time.time() - (0.0 if self.loaded_at is None else self.age)
+                revision = self.revision
+                version = self._grid_version
+
+            try:
+                self.__write_cache_file(rows)
+                try:
+                    write_snapshot(
+                        self.snapshot_file,
+                        self.sheet_id,
+                        self.sheet_name,
+                        fetched_at,
+                        rows,
+                        revision=revision,
+                    )
+                except ValueError as e:
+                    # The journal is emptied below, an older snapshot would
+                    # come back without the edits it held
+                    logger.warning(f"No warm start snapshot for {self.sheet_name}: {e}")
+                    self.snapshot_file.unlink(missing_ok=True)
+                if dirty:
+                    self.__write_journal(dirty)
+                else:
+                    self.journal_file.unlink(missing_ok=True)
+            except OSError:
+                with self._edit_lock:
+                    for key, value in pending.items():
+                        self._journal_pending.setdefault(key, value)
+                raise
+            self._journal_entries = len(dirty)
+            self._persisted_version = version
+
+    def __persist_in_background(self) -> None:
+        """Write freshly loaded rows to the CSV cache without blocking readers.
+
+        Loads arriving while the sheet's writer is busy do not start another
+        one, the writer goes again once done. However many refreshes come
+        in, at most one write is queued and it stores the latest grid.
+        """
+        with self._persist_state_lock:
+            self._persist_requested = True
+            if self._persist_thread is not None:
+                return
+            self._persist_thread = threading.Thread(
+                target=self.__persist_worker,
+                daemon=True,
+                name=f"CacheSheetPersist-{self.sheet_name}",
+            )
+            thread = self._persist_thread
+        thread.start()
+
+    def __persist_worker(self) -> None:
+        while True:
+            with self._persist_state_lock:
+                if not self._persist_requested:
+                    self._persist_thread = None
+                    return
+                self._persist_requested = False
+
+            # An eviction or flush may have written this grid already
+            if self._persisted_version == self._grid_version:
+                continue
+            try:
+                self.__compact()
+            except OSError as e:
+                logger.warning(f"Could not persist {self.cache_file.name}: {e}")
+
+    def wait_persisted(self, timeout: float | None = None) -> None:
+        """Block until the background write of the last load has finished.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait
+                indefinitely.
+        """
+        thread = self._persist_thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+
+    def evict(self) -> bool:
+        """Drop the in-memory grid, the next read reloads it from disk.
 
-        # Update in-memory cache after writing to disk
-        self._cache_data = data
-        self._dirty = False
+        Pending edits are journaled and a grid that was never written is
+        compacted to disk first, so the reload gets the same values back.
+        The reload maps the binary snapshot (or parses the CSV cache) and
+        replays the journal, without any API call. Readers already holding
+        rows or a ColumnView keep them. Sparse sheets are not evicted.
+
+        Returns:
+            True if the grid was dropped.
+        """
+        with self._persist_lock:
+            if self._cache_data is None:
+                return False
+            try:
+                self.flush_cache()
+                if self._persisted_version != self._grid_version:
+                    self.__compact()
+            except OSError as e:
+                logger.warning(f"Could not evict {self.cache_file.name}: {e}")
+                return False
+
+            with self._edit_lock:
+                # Edits or a new grid may have come in since the flush
+                if self._journal_pending or self._persisted_version != self._grid_version:
+                    return False
+                self._cache_data = None
+                self._typed = {}
+        return True
 
     def __ensure_cell_exists(self, data: list[list[str]], row: int, col: int) -> None:
         """Ensure the data structure is large enough for the given cell.
@@ -303,20 +909,66 @@ class CacheSheet:
         while len(data[row]) <= col:
             data[row].append("")
 
-    def __a1_to_indices(self, cell: str) -> tuple[int, int]:
-        """Convert A1 notation to 0-based row and column indices.
+    def __set_cell(
+        self, data: list[Sequence[str]], row: int, col: int, value: str
+    ) -> None:
+        """Set a cell by replacing its row with an updated copy.
 
-        Args:
-            cell: A cell reference in A1 notation (e.g., "A1", "B5").
+        Readers holding the previous row keep a consistent view of it.
+        Must be called with ``_edit_lock`` held.
 
-        Returns:
-            A tuple of (row_index, col_index) in 0-based indexing.
+        Args:
+            data: The 2D list to update.
+            row: The 0-based row index.
+            col: The 0-based column index.
+            value: The new value.
         """
-        row, col = a1_to_rowcol(cell)
-        return row - 1, col - 1
+        while len(data) <= row:
+            data.append(())
+        new_row = list(data[row])
+        if len(new_row) <= col:
+            new_row.extend([""] * (col + 1 - len(new_row)))
+        new_row[col] = value
+        data[row] = tuple(new_row)
+
+    def __load_values_from_sheet(
+        self,
+        revision: str | None = None,
+        revisions: RevisionSource | None = None,
+    ):
+        """Load all values from the Google Sheet and cache them locally.
 
-    def __load_values_from_sheet(self):
-        """Load all values from the Google Sheet and cache them locally."""
+        A paged load reads the change marker again once its last page
+        arrived. If the spreadsheet changed between the pages, rows could be
+        missing or repeated, so the pages are fetched again, up to
+        ``max_retries`` times. A load that never settles is kept without a
+        revision, so the next refresh fetches it again.
+
+        Args:
+            revision: Change marker of the spreadsheet read before the fetch.
+            revisions: Source of the change marker, to check that the pages
+                of a paged load were read from one state of the tab.
+        """
+        if self.page_rows:
+            for _ in range(self.max_retries):
+                fetched_at = time.monotonic()
+                values = self.__fetch_pages(self.page_rows)
+                if revision is None or revisions is None:
+                    break
+                current = revisions.get_revision(self)
+                if current == revision:
+                    break
+                logger.warning(
+                    f"{self.sheet_id} changed while {self.sheet_name} was loaded "
+                    f"page by page ({revision} -> {current})"
+                )
+                revision = current
+                if current is None:
+                    break
+            else:
+                revision = None
+            self.__store_values(values, fetched_at, revision)
+            return
 
         def _fetch():
             gsheet_http_client = self.__get_http_client()
@@ -325,35 +977,390 @@ class CacheSheet:
                 range=absolute_range_name(self.sheet_name),
             )
 
+        fetched_at = time.monotonic()
         res = self.__execute_with_retry(_fetch)
 
         if not res:
             raise ValueError("Failed to fetch data from Google Sheet")
 
+        self.__store_values(res.get("values", []), fetched_at, revision)
+
+    def __fetch_row_count(self) -> int:
+        """Return the number of rows of the tab's grid, from the sheet metadata."""
+
+        def _fetch():
+            return self.__get_http_client().fetch_sheet_metadata(
+                self.sheet_id,
+                params={"fields": "sheets.properties(title,gridProperties.rowCount)"},
+            )
+
+        metadata = self.__execute_with_retry(_fetch)
+        for sheet in (metadata or {}).get("sheets", []):
+            properties = sheet.get("properties", {})
+            if properties.get("title") == self.sheet_name:
+                return properties.get("gridProperties", {}).get("rowCount", 0)
+
+        raise ValueError(f"Sheet not found: {self.sheet_id} - {self.sheet_name}")
+
+    def __fetch_pages(self, page_rows: int) -> list[list[str]]:
+        """Download the tab ``page_rows`` rows at a time.
+
+        Each page is appended to the grid as soon as it arrives, so only one
+        page worth of response is decoded at a time instead of the whole tab.
+        The grid has the same shape as the one of a single request.
+
+        Only the first load reads the grid's row count from the sheet
+        metadata, later ones reuse it. It is read again when the data fills
+        the grid up to its last row, as rows may have been added, or when a
+        page starts past the end of the grid, as rows were deleted.
+
+        Args:
+            page_rows: Number of rows per request.
+
+        Returns:
+            The 2D list of values of the tab.
+        """
+        measured = self._grid_rows is None
+        row_count = self.__fetch_row_count() if measured else self._grid_rows
+        values: list[list[str]] = []
+
+        def _fetch(rows: str):
+            return self.__get_http_client().values_get(
+                id=self.sheet_id,
+                range=absolute_range_name(self.sheet_name, rows),
+            )
+
+        start = 1
+        while start <= row_count:
+            end = min(start + page_rows - 1, row_count)
+            try:
+                res = self.__execute_with_retry(_fetch, f"{start}:{end}")
+            except APIError as e:
+                if measured or e.code != 400:
+                    raise
+                # Rows were deleted since the row count was read
+                row_count, measured = self.__fetch_row_count(), True
+                continue
+            if not res:
+                raise ValueError("Failed to fetch data from Google Sheet")
+
+            page = res.get("values", [])
+            if page:
+                # Empty rows before the page were trimmed from earlier pages
+                values.extend([] for _ in range(start - 1 - len(values)))
+                values.extend(page)
+            start = end + 1
+
+            if start > row_count and not measured and len(values) == row_count:
+                # Rows may have been added below the last one seen
+                row_count, measured = self.__fetch_row_count(), True
+
+        self._grid_rows = row_count
+        logger.info(
+            f"Loaded {self.sheet_id}_{self.sheet_name} in pages of {page_rows} rows "
+            f"({len(values)} rows)"
+        )
+        return values
+
+    def __pending_edits(self, fetched_at: float) -> dict[tuple[int, int], str]:
+        """Return local edits a snapshot fetched at ``fetched_at`` may not contain.
+
+        Edits flushed to the sheet before the fetch started are dropped, the
+        rest are returned so they can be re-applied on top of the snapshot.
+        Must be called with ``_edit_lock`` held.
+        """
+        self._local_edits = {
+            cell: (value, flushed_at)
+            for cell, (value, flushed_at) in self._local_edits.items()
+            if flushed_at is None or flushed_at >= fetched_at
+        }
+        # The new snapshot is the reference for every other cell
+        self._remote_values = {
+            cell: value
+            for cell, value in self._remote_values.items()
+            if cell in self._local_edits
+        }
+        return {cell: value for cell, (value, _) in self._local_edits.items()}
+
+    def __store_values(
+        self,
+        values: list[list[str]],
+        fetched_at: float | None = None,
+        revision: str | None = None,
+    ) -> None:
+        """Adopt freshly fetched values as the in-memory cache.
+
+        The values are interned (see intern_rows()) before taking the
+        edit lock. The CSV cache file is written in the background, so the
+        first read does not pay for serializing and re-parsing data already
+        in memory.
+
+        Args:
+            values: The 2D list of values returned by the Sheets API.
+            fetched_at: time.monotonic() when the request was sent.
+            revision: Change marker of the spreadsheet read before the fetch.
+        """
+        fetched_at = time.monotonic() if fetched_at is None else fetched_at
         self.__init_cache_file()
-        with self.cache_file.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            for row in res["values"]:
-                writer.writerow(row)
+        rows, grid_bytes = intern_rows(values)
+        hashes = row_hashes(rows)
+        with self._edit_lock:
+            pending = self.__pending_edits(fetched_at)
+            for (row, col), value in pending.items():
+                self.__set_cell(rows, row, col, value)
+            self.__rehash(rows, hashes, {row for row, _ in pending})
+
+            diff = diff_rows(self._row_hashes, hashes)
+            self._row_hashes = hashes
+            self.last_diff = diff
+            self._cache_data = rows
+            self.grid_bytes = grid_bytes
+            self._grid_version += 1
+            self._typed = {}
+            # Pending edits are part of the snapshot persisted below
+            self._journal_pending = {}
+            self._sparse_data = None
+            self._sparse_ranges = []
+            self.loaded_at = fetched_at
+            self.revision = revision
+            changed_cells = self.__changed_watched_cells()
+
+        self.__persist_in_background()
+        self.__notify(diff, changed_cells)
+
+    def __store_sparse_values(
+        self,
+        grid_ranges: list[GridRange],
+        values_per_range: list[list[list[str]]],
+        fetched_at: float,
+        revision: str | None = None,
+    ) -> None:
+        """Keep only the fetched ranges, keyed by 0-based (row, col).
 
-        # Clear in-memory cache to force reload from new file
-        self._cache_data = None
-        self._dirty = False
+        Args:
+            grid_ranges: The bounded ranges that were fetched.
+            values_per_range: The values returned for each range, starting at
+                the range's top-left cell.
+            fetched_at: time.monotonic() when the request was sent.
+            revision: Change marker of the spreadsheet read before the fetch.
+        """
+        sparse_data: dict[tuple[int, int], str] = {}
+        for grid_range, values in zip(grid_ranges, values_per_range):
+            assert grid_range.startRowIndex is not None
+            assert grid_range.startColumnIndex is not None
+            for row_offset, row in enumerate(values):
+                for col_offset, value in enumerate(row):
+                    if value != "":
+                        sparse_data[
+                            (
+                                grid_range.startRowIndex + row_offset,
+                                grid_range.startColumnIndex + col_offset,
+                            )
+                        ] = value
+
+        with self._edit_lock:
+            sparse_data.update(self.__pending_edits(fetched_at))
+            # Refreshes keep the same ranges, so readers only ever see one
+            # complete snapshot or the other
+            self._sparse_ranges = grid_ranges
+            self._sparse_data = sparse_data
+            self.grid_bytes = sparse_size(sparse_data)
+            self._typed = {}
+            self._cache_data = None
+            self._journal_pending = {}
+            self.loaded_at = fetched_at
+            self.revision = revision
+            # Rows are only diffed between full loads
+            self._row_hashes = None
+            self.last_diff = None
+            changed_cells = self.__changed_watched_cells()
+
+        self.__notify(None, changed_cells)
+
+    def __rehash(
+        self, rows: list[Sequence[str]], hashes: array, changed: Iterable[int]
+    ) -> None:
+        """Update the hashes of rows replaced by edits, and of rows appended.
 
-    def get_value(self, cell: str) -> str | None:
-        """Get the value of a specific cell from the cache.
+        Must be called with ``_edit_lock`` held when ``hashes`` is in use.
+        """
+        if len(hashes) < len(rows):
+            hashes.extend(row_hashes(rows[len(hashes) :]))
+        for row in changed:
+            hashes[row] = row_hashes(rows[row : row + 1])[0]
+
+    def __peek(self, row: int, col: int) -> Any:
+        """Return a cell of the snapshot in memory, without loading anything.
+
+        Returns:
+            The value (None if empty), or _UNKNOWN if the cell is not in
+            memory.
+        """
+        if self._sparse_data is not None:
+            if not self.__sparse_covers_cell(row, col):
+                return _UNKNOWN
+            return self._sparse_data.get((row, col))
+        if self._cache_data is None:
+            return _UNKNOWN
+        cells = self._cache_data[row] if row < len(self._cache_data) else ()
+        return (cells[col] if col < len(cells) else "") or None
+
+    def __changed_watched_cells(self) -> dict[tuple[int, int], str | None]:
+        """Record the new values of watched cells and return those that changed.
+
+        Must be called with ``_edit_lock`` held, right after a snapshot swap.
+        """
+        changed = {}
+        for key in self._cell_watchers:
+            value = self.__peek(*key)
+            if value is _UNKNOWN:
+                continue
+            previous = self._watched_values.get(key, _UNKNOWN)
+            self._watched_values[key] = value
+            if previous is not _UNKNOWN and previous != value:
+                changed[key] = value
+        return changed
+
+    def __notify(
+        self, diff: RowDiff | None, changed_cells: dict[tuple[int, int], str | None]
+    ) -> None:
+        """Call the listeners of a new snapshot, outside of any lock."""
+        with self._edit_lock:
+            row_listeners = list(self._row_listeners) if diff and not diff.is_empty else []
+            by_callback: dict[Callable, dict[tuple[int, int], str | None]] = {}
+            for key, value in changed_cells.items():
+                for callback in self._cell_watchers.get(key, []):
+                    by_callback.setdefault(callback, {})[key] = value
+
+        for listener in row_listeners:
+            try:
+                listener(self, diff)  # type: ignore[arg-type]
+            except Exception:
+                logger.exception(f"Row change listener of {self.sheet_name} failed")
+        for callback, cells in by_callback.items():
+            try:
+                callback(self, cells)
+            except Exception:
+                logger.exception(f"Cell watcher of {self.sheet_name} failed")
+
+    def subscribe(
+        self, listener: Callable[["CacheSheet", RowDiff], None]
+    ) -> Callable[[], None]:
+        """Call ``listener(sheet, diff)`` after each load that changes rows.
+
+        Listeners run in the thread that loaded the values (for a manager,
+        usually its revalidation thread), after the new snapshot is in
+        place. Loads that leave every row as it was, and sparse loads, do
+        not call them.
 
         Args:
-            cell: Cell reference in A1 notation (e.g., "A1", "B5").
+            listener: Callable receiving the sheet and its last_diff.
 
         Returns:
-            The cell value as a string, or None if the cell is out of bounds.
+            A function that cancels the subscription.
+
+        Example:
+            >>> def on_rows(sheet, diff):
+            ...     queue.extend(row + 1 for row in diff.rows)
+            >>> unsubscribe = sheet.subscribe(on_rows)
+        """
+        with self._edit_lock:
+            self._row_listeners.append(listener)
+
+        def _unsubscribe() -> None:
+            with self._edit_lock:
+                if listener in self._row_listeners:
+                    self._row_listeners.remove(listener)
+
+        return _unsubscribe
+
+    def watch_cells(
+        self,
+        cells: Iterable[str],
+        callback: Callable[["CacheSheet", dict[tuple[int, int], str | None]], None],
+    ) -> Callable[[], None]:
+        """Call ``callback(sheet, changes)`` when a load changes watched cells.
+
+        ``changes`` maps the 0-based (row, col) of every watched cell whose
+        value differs from the previous load to its new value (None if
+        empty). Works for sparse sheets as long as the cells are inside
+        their ranges. Local edits are not reported, only values brought by
+        loads and refreshes.
+
+        Args:
+            cells: Cell references in A1 notation (e.g., ["B5", "C7"]).
+            callback: Callable receiving the sheet and the changed cells.
+
+        Returns:
+            A function that stops watching the cells.
+
+        Example:
+            >>> min_sheet.watch_cells(["B5"], lambda sheet, changes: print(changes))
+        """
+        keys = [a1_to_indices(cell) for cell in cells]
+        with self._edit_lock:
+            for key in keys:
+                self._cell_watchers.setdefault(key, []).append(callback)
+                if key not in self._watched_values:
+                    value = self.__peek(*key)
+                    if value is not _UNKNOWN:
+                        self._watched_values[key] = value
+
+        def _unwatch() -> None:
+            with self._edit_lock:
+                for key in keys:
+                    callbacks = self._cell_watchers.get(key, [])
+                    if callback in callbacks:
+                        callbacks.remove(callback)
+                    if not callbacks:
+                        self._cell_watchers.pop(key, None)
+                        self._watched_values.pop(key, None)
+
+        return _unwatch
+
+    def __sparse_covers(self, grid_range: GridRange) -> bool:
+        """Return True if a bounded range lies inside one of the sparse ranges."""
+        if not is_bounded(grid_range):
+            return False
+
+        return any(
+            loaded.startRowIndex <= grid_range.startRowIndex  # type: ignore[operator]
+            and grid_range.endRowIndex <= loaded.endRowIndex  # type: ignore[operator]
+            and loaded.startColumnIndex <= grid_range.startColumnIndex  # type: ignore[operator]
+            and grid_range.endColumnIndex <= loaded.endColumnIndex  # type: ignore[operator]
+            for loaded in self._sparse_ranges
+        )
+
+    def __sparse_covers_cell(self, row: int, col: int) -> bool:
+        """Return True if a 0-based cell lies inside one of the sparse ranges."""
+        return any(
+            loaded.startRowIndex <= row < loaded.endRowIndex  # type: ignore[operator]
+            and loaded.startColumnIndex <= col < loaded.endColumnIndex  # type: ignore[operator]
+            for loaded in self._sparse_ranges
+        )
+
+    def get_cell(self, row: int, col: int) -> str | None:
+        """Get the value of a cell by 0-based indices.
+
+        Same as get_value() without parsing A1 notation, for callers that
+        resolve their columns once and read many rows.
+
+        Args:
+            row: The 0-based row index.
+            col: The 0-based column index.
+
+        Returns:
+            The cell value as a string, or None if the cell is empty or out
+            of bounds.
 
         Raises:
             FileNotFoundError: If the cache directory does not exist.
         """
-        data = self.__read_cache_data()
-        row, col = self.__a1_to_indices(cell)
+        sparse_data = self._sparse_data
+        if sparse_data is not None and self.__sparse_covers_cell(row, col):
+            return sparse_data.get((row, col))
+
+        data = self.__read_cache_data((row, col))
 
         try:
             value = data[row][col]
@@ -363,6 +1370,66 @@ class CacheSheet:
         except IndexError:
             return None
 
+    def get_value(self, cell: str) -> str | None:
+        """Get the value of a specific cell from the cache.
+
+        Args:
+            cell: Cell reference in A1 notation (e.g., "A1", "B5").
+
+        Returns:
+            The cell value as a string, or None if the cell is out of bounds.
+
+        Raises:
+            FileNotFoundError: If the cache directory does not exist.
+        """
+        return self.get_cell(*a1_to_indices(cell))
+
+    def __get_typed(self, cell: str, type_: type[float] | type[int]) -> Any:
+        """Parse a cell with ``type_`` once per snapshot.
+
+        Raises:
+            ValueError: If the cell is not a valid ``type_`` literal.
+        """
+        row, col = a1_to_indices(cell)
+        # Bind the current snapshot's cache: a swap or edit meanwhile replaces it
+        typed = self._typed
+        key = (row, col, type_)
+        if key in typed:
+            return typed[key]
+
+        value = self.get_cell(row, col)
+        parsed = None if value is None else type_(value)
+        typed[key] = parsed
+        return parsed
+
+    def get_float(self, cell: str) -> float | None:
+        """Get a cell as a float, parsed once per loaded snapshot.
+
+        Args:
+            cell: Cell reference in A1 notation (e.g., "A1", "B5").
+
+        Returns:
+            The parsed value, or None if the cell is empty or out of bounds.
+
+        Raises:
+            ValueError: If the cell does not hold a number.
+        """
+        return self.__get_typed(cell, float)
+
+    def get_int(self, cell: str) -> int | None:
+        """Get a cell as an int, parsed once per loaded snapshot.
+
+        Args:
+            cell: Cell reference in A1 notation (e.g., "A1", "B5").
+
+        Returns:
+            The parsed value, or None if the cell is empty or out of bounds.
+
+        Raises:
+            ValueError: If the cell does not hold an integer.
+        """
+        return self.__get_typed(cell, int)
+
     def update_value(self, cell: str, value: str) -> None:
         """Update the value of a specific cell in the cache.
 
@@ -377,40 +1444,105 @@ class CacheSheet:
         Raises:
             FileNotFoundError: If the cache directory does not exist.
         """
-        data = self.__read_cache_data()
-        row, col = self.__a1_to_indices(cell)
+        self.set_cell(*a1_to_indices(cell), value)
+
+    def set_cell(self, row: int, col: int, value: str) -> None:
+        """Update a cell by 0-based indices, see update_value().
+
+        Args:
+            row: The 0-based row index.
+            col: The 0-based column index.
+            value: The new value to set.
 
-        self.__ensure_cell_exists(data, row, col)
-        data[row][col] = value
+        Raises:
+            FileNotFoundError: If the cache directory does not exist.
+        """
+        key = (row, col)
+        while True:
+            # A sparse sheet downloads its full tab here, without the lock
+            self.__read_cache_data(key)
+            with self._edit_lock:
+                if self._sparse_data is not None:
+                    # Swapped back to sparse ranges by a refresh meanwhile
+                    continue
+                data = self.__read_cache_data(key)
+                if key not in self._remote_values:
+                    row_data = data[row] if row < len(data) else []
+                    self._remote_values[key] = row_data[col] if col < len(row_data) else ""
+
+                self.__set_cell(data, row, col, value)
+                if self._row_hashes is not None:
+                    self.__rehash(data, self._row_hashes, (row,))
+                if value == self._remote_values[key]:
+                    # Back to what the sheet holds, nothing to write
+                    self._local_edits.pop(key, None)
+                else:
+                    self._local_edits[key] = (value, None)
+                self._typed = {}
 
-        # Mark cache as dirty but don't write to disk yet
-        self._dirty = True
+                # Journaled on the next flush_cache(), not written to disk yet
+                self._journal_pending[key] = value
+                return
 
     def flush_cache(self) -> None:
-        """Write in-memory cache to disk if dirty.
-
-        This method writes pending changes to the local CSV cache file.
-        It's automatically called by flush_to_sheet(), but you can call
-        it manually if you want to persist changes to disk without
+        """Write pending edits to disk.
+
+        Edits are appended to the sheet's journal file next to the CSV
+        cache, so a flush writes only the changed cells. Once the journal
+        holds ``config.journal_max_entries`` entries it is compacted: the
+        whole grid is written as the new CSV snapshot and the journal is
+        emptied. It's automatically called by flush_to_sheet(), but you can
+        call it manually if you want to persist changes to disk without
         syncing to Google Sheets.
 
         Raises:
             FileNotFoundError: If the cache directory does not exist.
         """
-        if self._dirty and self._cache_data is not None:
-            self.__write_cache_data(self._cache_data)
+        with self._persist_lock:
+            with self._edit_lock:
+                pending = self._journal_pending
+                if not pending or self._cache_data is None:
+                    return
+                self._journal_pending = {}
 
-    def flush_to_sheet(self, cells: list[str]) -> dict[str, Any] | None:
+            try:
+                self.__ensure_cache_dir_exists()
+                self.__append_journal(pending)
+            except OSError:
+                with self._edit_lock:
+                    for key, value in pending.items():
+                        self._journal_pending.setdefault(key, value)
+                raise
+
+            if self._journal_entries >= self.config.journal_max_entries:
+                self.__compact()
+
+    @property
+    def dirty_cells(self) -> dict[tuple[int, int], str]:
+        """Edited cells not written to the sheet yet, by 0-based (row, col)."""
+        with self._edit_lock:
+            return {
+                key: value
+                for key, (value, flushed_at) in self._local_edits.items()
+                if flushed_at is None
+            }
+
+    def flush_to_sheet(self, cells: list[str] | None = None) -> dict[str, Any] | None:
         """Flush the cached values back to the Google Sheet.
 
         This method automatically flushes pending changes to disk before
-        syncing to the Google Sheet.
+        syncing to the Google Sheet. Only cells whose value differs from the
+        one last read from or written to the sheet are sent, and adjacent
+        cells are merged into rectangular ranges (e.g. "C12:D40") so the
+        whole flush is one batch update with few entries.
 
         Args:
-            cells: List of cell references in A1 notation to sync (e.g., ["A1", "B5"]).
+            cells: Cell references in A1 notation to sync (e.g., ["A1", "B5"]).
+                Defaults to every dirty cell.
 
         Returns:
-            The API response from the batch update operation.
+            The API response from the batch update operation, or None if
+            there was nothing to write.
 
         Raises:
             FileNotFoundError: If the cache directory does not exist.
@@ -419,26 +1551,41 @@ class CacheSheet:
         # Flush in-memory changes to disk first
         self.flush_cache()
 
-        data = self.__read_cache_data()
-
-        data_body = []
-        for cell in cells:
-            row, col = self.__a1_to_indices(cell)
+        pending = self.dirty_cells
+        if cells is not None:
+            wanted = {a1_to_indices(cell) for cell in cells}
+            pending = {key: value for key, value in pending.items() if key in wanted}
 
-            self.__ensure_cell_exists(data, row, col)
+        if not pending:
+            return None
 
+        data_body = []
+        for grid_range in coalesce_cells(pending):
+            assert grid_range.startRowIndex is not None
+            assert grid_range.endRowIndex is not None
+            assert grid_range.startColumnIndex is not None
+            assert grid_range.endColumnIndex is not None
             data_body.append(
                 {
-                    "range": cell,
-                    "values": [[data[row][col]]],
+                    "range": absolute_range_name(
+                        self.sheet_name, grid_range_to_a1(grid_range)
+                    ),
+                    "values": [
+                        [
+                            pending[(row, col)]
+                            for col in range(
+                                grid_range.startColumnIndex, grid_range.endColumnIndex
+                            )
+                        ]
+                        for row in range(
+                            grid_range.startRowIndex, grid_range.endRowIndex
+                        )
+                    ],
                 }
             )
 
         value_input_option = ValueInputOption.raw
 
-        for values in data_body:
-            values["range"] = absolute_range_name(self.sheet_name, values["range"])
-
         body: MutableMapping[str, Any] = {
             "valueInputOption": value_input_option,
             "includeValuesInResponse": None,
@@ -452,75 +1599,137 @@ class CacheSheet:
             return gsheet_http_client.values_batch_update(self.sheet_id, body=body)
 
         response = self.__execute_with_retry(_update)
+        logger.info(
+            f"Flushed {len(pending)} cell(s) of {self.sheet_name} in {len(data_body)} range(s)"
+        )
+
+        flushed_at = time.monotonic()
+        with self._edit_lock:
+            for key, value in pending.items():
+                edit = self._local_edits.get(key)
+                # A newer edit made while the request was in flight stays pending
+                if edit is not None and edit[0] == value:
+                    self._local_edits[key] = (value, flushed_at)
+                    self._remote_values[key] = value
 
         return response
 
-    def get_range(self, a1_range: str) -> list[list[str]]:
+    def get_range(self, a1_range: str) -> list[list[str | None]]:
         """Get a range of values from the cache.
 
         Args:
             a1_range: Range in A1 notation (e.g., "A1:B5", "A:A", "1:1").
 
         Returns:
-            A 2D list of strings representing the range values.
-            Empty cells are represented as empty strings.
+            A 2D list of the range values. Empty cells, and cells past the
+            end of their row, are None.
 
         Raises:
             FileNotFoundError: If the cache directory does not exist.
         """
-        data = self.__read_cache_data()
+        return list(self.iter_range(a1_range))
+
+    def iter_range(self, a1_range: str) -> Iterator[list[str | None]]:
+        """Lazily yield the rows of a range, see get_range().
+
+        Rows are built one at a time from the snapshot that is current when
+        iteration starts, so a caller that stops early only pays for the
+        rows it consumed.
+
+        Args:
+            a1_range: Range in A1 notation (e.g., "A1:B5", "A:A", "1:1").
 
+        Yields:
+            One list of values per row, empty cells as None.
+
+        Raises:
+            FileNotFoundError: If the cache directory does not exist.
+        """
         grid_range = a1_range_to_grid_range_custom(a1_range)
 
-        result = []
+        sparse_data = self._sparse_data
+        if sparse_data is not None and self.__sparse_covers(grid_range):
+            assert grid_range.startRowIndex is not None
+            assert grid_range.endRowIndex is not None
+            assert grid_range.startColumnIndex is not None
+            assert grid_range.endColumnIndex is not None
+            columns = range(grid_range.startColumnIndex, grid_range.endColumnIndex)
+            for r in range(grid_range.startRowIndex, grid_range.endRowIndex):
+                yield [sparse_data.get((r, c)) for c in columns]
+            return
+
+        data = self.__read_cache_data(a1_range)
+
         for r in range(
             grid_range.startRowIndex or 0,
             grid_range.endRowIndex or len(data),
         ):
-            row_data = []
-            for c in range(
-                grid_range.startColumnIndex or 0,
-                grid_range.endColumnIndex or (len(data[r]) if r < len(data) else 0),
-            ):
-                try:
-                    value = data[r][c]
-                    if value == "":
-                        value = None
-                    row_data.append(value)
-                except IndexError:
-                    row_data.append(None)
-            result.append(row_data)
+            row = data[r] if r < len(data) else []
+            yield [
+                row[c] or None if c < len(row) else None
+                for c in range(
+                    grid_range.startColumnIndex or 0,
+                    grid_range.endColumnIndex or len(row),
+                )
+            ]
+
+    def get_column(self, a1_range: str) -> ColumnView:
+        """Get a lazy view over a single-column range, without copying its cells.
+
+        Args:
+            a1_range: Single-column range in A1 notation (e.g., "A:A",
+                "C2:C100").
+
+        Returns:
+            A ColumnView reading cells of the current snapshot on access,
+            empty cells as None. Later edits and reloads do not show
+            through.
+
+        Raises:
+            ValueError: If the range spans more or less than one column.
+            FileNotFoundError: If the cache directory does not exist.
 
-        return result
+        Example:
+            >>> checks = sheet.get_column("A:A")
+            >>> run_rows = [i + 1 for i, v in enumerate(checks) if v == "1"]
+        """
+        grid_range = a1_range_to_grid_range_custom(a1_range)
+        col = grid_range.startColumnIndex or 0
+        if grid_range.endColumnIndex != col + 1:
+            raise ValueError(f"Not a single-column range: {a1_range}")
+
+        start = grid_range.startRowIndex or 0
+        sparse_data = self._sparse_data
+        if sparse_data is not None and self.__sparse_covers(grid_range):
+            assert grid_range.endRowIndex is not None
+            return ColumnView(col, start, grid_range.endRowIndex, sparse=sparse_data)
+
+        # Edits replace rows of the grid in place. Rows themselves are never
+        # mutated, so copying the row list (not the cells) freezes the view
+        data = list(self.__read_cache_data(a1_range))
+        stop = grid_range.endRowIndex
+        return ColumnView(col, start, len(data) if stop is None else stop, rows=data)
 
     def reset_failed_keys(self) -> None:
-        """Reset the list of failed keys.
+        """Return the keys cooling down after a rate limit to the pool.
 
-        This can be called to give previously failed keys another chance,
-        for example after a cooldown period or when you know quota has reset.
+        Keys come back on their own after ``config.key_cooldown`` seconds,
+        this can be called when you know quota has reset earlier. The pool
+        is shared, so this applies to every sheet using the same keys.
         """
-        self._failed_keys.clear()
-        logger.info("Failed keys list has been reset")
+        self.key_pool.reset_cooldowns()
 
     def get_key_status(self) -> dict[str, Any]:
-        """Get information about the current key usage and status.
+        """Get information about the key pool's quota and usage.
 
         Returns:
             A dictionary containing:
-            - total_keys: Total number of available keys
-            - current_key: Name of the currently active key (or None)
-            - failed_keys: List of failed key names
-            - available_keys: Number of keys still available
-        """
-        current_key_name = None
-        if self._current_key_index is not None:
-            current_key_name = self.keys[self._current_key_index].name
-
-        failed_key_names = [self.keys[i].name for i in self._failed_keys]
-
-        return {
-            "total_keys": len(self.keys),
-            "current_key": current_key_name,
-            "failed_keys": failed_key_names,
-            "available_keys": len(self.keys) - len(self._failed_keys),
-        }
+            - total_keys: Total number of keys
+            - available_keys: Number of keys not cooling down
+            - failed_keys: Names of the keys cooling down
+            - keys: Per key name, the tokens left, requests in flight,
+              requests made and rate limits hit
+            - authentications: Number of authorized clients created
+            - auth_seconds: Time spent creating them
+        """
+        return self.key_pool.status()
@@ -0,0 +1,37 @@
+from .changes import DirtyRows
+from .manager import GSheetCacheManager
+
+
+def test_referenced_cell_change_marks_its_row(sheets_server, config, sheet_id):
+    sheets_server.add_sheet(sheet_id, "Main", [["a"], ["b"], ["c"]])
+    sheets_server.add_sheet(sheet_id, "Min", [["1", "2"], ["3", "4"]])
+    manager = GSheetCacheManager(config)
+    main = manager.add_sheet(sheet_id, "Main")
+    (min_sheet,) = manager.add_sparse_sheets({(sheet_id, "Min"): ["B2"]})
+    dirty = DirtyRows(main)
+    dirty.depend(2, min_sheet, "B2")
+
+    sheets_server.add_sheet(sheet_id, "Min", [["1", "changed"], ["3", "4"]])
+    min_sheet.refresh()
+    assert dirty.take() == set()
+
+    sheets_server.add_sheet(sheet_id, "Min", [["1", "changed"], ["3", "5"]])
+    min_sheet.refresh()
+    assert dirty.take() == {2}
+
+    dirty.forget(2)
+    sheets_server.add_sheet(sheet_id, "Min", [["1", "changed"], ["3", "6"]])
+    min_sheet.refresh()
+    assert dirty.take() == set()
+
+
+def test_inserted_row_marks_every_row_below(sheets_server, config, sheet_id):
+    sheets_server.add_sheet(sheet_id, "Main", [["a"], ["b"], ["c"]])
+    main = GSheetCacheManager(config).add_sheet(sheet_id, "Main")
+    dirty = DirtyRows(main)
+
+    sheets_server.add_sheet(sheet_id, "Main", [["a"], ["new"], ["b"], ["c"]])
+    main.refresh()
+
+    # Rows are positions: b and c moved, so they count as changed
+    assert dirty.take() == {1, 2, 3}
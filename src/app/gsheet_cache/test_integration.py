@@ -0,0 +1,110 @@
+"""Load, refresh, flush and rate limits end to end against MockSheetsServer."""
+
+import pytest
+from gspread.exceptions import APIError
+
+from .config import GSheetCacheConfig
+from .manager import GSheetCacheManager
+
+
+def test_add_sheets_loads_tabs_of_a_spreadsheet_together(
+    sheets_server, config, sheet_id
+):
+    sheets_server.add_sheet(sheet_id, "Main", [["a", "1"], ["b", "2"]])
+    sheets_server.add_sheet(sheet_id, "Prices", [["9.99"]])
+    manager = GSheetCacheManager(config)
+    batch_get = sheets_server.stats["batch_get"]
+
+    main, prices = manager.add_sheets([(sheet_id, "Main"), (sheet_id, "Prices")])
+
+    assert sheets_server.stats["batch_get"] - batch_get == 1
+    assert main.get_range("A1:B2") == [["a", "1"], ["b", "2"]]
+    assert prices.get_float("A1") == 9.99
+
+
+def test_refresh_picks_up_changes_and_keeps_local_edits(
+    sheets_server, config, sheet_id
+):
+    sheets_server.add_sheet(sheet_id, "Main", [["a", "1"], ["b", "2"]])
+    manager = GSheetCacheManager(config)
+    sheet = manager.add_sheet(sheet_id, "Main")
+    manager.update_value(sheet_id, "Main", "B2", "edited")
+
+    sheets_server.add_sheet(sheet_id, "Main", [["a", "changed"], ["b", "2"]])
+    assert manager.refresh_stale(force=True) == 1
+
+    assert sheet.get_value("B1") == "changed"
+    assert sheet.get_value("B2") == "edited"
+
+
+def test_flush_writes_only_edited_cells(sheets_server, config, sheet_id):
+    sheets_server.add_sheet(sheet_id, "Main", [["a", "1"], ["b", "2"]])
+    manager = GSheetCacheManager(config)
+    manager.add_sheet(sheet_id, "Main")
+    manager.update_value(sheet_id, "Main", "B1", "3")
+    manager.update_value(sheet_id, "Main", "C2", "new")
+    batch_update = sheets_server.stats["batch_update"]
+
+    manager.flush_to_sheet(sheet_id, "Main")
+    manager.flush_to_sheet(sheet_id, "Main")
+
+    assert sheets_server.stats["batch_update"] - batch_update == 1
+    assert sheets_server.get_sheet(sheet_id, "Main") == [
+        ["a", "3"],
+        ["b", "2", "new"],
+    ]
+
+
+@pytest.fixture
+def quota_config(sheets_server, config, tmp_path, request, monkeypatch):
+    """A config with a pool of its own, on a server allowing 1 request per key."""
+
+    def make(keys: int, **update) -> GSheetCacheConfig:
+        keys_dir = tmp_path / "quota_keys"
+        # Named after the test, the server counts the quota per key name
+        sheets_server.write_keys(keys_dir, keys, prefix=request.node.name)
+        monkeypatch.setattr(sheets_server, "quota_per_minute", 1)
+        return config.model_copy(
+            update={"keys_dir": keys_dir, "key_cooldown": 0.1, **update}
+        )
+
+    return make
+
+
+def test_requests_spread_over_keys_within_their_quota(
+    sheets_server, quota_config, sheet_id
+):
+    sheets_server.add_sheet(sheet_id, "Main", [["a", "1"]])
+    # The pool knows the server's quota and moves on to the other key
+    manager = GSheetCacheManager(quota_config(2, key_requests_per_minute=1))
+    throttled = sheets_server.stats["throttled"]
+
+    sheet = manager.add_sheet(sheet_id, "Main")
+    sheet.refresh()
+
+    assert sheets_server.stats["throttled"] == throttled
+    status = manager.get_key_status()
+    assert [usage["requests"] for usage in status["keys"].values()] == [1, 1]
+
+
+def test_rate_limited_key_cools_down_and_recovers(
+    sheets_server, quota_config, sheet_id, monkeypatch
+):
+    sheets_server.add_sheet(sheet_id, "Main", [["a", "1"]])
+    manager = GSheetCacheManager(quota_config(1))
+    sheet = manager.add_sheet(sheet_id, "Main")
+    throttled = sheets_server.stats["throttled"]
+
+    sheets_server.add_sheet(sheet_id, "Main", [["a", "2"]])
+    with pytest.raises(APIError):
+        sheet.refresh()
+
+    # Every attempt was answered 429, the cached values are still served
+    assert sheets_server.stats["throttled"] - throttled == sheet.max_retries
+    (usage,) = manager.get_key_status()["keys"].values()
+    assert usage["rate_limits"] == sheet.max_retries
+    assert sheet.get_value("B1") == "1"
+
+    monkeypatch.setattr(sheets_server, "quota_per_minute", None)
+    sheet.refresh()
+    assert sheet.get_value("B1") == "2"
@@ -0,0 +1,171 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .config import RefreshPolicy
+from .manager import GSheetCacheManager
+
+
+def loads(server) -> int:
+    return server.stats["values_get"] + server.stats["batch_get"]
+
+
+def test_concurrent_add_sheet_loads_once(sheets_server, config, sheet_id, monkeypatch):
+    sheets_server.add_sheet(sheet_id, "Main", [["a", "1"]])
+    monkeypatch.setattr(sheets_server, "latency", 0.2)
+    manager = GSheetCacheManager(config)
+    before = loads(sheets_server)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        sheets = list(
+            executor.map(lambda _: manager.add_sheet(sheet_id, "Main"), range(8))
+        )
+
+    assert loads(sheets_server) - before == 1
+    assert all(sheet is sheets[0] for sheet in sheets)
+
+
+def test_add_sheet_keeps_a_sheet_loaded_during_the_lookup(
+    sheets_server, config, sheet_id
+):
+    sheets_server.add_sheet(sheet_id, "Main", [["a", "1"]])
+    manager = GSheetCacheManager(config)
+    sheet = manager.add_sheet(sheet_id, "Main")
+    sheet.update_value("B1", "edited")
+
+    class LoadedMeanwhile(dict):
+        # The lookup misses, as if another thread stored the sheet right after
+        def get(self, key, default=None):
+            return default
+
+    manager.sheets = LoadedMeanwhile(manager.sheets)
+    before = loads(sheets_server)
+
+    assert manager.add_sheet(sheet_id, "Main") is sheet
+    assert loads(sheets_server) == before
+    assert sheet.get_value("B1") == "edited"
+
+
+def test_sparse_miss_downloads_without_blocking_edits(
+    sheets_server, config, sheet_id, monkeypatch
+):
+    sheets_server.add_synthetic_sheet(sheet_id, "Min", 50, 5)
+    manager = GSheetCacheManager(config)
+    [sheet] = manager.add_sparse_sheets({(sheet_id, "Min"): ["B2"]})
+    assert sheet.is_sparse
+
+    monkeypatch.setattr(sheets_server, "latency", 0.5)
+    miss = threading.Thread(target=sheet.get_value, args=("D40",))
+    miss.start()
+    try:
+        threading.Event().wait(0.1)
+        # The edit lock is free while the full tab downloads
+        assert sheet._edit_lock.acquire(timeout=0.2)
+        sheet._edit_lock.release()
+        assert sheet.get_value("B2") == "r1c1"
+    finally:
+        miss.join()
+
+    assert not sheet.is_sparse
+    assert sheet.get_value("D40") == "r39c3"
+
+
+class FixedRevisions:
+    def __init__(self, revision: str) -> None:
+        self.revision = revision
+
+    def get_revision(self, sheet) -> str:
+        return self.revision
+
+
+def test_unchanged_revision_counts_as_a_refresh(sheets_server, config, sheet_id):
+    sheets_server.add_sheet(sheet_id, "Main", [["1"]])
+    manager = GSheetCacheManager(config, revision_source=FixedRevisions("r1"))
+    sheet = manager.add_sheet(sheet_id, "Main")
+    manager.refresh_stale(force=True)  # records revision r1
+    loaded_at = sheet.loaded_at
+    before = loads(sheets_server)
+
+    manager.refresh_stale(force=True)
+
+    assert loads(sheets_server) == before
+    assert sheet.loaded_at > loaded_at
+
+
+def test_policy_without_revision_check_always_fetches(
+    sheets_server, config, sheet_id
+):
+    sheets_server.add_sheet(sheet_id, "Min", [["1"]])
+    manager = GSheetCacheManager(config, revision_source=FixedRevisions("r1"))
+    manager.set_refresh_policy(sheet_id, "Min", RefreshPolicy(check_revision=False))
+    sheet = manager.add_sheet(sheet_id, "Min")
+    manager.refresh_stale(force=True)
+
+    # A formula result changes, the spreadsheet's revision does not
+    sheets_server.add_sheet(sheet_id, "Min", [["2"]])
+    manager.refresh_stale(force=True)
+
+    assert sheet.get_value("A1") == "2"
+
+
+class FailingRevisions:
+    def get_revision(self, sheet) -> None:
+        return None
+
+
+def test_max_age_revalidates_an_unchanged_revision(sheets_server, config, sheet_id):
+    sheets_server.add_sheet(sheet_id, "Main", [["1"]])
+    manager = GSheetCacheManager(config, revision_source=FixedRevisions("r1"))
+    manager.set_refresh_policy(sheet_id, "Main", RefreshPolicy(max_age=0.2))
+    sheet = manager.add_sheet(sheet_id, "Main")
+    manager.refresh_stale(force=True)
+    threading.Event().wait(0.3)
+    before = loads(sheets_server)
+
+    manager.add_sheets([(sheet_id, "Main")])
+
+    assert loads(sheets_server) == before
+    assert sheet.age < 0.2
+
+
+def test_max_age_fetches_when_the_revision_cannot_be_read(
+    sheets_server, config, sheet_id
+):
+    sheets_server.add_sheet(sheet_id, "Main", [["1"]])
+    manager = GSheetCacheManager(config, revision_source=FailingRevisions())
+    manager.set_refresh_policy(sheet_id, "Main", RefreshPolicy(max_age=0.2))
+    sheet = manager.add_sheet(sheet_id, "Main")
+    threading.Event().wait(0.3)
+
+    sheets_server.add_sheet(sheet_id, "Main", [["2"]])
+    manager.add_sheets([(sheet_id, "Main")])
+
+    assert sheet.get_value("A1") == "2"
+    assert sheet.age < 0.2
+
+
+def test_eviction_writes_without_holding_the_lru_lock(
+    sheets_server, config, sheet_id, monkeypatch
+):
+    # Distinct values, the grids would share repeated ones
+    rows = [[f"{row:01000d}"] for row in range(100)]
+    sheets_server.add_sheet(sheet_id, "Old", rows)
+    sheets_server.add_sheet(sheet_id, "New", rows[::-1])
+    manager = GSheetCacheManager(
+        config.model_copy(update={"memory_budget_mb": 0.15})
+    )
+    old = manager.add_sheet(sheet_id, "Old")
+    old.wait_persisted()
+
+    lock_held = []
+    evict = old.evict
+
+    def recording_evict():
+        lock_held.append(manager._memory_lock.locked())
+        return evict()
+
+    monkeypatch.setattr(old, "evict", recording_evict)
+    manager.add_sheet(sheet_id, "New")
+
+    assert lock_held == [False]
+    assert not old.is_resident
+    assert manager.get_memory_stats()["evictions"] == 1
@@ -0,0 +1,223 @@
+import threading
+
+from . import sheet as sheet_module
+from .sheet import CacheSheet
+
+
+def persist_threads() -> list[threading.Thread]:
+    return [
+        thread
+        for thread in threading.enumerate()
+        if thread.name.startswith("CacheSheetPersist-")
+    ]
+
+
+def test_refreshes_collapse_into_one_pending_write(
+    sheets_server, config, sheet_id, monkeypatch
+):
+    sheets_server.add_sheet(sheet_id, "Main", [["a", "1"]])
+    sheet = CacheSheet(sheet_id, "Main", config)
+    sheet.wait_persisted()
+
+    written = []
+    refreshed = threading.Event()
+    write_snapshot = sheet_module.write_snapshot
+
+    def slow_write_snapshot(path, sheet_id, sheet_name, fetched_at, rows, **kwargs):
+        # Hold the first write until every refresh came in
+        refreshed.wait(timeout=10)
+        written.append(rows[0][1])
+        write_snapshot(path, sheet_id, sheet_name, fetched_at, rows, **kwargs)
+
+    monkeypatch.setattr(sheet_module, "write_snapshot", slow_write_snapshot)
+
+    for value in range(2, 12):
+        sheets_server.add_sheet(sheet_id, "Main", [["a", str(value)]])
+        sheet.refresh()
+        assert len(persist_threads()) <= 1
+    refreshed.set()
+    sheet.wait_persisted()
+
+    # The first write was running, the other nine refreshes left one write
+    assert len(written) == 2
+    assert written[-1] == "11"
+    assert persist_threads() == []
+    assert sheet.cache_file.read_text(encoding="utf-8").strip() == "a,11"
+
+
+def test_get_range_returns_none_for_empty_cells(sheets_server, config, sheet_id):
+    sheets_server.add_sheet(sheet_id, "Main", [["a", "", "c"], ["d"]])
+    sheet = CacheSheet(sheet_id, "Main", config)
+
+    assert sheet.get_range("A1:C2") == [["a", None, "c"], ["d", None, None]]
+
+
+def test_column_view_keeps_the_grid_it_was_created_on(
+    sheets_server, config, sheet_id
+):
+    sheets_server.add_sheet(sheet_id, "Main", [["1"], ["2"]])
+    sheet = CacheSheet(sheet_id, "Main", config)
+    column = sheet.get_column("A:A")
+
+    sheet.update_value("A1", "edited")
+    sheets_server.add_sheet(sheet_id, "Main", [["3"], ["4"], ["5"]])
+    sheet.refresh()
+
+    assert list(column) == ["1", "2"]
+    assert list(sheet.get_column("A:A")) == ["edited", "4", "5"]
+
+
+def test_flushed_edits_are_replayed_from_the_journal(sheets_server, config, sheet_id):
+    sheets_server.add_sheet(sheet_id, "Main", [["a", "b"], ["c", "d"]])
+    sheet = CacheSheet(sheet_id, "Main", config)
+    sheet.wait_persisted()
+
+    sheet.update_value("B1", "x")
+    sheet.update_value("C3", "new")
+    sheet.flush_cache()
+    assert len(sheet.journal_file.read_text(encoding="utf-8").splitlines()) == 2
+
+    assert sheet.evict()
+    assert sheet.get_range("A1:C3") == [
+        ["a", "x", None],
+        ["c", "d", None],
+        [None, None, "new"],
+    ]
+
+
+def test_truncated_journal_entry_is_ignored(sheets_server, config, sheet_id):
+    sheets_server.add_sheet(sheet_id, "Main", [["a", "b"]])
+    sheet = CacheSheet(sheet_id, "Main", config)
+    sheet.wait_persisted()
+    sheet.update_value("A1", "kept")
+    sheet.flush_cache()
+    assert sheet.evict()
+
+    # A crash in the middle of the next append
+    with sheet.journal_file.open("a", encoding="utf-8") as f:
+        f.write('[0, 1, "lo')
+
+    assert sheet.get_range("A1:B1") == [["kept", "b"]]
+
+
+def test_journal_is_compacted_past_its_limit(sheets_server, config, sheet_id):
+    sheets_server.add_sheet(sheet_id, "Main", [["a"]])
+    config = config.model_copy(update={"journal_max_entries": 3})
+    sheet = CacheSheet(sheet_id, "Main", config)
+    sheet.wait_persisted()
+
+    sheet.update_value("A1", "1")
+    sheet.update_value("A2", "2")
+    sheet.flush_cache()
+    assert sheet.journal_file.exists()
+
+    sheet.update_value("A3", "3")
+    sheet.flush_cache()
+    assert sheet.cache_file.read_text(encoding="utf-8").split() == ["1", "2", "3"]
+    # None of them reached the sheet, so they are journaled again
+    assert len(sheet.journal_file.read_text(encoding="utf-8").splitlines()) == 3
+
+
+def test_edits_survive_a_restart_until_flushed(sheets_server, config, sheet_id):
+    sheets_server.add_sheet(sheet_id, "Main", [["a", "b"]])
+    sheet = CacheSheet(sheet_id, "Main", config)
+    sheet.wait_persisted()
+    sheet.update_value("B1", "edited")
+    sheet.flush_cache()
+
+    restarted = CacheSheet.from_snapshot(sheet_id, "Main", config)
+    assert restarted.dirty_cells == {(0, 1): "edited"}
+
+    sheets_server.add_sheet(sheet_id, "Main", [["changed", "b"]])
+    restarted.refresh()
+    assert restarted.get_range("A1:B1") == [["changed", "edited"]]
+
+    restarted.flush_to_sheet()
+    assert restarted.dirty_cells == {}
+    assert sheets_server.get_sheet(sheet_id, "Main") == [["changed", "edited"]]
+
+
+def test_compaction_keeps_unflushed_edits_for_a_restart(
+    sheets_server, config, sheet_id
+):
+    sheets_server.add_sheet(sheet_id, "Main", [["a"], ["b"]])
+    config = config.model_copy(update={"journal_max_entries": 2})
+    sheet = CacheSheet(sheet_id, "Main", config)
+    sheet.wait_persisted()
+    sheet.update_value("A1", "flushed")
+    sheet.flush_to_sheet()
+    sheet.update_value("A2", "pending")
+    sheet.flush_cache()
+
+    restarted = CacheSheet.from_snapshot(sheet_id, "Main", config)
+    assert restarted.get_range("A1:A2") == [["flushed"], ["pending"]]
+    assert restarted.dirty_cells == {(1, 0): "pending"}
+
+
+def numbered_rows(count: int) -> list[list[str]]:
+    return [[str(row)] for row in range(count)]
+
+
+def test_paged_refresh_reuses_the_row_count(sheets_server, config, sheet_id):
+    sheets_server.add_sheet(sheet_id, "Main", numbered_rows(300))
+    metadata = sheets_server.stats["metadata"]
+    sheet = CacheSheet(sheet_id, "Main", config, page_rows=500)
+    assert sheets_server.stats["metadata"] - metadata == 1
+
+    sheet.refresh()
+
+    assert sheets_server.stats["metadata"] - metadata == 1
+    assert sheet.get_range("A1:A300") == numbered_rows(300)
+
+
+def test_paged_refresh_follows_added_and_deleted_rows(
+    sheets_server, config, sheet_id
+):
+    sheets_server.add_sheet(sheet_id, "Main", numbered_rows(300))
+    metadata = sheets_server.stats["metadata"]
+    sheet = CacheSheet(sheet_id, "Main", config, page_rows=500)
+
+    # Rows past the 1000-row grid of the first load
+    sheets_server.add_sheet(sheet_id, "Main", numbered_rows(1500))
+    sheet.refresh()
+    assert sheet.get_range("A1:A1500") == numbered_rows(1500)
+
+    # The third page now starts past the end of the grid
+    sheets_server.add_sheet(sheet_id, "Main", numbered_rows(900))
+    sheet.refresh()
+    assert sheet.get_range("A1:A901") == numbered_rows(900) + [[None]]
+    assert sheets_server.stats["metadata"] - metadata == 3
+
+
+class RevisionSequence:
+    def __init__(self, *revisions: str) -> None:
+        self.revisions = iter(revisions)
+
+    def get_revision(self, sheet: CacheSheet) -> str | None:
+        return next(self.revisions)
+
+
+def test_paged_refresh_refetches_pages_read_across_a_change(
+    sheets_server, config, sheet_id
+):
+    sheets_server.add_sheet(sheet_id, "Main", numbered_rows(300))
+    sheet = CacheSheet(sheet_id, "Main", config, page_rows=500)
+    values_get = sheets_server.stats["values_get"]
+
+    # Changed while the first pages were read, stable during the second ones
+    CacheSheet.refresh_many([sheet], RevisionSequence("r1", "r2", "r2"))
+
+    assert sheets_server.stats["values_get"] - values_get == 4
+    assert sheet.revision == "r2"
+
+
+def test_paged_refresh_that_never_settles_keeps_no_revision(
+    sheets_server, config, sheet_id
+):
+    sheets_server.add_sheet(sheet_id, "Main", numbered_rows(300))
+    sheet = CacheSheet(sheet_id, "Main", config, page_rows=500)
+
+    CacheSheet.refresh_many([sheet], RevisionSequence("r1", "r2", "r3", "r4"))
+
+    assert sheet.revision is None
+    assert sheet.get_range("A1:A300") == numbered_rows(300)
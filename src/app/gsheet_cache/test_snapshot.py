@@ -0,0 +1,58 @@
+import pytest
+
+from .sheet import CacheSheet
+from .snapshot import CELL_SEPARATOR, ROW_SEPARATOR, read_snapshot, write_snapshot
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = tmp_path / "tab.snap"
+    rows = [["id", "price", "note"], ["1", "", "é, \"quoted\"\nline"], [], ["2"]]
+
+    written = write_snapshot(path, "sheet", "Tab", 123.5, rows, revision="rev-1")
+    header, read = read_snapshot(path)
+
+    assert header == written
+    assert header.sheet_id == "sheet"
+    assert header.sheet_name == "Tab"
+    assert header.revision == "rev-1"
+    assert (header.rows, header.cols) == (4, 3)
+    assert read == rows
+
+
+def test_empty_snapshot_round_trip(tmp_path):
+    path = tmp_path / "tab.snap"
+    write_snapshot(path, "sheet", "Tab", 0.0, [])
+
+    assert read_snapshot(path)[1] == []
+
+
+@pytest.mark.parametrize("separator", [CELL_SEPARATOR, ROW_SEPARATOR])
+def test_values_with_separators_are_rejected(tmp_path, separator):
+    path = tmp_path / "tab.snap"
+    write_snapshot(path, "sheet", "Tab", 0.0, [["old"]])
+
+    with pytest.raises(ValueError):
+        write_snapshot(path, "sheet", "Tab", 0.0, [["a", f"b{separator}c"]])
+
+    # The previous snapshot is left in place
+    assert read_snapshot(path)[1] == [["old"]]
+
+
+def test_truncated_snapshot_is_rejected(tmp_path):
+    path = tmp_path / "tab.snap"
+    write_snapshot(path, "sheet", "Tab", 0.0, [["a", "b"], ["c", "d"]])
+    path.write_bytes(path.read_bytes()[:-2])
+
+    with pytest.raises(ValueError):
+        read_snapshot(path)
+
+
+def test_sheet_with_separators_falls_back_to_csv(sheets_server, config, sheet_id):
+    sheets_server.add_sheet(sheet_id, "Main", [["a", f"b{CELL_SEPARATOR}c"]])
+    sheet = CacheSheet(sheet_id, "Main", config)
+    sheet.wait_persisted()
+
+    assert not sheet.snapshot_file.exists()
+    assert CacheSheet.from_snapshot(sheet_id, "Main", config) is None
+    assert sheet.evict()
+    assert sheet.get_value("B1") == f"b{CELL_SEPARATOR}c"
@@ -4,7 +4,11 @@ This module provides helper functions for working with Google Sheets data,
 particularly for converting between different range notation formats.
 
 Functions:
+    a1_to_indices: Convert a single A1 cell reference to 0-based indices.
     a1_range_to_grid_range_custom: Convert A1 notation to GridRange objects.
+    grid_range_to_a1: Convert a bounded GridRange back to A1 notation.
+    plan_sparse_ranges: Decide which ranges to fetch for a sparse load.
+    coalesce_cells: Merge individual cells into rectangular ranges.
 
 Example:
     >>> from gsheet_cache.utils import a1_range_to_grid_range_custom
@@ -13,11 +17,41 @@ Example:
     Rows: 0-10
 """
 
-from gspread.utils import a1_range_to_grid_range
+from functools import lru_cache
+from typing import Iterable
+
+from gspread.utils import a1_range_to_grid_range, a1_to_rowcol, rowcol_to_a1
 
 from .schemas import GridRange
 
 
+# Rows of a sheet are addressed with the same few hundred columns x rows
+# over and over, so parsed references are memoized
+A1_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=A1_CACHE_SIZE)
+def a1_to_indices(cell: str) -> tuple[int, int]:
+    """Convert a cell reference in A1 notation to 0-based (row, col) indices.
+
+    Results are memoized, so repeated lookups of the same cell skip
+    gspread's regex parsing.
+
+    Args:
+        cell: A cell reference in A1 notation (e.g., "A1", "B5").
+
+    Returns:
+        A tuple of (row_index, col_index) in 0-based indexing.
+
+    Example:
+        >>> a1_to_indices("B5")
+        (4, 1)
+    """
+    row, col = a1_to_rowcol(cell)
+    return row - 1, col - 1
+
+
+@lru_cache(maxsize=A1_CACHE_SIZE)
 def a1_range_to_grid_range_custom(a1_range: str) -> GridRange:
     """Convert an A1 notation range string to a GridRange object.
 
@@ -63,7 +97,155 @@ def a1_range_to_grid_range_custom(a1_range: str) -> GridRange:
 
     Note:
         The returned GridRange uses 0-based indexing with exclusive end indices,
-        consistent with the Google Sheets API specification.
+        consistent with the Google Sheets API specification. Results are
+        memoized; GridRange is immutable so the cached instance is shared.
     """
     grid_range_dict = a1_range_to_grid_range(a1_range)
     return GridRange(**grid_range_dict)
+
+
+def grid_range_to_a1(grid_range: GridRange) -> str:
+    """Convert a fully bounded GridRange to A1 notation.
+
+    Args:
+        grid_range: A GridRange whose start and end indices are all set.
+
+    Returns:
+        The range in A1 notation, or a single cell reference for 1x1 ranges.
+
+    Example:
+        >>> grid_range_to_a1(GridRange(startRowIndex=0, endRowIndex=10,
+        ...                            startColumnIndex=0, endColumnIndex=2))
+        'A1:B10'
+    """
+    start = rowcol_to_a1(grid_range.startRowIndex + 1, grid_range.startColumnIndex + 1)
+    end = rowcol_to_a1(grid_range.endRowIndex, grid_range.endColumnIndex)
+    return start if start == end else f"{start}:{end}"
+
+
+def is_bounded(grid_range: GridRange) -> bool:
+    """Return True if all four indices of the GridRange are set."""
+    return None not in (
+        grid_range.startRowIndex,
+        grid_range.endRowIndex,
+        grid_range.startColumnIndex,
+        grid_range.endColumnIndex,
+    )
+
+
+def plan_sparse_ranges(
+    a1_ranges: Iterable[str],
+    max_ranges: int,
+    max_cells: int,
+) -> list[GridRange] | None:
+    """Decide which ranges to fetch for a sparse load of one tab.
+
+    Sparse loading only pays off when few, small, bounded ranges are needed.
+    When the ranges cover at least half of their bounding box they are
+    fetched as that single box instead.
+
+    Args:
+        a1_ranges: Cell or range references in A1 notation, without sheet name.
+        max_ranges: Maximum number of ranges worth fetching separately.
+        max_cells: Maximum number of cells worth fetching sparsely.
+
+    Returns:
+        The ranges to fetch, or None if the tab should be loaded in full
+        (unbounded ranges such as "A:A", too many ranges or too many cells).
+
+    Example:
+        >>> plan_sparse_ranges(["B5", "B7"], max_ranges=100, max_cells=1000)
+        [GridRange(startRowIndex=4, endRowIndex=7, ...)]
+        >>> plan_sparse_ranges(["A:A"], max_ranges=100, max_cells=1000) is None
+        True
+    """
+    grid_ranges = [
+        a1_range_to_grid_range_custom(a1_range) for a1_range in dict.fromkeys(a1_ranges)
+    ]
+    if not grid_ranges or not all(is_bounded(r) for r in grid_ranges):
+        return None
+
+    cells = sum(
+        (r.endRowIndex - r.startRowIndex) * (r.endColumnIndex - r.startColumnIndex)
+        for r in grid_ranges
+    )
+    if cells > max_cells:
+        return None
+
+    box = GridRange(
+        startRowIndex=min(r.startRowIndex for r in grid_ranges),
+        endRowIndex=max(r.endRowIndex for r in grid_ranges),
+        startColumnIndex=min(r.startColumnIndex for r in grid_ranges),
+        endColumnIndex=max(r.endColumnIndex for r in grid_ranges),
+    )
+    box_cells = (box.endRowIndex - box.startRowIndex) * (
+        box.endColumnIndex - box.startColumnIndex
+    )
+    if box_cells <= 2 * cells:
+        return [box] if box_cells <= max_cells else None
+
+    if len(grid_ranges) > max_ranges:
+        return None
+
+    return grid_ranges
+
+
+def coalesce_cells(cells: Iterable[tuple[int, int]]) -> list[GridRange]:
+    """Merge 0-based (row, col) cells into as few rectangles as is cheap.
+
+    Consecutive rows of a column become one vertical run, and identical runs
+    in adjacent columns are merged into one rectangle, so every cell of a
+    returned range is one of the given cells.
+
+    Args:
+        cells: 0-based (row, col) pairs.
+
+    Returns:
+        Bounded GridRanges covering exactly the given cells.
+
+    Example:
+        >>> # C12:D13 plus F5
+        >>> coalesce_cells([(11, 2), (12, 2), (11, 3), (12, 3), (4, 5)])
+        [GridRange(startRowIndex=11, endRowIndex=13, startColumnIndex=2, endColumnIndex=4),
+         GridRange(startRowIndex=4, endRowIndex=5, startColumnIndex=5, endColumnIndex=6)]
+    """
+    rows_by_col: dict[int, list[int]] = {}
+    for row, col in set(cells):
+        rows_by_col.setdefault(col, []).append(row)
+
+    closed: list[tuple[int, int, int, int]] = []
+    # (start_row, end_row) -> [start_col, end_col) of the rectangle being grown
+    open_runs: dict[tuple[int, int], list[int]] = {}
+
+    for col in sorted(rows_by_col):
+        rows = sorted(rows_by_col[col])
+        run_start = rows[0]
+        runs = []
+        for prev, row in zip(rows, rows[1:]):
+            if row != prev + 1:
+                runs.append((run_start, prev + 1))
+                run_start = row
+        runs.append((run_start, rows[-1] + 1))
+
+        for run in runs:
+            columns = open_runs.get(run)
+            if columns is not None and columns[1] == col:
+                columns[1] = col + 1
+                continue
+            if columns is not None:
+                closed.append((*run, *columns))
+            open_runs[run] = [col, col + 1]
+
+    closed.extend((*run, *columns) for run, columns in open_runs.items())
+
+    return [
+        GridRange(
+            startRowIndex=start_row,
+            endRowIndex=end_row,
+            startColumnIndex=start_col,
+            endColumnIndex=end_col,
+        )
+        for start_row, end_row, start_col, end_col in sorted(
+            closed, key=lambda r: (r[2], r[0])
+        )
+    ]
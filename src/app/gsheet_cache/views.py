@@ -0,0 +1,105 @@
+"""Read-only views over cached sheet data.
+
+This module provides lazy views that read cells straight from a CacheSheet's
+in-memory grid instead of copying them, so large column reads only pay for
+the cells the caller actually looks at.
+
+Classes:
+    ColumnView: Lazy sequence over one column of a cached sheet.
+
+Example:
+    >>> column = sheet.get_column("A:A")
+    >>> len(column)
+    1000
+    >>> column[0]
+    'CHECK'
+    >>> [i for i, value in enumerate(column) if value == "1"]
+"""
+
+from typing import Iterator, Mapping, Sequence, overload
+
+
+class ColumnView(Sequence[str | None]):
+    """Lazy, read-only sequence over one column of a cached sheet.
+
+    Values are read from the grid (or the sparse cell map) of the snapshot
+    that was current when the view was created; empty cells are returned as
+    None, like CacheSheet.get_range(). Slicing returns another view without
+    copying.
+
+    Attributes:
+        col: The 0-based column index.
+        start: The first 0-based row index (inclusive).
+        stop: The last 0-based row index (exclusive).
+    """
+
+    def __init__(
+        self,
+        col: int,
+        start: int,
+        stop: int,
+        rows: Sequence[Sequence[str]] | None = None,
+        sparse: Mapping[tuple[int, int], str] | None = None,
+    ) -> None:
+        """Initialize a ColumnView.
+
+        Args:
+            col: The 0-based column index.
+            start: The first 0-based row index (inclusive).
+            stop: The last 0-based row index (exclusive).
+            rows: The full grid of the sheet, not modified while the view
+                is in use.
+            sparse: The sparse cell map of the sheet, used when ``rows`` is
+                None.
+        """
+        self.col = col
+        self.start = start
+        self.stop = max(start, stop)
+        self._rows = rows
+        self._sparse = sparse
+
+    def __value(self, row: int) -> str | None:
+        if self._rows is None:
+            return (self._sparse or {}).get((row, self.col))
+
+        if row >= len(self._rows):
+            return None
+        cells = self._rows[row]
+        if self.col >= len(cells):
+            return None
+        return cells[self.col] or None
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    @overload
+    def __getitem__(self, index: int) -> str | None: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ColumnView": ...
+
+    def __getitem__(self, index: int | slice) -> "str | None | ColumnView":
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("ColumnView slices do not support steps")
+            return ColumnView(
+                self.col,
+                self.start + start,
+                self.start + stop,
+                rows=self._rows,
+                sparse=self._sparse,
+            )
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ColumnView index out of range")
+        return self.__value(self.start + index)
+
+    def __iter__(self) -> Iterator[str | None]:
+        for row in range(self.start, self.stop):
+            yield self.__value(row)
+
+    def __repr__(self) -> str:
+        return f"ColumnView(col={self.col}, rows={self.start}:{self.stop})"
@@ -1,4 +1,4 @@
-from .gsheet_cache import GSheetCacheConfig, GSheetCacheManager
+from .gsheet_cache import GSheetCacheConfig, GSheetCacheManager, RefreshPolicy
 
 from app.shared.paths import ROOT_PATH
 from app import config
@@ -6,16 +6,67 @@ from app import config
 gsheet_cache_config = GSheetCacheConfig(
     cache_dir=ROOT_PATH / ".gsheet_cache",
     keys_dir=ROOT_PATH / "keys",
+    role_policies={
+        # Row settings edited by hand, read every round
+        "main": RefreshPolicy(refresh_interval=60, max_age=300, priority=100),
+        # Min price formulas recompute constantly, without changing the
+        # spreadsheet's modified time
+        "min": RefreshPolicy(
+            refresh_interval=30, max_age=120, priority=50, check_revision=False
+        ),
+        "max": RefreshPolicy(refresh_interval=300, max_age=900, priority=40),
+        # Stock changes roughly hourly, through IMPORTRANGE formulas
+        "stock": RefreshPolicy(
+            refresh_interval=600, priority=30, check_revision=False
+        ),
+        # Blacklists change weekly
+        "blacklist": RefreshPolicy(refresh_interval=3600, priority=0),
+    },
+    # Rarely read tabs go back to their on-disk snapshot past this
+    memory_budget_mb=256,
+    # Hand-edited tabs are only fetched again once they were modified
+    check_revisions=True,
 )
 
 
 gsheet_cache_manager = GSheetCacheManager(config=gsheet_cache_config)
 
+# The main sheet is the largest tab loaded in full, load it without one huge
+# response
+MAIN_SHEET_PAGE_ROWS = 5000
+
+# Pricing tabs are loaded sparsely, but a read outside their referenced
+# ranges downloads the whole tab, which is as large as the main sheet for
+# the biggest ones: page those downloads too
+PRICING_SHEET_PAGE_ROWS = 5000
+PRICING_ROLES = frozenset({"min", "max", "stock"})
+
 
 def initialize_gsheet_cache_manager() -> None:
     global gsheet_cache_manager
 
-    gsheet_cache_manager.add_sheet(
+    gsheet_cache_manager.assign_role(
         sheet_id=config.SHEET_ID,
         sheet_name=config.SHEET_NAME,
+        role="main",
     )
+    gsheet_cache_manager.set_page_rows(
+        sheet_id=config.SHEET_ID,
+        sheet_name=config.SHEET_NAME,
+        page_rows=MAIN_SHEET_PAGE_ROWS,
+    )
+    gsheet_cache_manager.add_sheets([(config.SHEET_ID, config.SHEET_NAME)])
+
+
+def register_referenced_sheets(roles: dict[tuple[str, str], set[str]]) -> None:
+    """Assign their roles to the sheets referenced by the main sheet's rows,
+    and page the full downloads of pricing tabs."""
+    for (sheet_id, sheet_name), sheet_roles in roles.items():
+        for role in sheet_roles:
+            gsheet_cache_manager.assign_role(sheet_id, sheet_name, role)
+        if sheet_roles & PRICING_ROLES:
+            gsheet_cache_manager.set_page_rows(
+                sheet_id=sheet_id,
+                sheet_name=sheet_name,
+                page_rows=PRICING_SHEET_PAGE_ROWS,
+            )
@@ -1,9 +1,13 @@
 import logging
+import time
 from datetime import datetime
 
 from app import config
 from app.crwl.crwl import accounts_extract
 from app.gameboost.api import gameboost_api_client
+from app.gameboost.models import OfferUpdateIntent, OfferUpdateResult
+from app.gameboost.outbox import get_price_update_outbox
+from app.shared.enums import OfferType
 from app.shared.utils import formated_datetime
 from app.sheet.models import RowModel
 
@@ -20,21 +24,48 @@ logger = logging.getLogger(__name__)
 def update_multiple_accounts(
     account_offer_ids: list[str],
     prices: float,
-) -> None:
+) -> list[OfferUpdateResult]:
     if config.TEST_MODE:
         logger.info(f"[TEST_MODE] Skipping API calls for accounts: {account_offer_ids}")
-        return
-    for account_offer_id in account_offer_ids:
-        try:
-            res = gameboost_api_client.update_account_offer(
-                account_offer_id=account_offer_id,
-                price=prices,
-            )
-            logger.info(
-                f"Updated account offer {account_offer_id} with price {prices}\n Update response: {res}"
+        return []
+
+    created_at = time.time()
+    intents = [
+        OfferUpdateIntent(
+            offer_type=OfferType.Account.value,
+            offer_id=account_offer_id,
+            price=prices,
+            created_at=created_at,
+        )
+        for account_offer_id in account_offer_ids
+    ]
+    get_price_update_outbox().put(*intents)
+
+    results = gameboost_api_client.update_account_offers(
+        account_offer_ids=account_offer_ids,
+        price=prices,
+    )
+    get_price_update_outbox().record_results(intents, results)
+    for result in results:
+        if not result.success:
+            logger.error(
+                f"Error updating account offer {result.offer_id} after {result.attempts} attempt(s): {result.error}"
             )
-        except Exception as e:
-            logger.exception(f"Error updating account offer {account_offer_id}: {e}")
+
+    return results
+
+
+def update_summary(results: list[OfferUpdateResult]) -> str:
+    if not results:
+        return ""
+
+    succeeded = sum(1 for result in results if result.success)
+    summary = f"\nTài khoản cập nhật: {succeeded}/{len(results)}"
+    failed = [result for result in results if not result.success]
+    if failed:
+        summary += f"; Lỗi: {', '.join(f'{result.offer_id} ({result.error})' for result in failed)}"
+
+    return summary
 
 
 def account_process(sb, run_row: RowModel) -> RowModel | None:
@@ -49,13 +80,13 @@ def account_process(sb, run_row: RowModel) -> RowModel | None:
         min_price = run_row.min_price()
         max_price = run_row.max_price()
 
-        update_multiple_accounts(
+        results = update_multiple_accounts(
             account_offer_ids=account_offer_ids,
             prices=min_price,
         )
 
         note = f"{formated_datetime(now)}: Không so sánh, Cập nhật theo giá min. PRICE={min_price}, Pricemin={min_price}, Pricemax={max_price}"
-        run_row.Note = note
+        run_row.Note = note + update_summary(results)
         run_row.Last_update = formated_datetime(datetime.now())
         return run_row
 
@@ -71,13 +102,13 @@ def account_process(sb, run_row: RowModel) -> RowModel | None:
         min_price = run_row.min_price()
         max_price = run_row.max_price()
 
-        update_multiple_accounts(
+        results = update_multiple_accounts(
             account_offer_ids=account_offer_ids,
             prices=min_price,
         )
 
         note = f"{formated_datetime(now)}: Không thể quét giá: {e}, Cập nhật theo giá min. PRICE={min_price}, Pricemin={min_price}, Pricemax={max_price}"
-        run_row.Note = note
+        run_row.Note = note + update_summary(results)
         run_row.Last_update = formated_datetime(datetime.now())
         return run_row
 
@@ -99,21 +130,23 @@ def account_process(sb, run_row: RowModel) -> RowModel | None:
         target_price = max_price if max_price else min_price
 
         # No valid offers, update to min price
-        update_multiple_accounts(
+        results = update_multiple_accounts(
             account_offer_ids=account_offer_ids,
             prices=target_price,
         )
 
         lower_price_offers = find_lower_price_offers(crwl_offers, min_price)
         note = f"{formated_datetime(now)}: Không có sản phẩm hợp lệ so sánh, Giá đã cập nhật thành công; Price = {target_price:f}; Pricemin = {min_price:f}, Pricemax = {max_price:f}\nSeller có giá thấp hơn: {', '.join([f'{offer.seller} - {offer.price}' for offer in lower_price_offers if offer.seller != config.MY_SELLER_NAME])}"
-        run_row.Note = note
+        run_row.Note = note + update_summary(results)
         run_row.Last_update = formated_datetime(datetime.now())
         return run_row
 
     if config.TEST_MODE:
         current_price = None
     else:
-        my_account_offer = gameboost_api_client.get_account_offer(run_row.Product_link)
+        my_account_offer = gameboost_api_client.get_account_offer_pricing(
+            run_row.Product_link
+        )
         logger.debug(f"my_account_offer: {my_account_offer}")
         current_price = my_account_offer.data.price.amount
 
@@ -135,7 +168,7 @@ def account_process(sb, run_row: RowModel) -> RowModel | None:
         )
 
     # Update price if changed
-    update_multiple_accounts(
+    results = update_multiple_accounts(
         account_offer_ids=account_offer_ids,
         prices=new_price,
     )
@@ -144,6 +177,6 @@ def account_process(sb, run_row: RowModel) -> RowModel | None:
     note = f"""{formated_datetime(now)}:Giá đã cập nhật thành công; Price = {new_price:f}; Pricemin = {min_price:f}, Pricemax = {max_price:f}, GiaSosanh = {offer_min_price.price:f} - Seller: {offer_min_price.seller}
 Seller có giá thấp hơn: {", ".join([f"{offer.seller} - {offer.price:f}" for offer in lower_price_offers if offer.seller != config.MY_SELLER_NAME])}
 """
-    run_row.Note = note
+    run_row.Note = note + update_summary(results)
     run_row.Last_update = formated_datetime(datetime.now())
     return run_row
@@ -4,6 +4,9 @@ from datetime import datetime
 from app import config
 from app.crwl.crwl import currencies_extract
 from app.gameboost.api import gameboost_api_client
+from app.gameboost.models import OfferUpdateIntent
+from app.gameboost.outbox import get_price_update_outbox
+from app.shared.enums import OfferType
 from app.shared.utils import formated_datetime
 from app.sheet.models import RowModel
 
@@ -31,11 +34,15 @@ def currency_process(sb, run_row: RowModel) -> RowModel | None:
         min_qty = run_row.calc_min_quantity(min_price)
 
         if not config.TEST_MODE:
-            res = gameboost_api_client.update_currency_offer(
-                currency_offer_id=run_row.Product_link,
-                price=min_price,
-                stock=stock,
-                min_quantity=min_qty,
+            res = get_price_update_outbox().submit(
+                OfferUpdateIntent(
+                    offer_type=OfferType.Currency.value,
+                    offer_id=run_row.Product_link,
+                    price=min_price,
+                    stock=stock,
+                    min_quantity=min_qty,
+                    created_at=now.timestamp(),
+                )
             )
             logger.info(f"Update currency offer response: {res}")
         else:
@@ -61,11 +68,15 @@ def currency_process(sb, run_row: RowModel) -> RowModel | None:
         min_qty = run_row.calc_min_quantity(min_price)
 
         if not config.TEST_MODE:
-            res = gameboost_api_client.update_currency_offer(
-                currency_offer_id=run_row.Product_link,
-                price=min_price,
-                stock=stock,
-                min_quantity=min_qty,
+            res = get_price_update_outbox().submit(
+                OfferUpdateIntent(
+                    offer_type=OfferType.Currency.value,
+                    offer_id=run_row.Product_link,
+                    price=min_price,
+                    stock=stock,
+                    min_quantity=min_qty,
+                    created_at=now.timestamp(),
+                )
             )
             logger.info(f"Update currency offer response: {res}")
         else:
@@ -98,11 +109,15 @@ def currency_process(sb, run_row: RowModel) -> RowModel | None:
 
         # No valid offers, update to min price
         if not config.TEST_MODE:
-            res = gameboost_api_client.update_currency_offer(
-                currency_offer_id=run_row.Product_link,
-                price=target_price,
-                stock=stock,
-                min_quantity=min_qty,
+            res = get_price_update_outbox().submit(
+                OfferUpdateIntent(
+                    offer_type=OfferType.Currency.value,
+                    offer_id=run_row.Product_link,
+                    price=target_price,
+                    stock=stock,
+                    min_quantity=min_qty,
+                    created_at=now.timestamp(),
+                )
             )
             logger.info(f"Update currency offer response: {res}")
         else:
@@ -118,7 +133,9 @@ def currency_process(sb, run_row: RowModel) -> RowModel | None:
     if config.TEST_MODE:
         current_price = None
     else:
-        my_item_offer = gameboost_api_client.get_currency_offer(run_row.Product_link)
+        my_item_offer = gameboost_api_client.get_currency_offer_pricing(
+            run_row.Product_link
+        )
         current_price = my_item_offer.data.price_eur.amount
     # Calculate new price
     if (
@@ -140,11 +157,15 @@ def currency_process(sb, run_row: RowModel) -> RowModel | None:
     # Update price if changed
     min_qty = run_row.calc_min_quantity(new_price)
     if not config.TEST_MODE:
-        res = gameboost_api_client.update_currency_offer(
-            currency_offer_id=run_row.Product_link,
-            price=new_price,
-            stock=stock,
-            min_quantity=min_qty,
+        res = get_price_update_outbox().submit(
+            OfferUpdateIntent(
+                offer_type=OfferType.Currency.value,
+                offer_id=run_row.Product_link,
+                price=new_price,
+                stock=stock,
+                min_quantity=min_qty,
+                created_at=now.timestamp(),
+            )
         )
         logger.info(f"Update currency offer response: {res}")
     else:
@@ -4,6 +4,9 @@ from datetime import datetime
 from app import config
 from app.crwl.crwl import items_extract
 from app.gameboost.api import gameboost_api_client
+from app.gameboost.models import OfferUpdateIntent
+from app.gameboost.outbox import get_price_update_outbox
+from app.shared.enums import OfferType
 from app.shared.utils import formated_datetime
 from app.sheet.models import RowModel
 
@@ -33,11 +36,15 @@ def item_process(sb, run_row: RowModel) -> RowModel | None:
         min_qty = run_row.calc_min_quantity(min_price)
 
         if not config.TEST_MODE:
-            res = gameboost_api_client.update_item_offer(
-                item_offer_id=run_row.Product_link,
-                price=min_price,
-                stock=stock,
-                min_quantity=min_qty,
+            res = get_price_update_outbox().submit(
+                OfferUpdateIntent(
+                    offer_type=OfferType.Item.value,
+                    offer_id=run_row.Product_link,
+                    price=min_price,
+                    stock=stock,
+                    min_quantity=min_qty,
+                    created_at=now.timestamp(),
+                )
             )
             logger.info(f"Update item offer response: {res}")
         else:
@@ -63,11 +70,15 @@ def item_process(sb, run_row: RowModel) -> RowModel | None:
         min_qty = run_row.calc_min_quantity(min_price)
 
         if not config.TEST_MODE:
-            res = gameboost_api_client.update_item_offer(
-                item_offer_id=run_row.Product_link,
-                price=min_price,
-                stock=stock,
-                min_quantity=min_qty,
+            res = get_price_update_outbox().submit(
+                OfferUpdateIntent(
+                    offer_type=OfferType.Item.value,
+                    offer_id=run_row.Product_link,
+                    price=min_price,
+                    stock=stock,
+                    min_quantity=min_qty,
+                    created_at=now.timestamp(),
+                )
             )
             logger.info(f"Update item offer response: {res}")
         else:
@@ -100,11 +111,15 @@ def item_process(sb, run_row: RowModel) -> RowModel | None:
 
         # No valid offers, update to min price
         if not config.TEST_MODE:
-            res = gameboost_api_client.update_item_offer(
-                item_offer_id=run_row.Product_link,
-                price=target_price,
-                stock=stock,
-                min_quantity=min_qty,
+            res = get_price_update_outbox().submit(
+                OfferUpdateIntent(
+                    offer_type=OfferType.Item.value,
+                    offer_id=run_row.Product_link,
+                    price=target_price,
+                    stock=stock,
+                    min_quantity=min_qty,
+                    created_at=now.timestamp(),
+                )
             )
             logger.info(f"Update item offer response: {res}")
         else:
@@ -120,7 +135,9 @@ def item_process(sb, run_row: RowModel) -> RowModel | None:
     if config.TEST_MODE:
         current_price = None
     else:
-        my_item_offer = gameboost_api_client.get_item_offer(run_row.Product_link)
+        my_item_offer = gameboost_api_client.get_item_offer_pricing(
+            run_row.Product_link
+        )
         current_price = my_item_offer.data.price_eur.amount
 
     # Calculate new price
@@ -143,11 +160,15 @@ def item_process(sb, run_row: RowModel) -> RowModel | None:
     # Update price if changed
     min_qty = run_row.calc_min_quantity(new_price)
     if not config.TEST_MODE:
-        res = gameboost_api_client.update_item_offer(
-            item_offer_id=run_row.Product_link,
-            price=new_price,
-            stock=stock,
-            min_quantity=min_qty,
+        res = get_price_update_outbox().submit(
+            OfferUpdateIntent(
+                offer_type=OfferType.Item.value,
+                offer_id=run_row.Product_link,
+                price=new_price,
+                stock=stock,
+                min_quantity=min_qty,
+                created_at=now.timestamp(),
+            )
         )
         logger.info(f"Update item offer response: {res}")
     else:
@@ -3,6 +3,7 @@ from typing import Callable
 
 from tenacity import (
     retry,
+    retry_if_exception,
     retry_if_exception_type,
     stop_after_attempt,
     wait_fixed,
@@ -13,13 +14,27 @@ _logger = logging.getLogger(__name__)
 
 
 def retry_on_fail(
-    max_retries: int = 3, sleep_interval: float = 0.5, exceptions: tuple = (Exception,)
+    max_retries: int = 3,
+    sleep_interval: float = 0.5,
+    exceptions: tuple = (Exception,),
+    retry_if: Callable[[BaseException], bool] | None = None,
 ) -> Callable:
+    """Retry the decorated function on ``exceptions``, with a fixed sleep.
+
+    ``retry_if`` narrows the retried exceptions further, e.g. to the
+    HTTP errors that may succeed when sent again.
+    """
+    should_retry = retry_if_exception_type(exceptions)
+    if retry_if is not None:
+        should_retry = retry_if_exception(
+            lambda e: isinstance(e, exceptions) and retry_if(e)
+        )
+
     def wrapper(func: Callable) -> Callable:
         return retry(
             stop=stop_after_attempt(max_retries + 1),
             wait=wait_fixed(sleep_interval),
-            retry=retry_if_exception_type(exceptions),
+            retry=should_retry,
             before_sleep=before_sleep_log(_logger, logging.INFO),
             reraise=True,
         )(func)
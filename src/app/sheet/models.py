@@ -1,9 +1,12 @@
-from typing import Annotated, Final, Self, TypeVar, Generic
+from functools import cache
+from typing import Annotated, Final, Iterator, Self, TypeVar, Generic
 import logging
 import math
 
 from pydantic import BaseModel, ConfigDict
 
+from app.gsheet_cache import DirtyRows
+from app.gsheet_cache.utils import a1_to_indices
 from app.gsheet_cache_manager import gsheet_cache_manager
 
 from ..shared.decorators import retry_on_fail
@@ -16,6 +19,15 @@ COL_META: Final[str] = "col_name_xxx"
 IS_UPDATE_META: Final[str] = "is_update_xxx"
 IS_NOTE_META: Final[str] = "is_note_xxx"
 
+# (spreadsheet id, tab name, cell/range) field triples RowModel reads from other sheets
+# keyed by the role the referenced sheet plays (see gsheet_cache_manager refresh policies)
+REFERENCE_FIELDS: Final[dict[str, tuple[str, str, str]]] = {
+    "min": ("IDSHEET_MIN", "SHEET_MIN", "CELL_MIN"),
+    "max": ("IDSHEET_MAX", "SHEET_MAX", "CELL_MAX"),
+    "stock": ("IDSHEET_STOCK", "SHEET_STOCK", "CELL_STOCK"),
+    "blacklist": ("IDSHEET_BLACKLIST", "SHEET_BLACKLIST", "CELL_BLACKLIST"),
+}
+
 _logger = logging.getLogger(__name__)
 
 
@@ -70,6 +82,18 @@ class ColSheetModel(BaseModel):
 
         return mapping_fields
 
+    @classmethod
+    @cache
+    def column_indices(cls) -> dict[str, int]:
+        """
+        Get a mapping of model field names to 0-based column indices,
+        resolved once per model class.
+        """
+        return {
+            field_name: a1_to_indices(f"{col}1")[1]
+            for field_name, col in cls.mapping_fields().items()
+        }
+
     @classmethod
     def get(
         cls,
@@ -77,7 +101,10 @@ class ColSheetModel(BaseModel):
         sheet_name: str,
         index: int,
     ) -> Self:
-        mapping_dict = cls.mapping_fields()
+        sheet = gsheet_cache_manager.get_sheet(
+            sheet_id=sheet_id,
+            sheet_name=sheet_name,
+        )
 
         model_dict = {
             "index": index,
@@ -85,12 +112,9 @@ class ColSheetModel(BaseModel):
             "sheet_name": sheet_name,
         }
 
-        for k, v in mapping_dict.items():
-            model_dict[k] = gsheet_cache_manager.get_value(
-                sheet_id=sheet_id,
-                sheet_name=sheet_name,
-                cell=f"{v}{index}",
-            )
+        row = index - 1
+        for k, col in cls.column_indices().items():
+            model_dict[k] = sheet.get_cell(row, col)
 
         return cls.model_validate(model_dict)
 
@@ -260,12 +284,12 @@ class RowModel(ColSheetModel):
             sheet_name=self.SHEET_MIN,
         )
 
-        min_value = gsheet_cache_manager.get_value(
+        min_value = gsheet_cache_manager.get_float(
             sheet_id=self.IDSHEET_MIN, sheet_name=self.SHEET_MIN, cell=self.CELL_MIN
         )
 
         if min_value is not None:
-            return float(min_value)
+            return min_value
 
         raise SheetError(
             f"{self.IDSHEET_MIN}->{self.SHEET_MIN}->{self.CELL_MIN} is None"
@@ -280,11 +304,11 @@ class RowModel(ColSheetModel):
             sheet_name=self.SHEET_MAX,
         )
 
-        max_value = gsheet_cache_manager.get_value(
+        max_value = gsheet_cache_manager.get_float(
             sheet_id=self.IDSHEET_MAX, sheet_name=self.SHEET_MAX, cell=self.CELL_MAX
         )
         if max_value is not None:
-            return float(max_value)
+            return max_value
 
         return None
 
@@ -296,14 +320,14 @@ class RowModel(ColSheetModel):
             sheet_id=self.IDSHEET_STOCK,
             sheet_name=self.SHEET_STOCK,
         )
-        stock_value = gsheet_cache_manager.get_value(
+        stock_value = gsheet_cache_manager.get_int(
             sheet_id=self.IDSHEET_STOCK,
             sheet_name=self.SHEET_STOCK,
             cell=self.CELL_STOCK,
         )
 
         if stock_value is not None:
-            return int(stock_value)
+            return stock_value
 
         raise SheetError(
             f"{self.IDSHEET_STOCK}->{self.SHEET_STOCK}->{self.CELL_STOCK} is None"
@@ -322,20 +346,15 @@ class RowModel(ColSheetModel):
             sheet_name=self.SHEET_BLACKLIST,
         )
 
-        blacklist = gsheet_cache_manager.get_range(
-            sheet_id=self.IDSHEET_BLACKLIST,
-            sheet_name=self.SHEET_BLACKLIST,
-            a1_range=self.CELL_BLACKLIST,
-        )
-
-        if blacklist:
-            res = []
-            for blist in blacklist:
-                for i in blist:
-                    res.append(i)
-            return res
-
-        return []
+        return [
+            value
+            for row in gsheet_cache_manager.iter_range(
+                sheet_id=self.IDSHEET_BLACKLIST,
+                sheet_name=self.SHEET_BLACKLIST,
+                a1_range=self.CELL_BLACKLIST,
+            )
+            for value in row
+        ]
 
     def include_keywords(self) -> list[str] | None:
         if self.INCLUDE_KEYWORDS is None:
@@ -407,23 +426,101 @@ class RowModel(ColSheetModel):
         raw = total / unit_price
         return math.ceil(raw / factor) * factor
 
+    @classmethod
+    def _iter_references(
+        cls, sheet_id: str, sheet_name: str, indexes: list[int]
+    ) -> Iterator[tuple[int, str, str, str, str]]:
+        """Yield (index, role, ref_sheet_id, ref_sheet_name, ref_cell) of the rows."""
+        mapping_dict = cls.mapping_fields()
+
+        for index in indexes:
+            for role, fields in REFERENCE_FIELDS.items():
+                ref_sheet_id, ref_sheet_name, ref_cell = (
+                    gsheet_cache_manager.get_value(
+                        sheet_id=sheet_id,
+                        sheet_name=sheet_name,
+                        cell=f"{mapping_dict[field]}{index}",
+                    )
+                    for field in fields
+                )
+                if ref_sheet_id and ref_sheet_name and ref_cell:
+                    yield index, role, ref_sheet_id, ref_sheet_name, ref_cell
+
+    @classmethod
+    def referenced_sheets(
+        cls, sheet_id: str, sheet_name: str, indexes: list[int]
+    ) -> tuple[dict[tuple[str, str], list[str]], dict[tuple[str, str], set[str]]]:
+        """
+        Collect, in one pass over the given rows, the cells/ranges they read
+        prices, stock and blacklists from, and the roles (min, max, stock,
+        blacklist) each referenced sheet plays. Both are keyed by
+        (sheet_id, sheet_name), so the sheets can be loaded up front in
+        batches.
+        """
+        ranges: dict[tuple[str, str], list[str]] = {}
+        roles: dict[tuple[str, str], set[str]] = {}
+        for _, role, ref_sheet_id, ref_sheet_name, ref_cell in cls._iter_references(
+            sheet_id, sheet_name, indexes
+        ):
+            key = (ref_sheet_id, ref_sheet_name)
+            ranges.setdefault(key, []).append(ref_cell)
+            roles.setdefault(key, set()).add(role)
+
+        return ranges, roles
+
+    @classmethod
+    def track_references(
+        cls, dirty_rows: DirtyRows, sheet_id: str, sheet_name: str, indexes: list[int]
+    ) -> None:
+        """
+        Mark each of the given rows dirty when a price, stock or blacklist
+        cell it references changes in a reload of the referenced sheet. The
+        rows' previous dependencies are dropped first, so edited references
+        are followed. Range references (e.g. a whole blacklist column) are
+        not watched, their sheets only count through their refresh policy.
+        The referenced sheets should be loaded (see referenced_sheets()); a
+        reference to a sheet that failed to load, e.g. a mistyped tab name,
+        is skipped with a warning and the row counts as changed, since its
+        changes cannot be watched.
+        """
+        for index in indexes:
+            dirty_rows.forget(index - 1)
+
+        for index, _, ref_sheet_id, ref_sheet_name, ref_cell in cls._iter_references(
+            sheet_id, sheet_name, indexes
+        ):
+            if ":" in ref_cell:
+                continue
+            ref_sheet = gsheet_cache_manager.sheets.get((ref_sheet_id, ref_sheet_name))
+            if ref_sheet is None:
+                _logger.warning(
+                    "Row %s references %s of %s - %s, which is not loaded",
+                    index,
+                    ref_cell,
+                    ref_sheet_id,
+                    ref_sheet_name,
+                )
+                dirty_rows.mark([index - 1])
+                continue
+            dirty_rows.depend(index - 1, ref_sheet, ref_cell)
+
     @classmethod
     @retry_on_fail(max_retries=5, sleep_interval=10)
     def get_run_indexes(
         cls, sheet_id: str, sheet_name: str, col_range: str
     ) -> list[int]:
         run_indexes = []
-        check_col = gsheet_cache_manager.get_range(
+        check_values = [type.value for type in CheckType]
+        check_col = gsheet_cache_manager.get_column(
             sheet_id=sheet_id,
             sheet_name=sheet_name,
             a1_range=col_range,
         )
-        for idx, value in enumerate(check_col):
+        for idx, _value in enumerate(check_col):
             idx += 1
-            _value = value[0]
             if not isinstance(_value, str):
                 _value = str(_value)
-            if _value in [type.value for type in CheckType]:
+            if _value in check_values:
                 run_indexes.append(idx)
 
         return run_indexes
@@ -0,0 +1,42 @@
+import logging
+
+from . import models as models_module
+from .models import RowModel
+
+
+class RecordingDirtyRows:
+    def __init__(self) -> None:
+        self.dependencies: list[tuple[int, object, str]] = []
+        self.marked: list[int] = []
+
+    def forget(self, row):
+        pass
+
+    def depend(self, row, source, cells):
+        self.dependencies.append((row, source, cells))
+
+    def mark(self, rows):
+        self.marked.extend(rows)
+
+
+def test_track_references_skips_sheets_that_are_not_loaded(monkeypatch, caplog):
+    min_sheet = object()
+    references = [
+        (2, "min", "prices", "Min", "B2"),
+        (3, "min", "prices", "Mni", "B3"),  # a mistyped tab name
+        (3, "blacklist", "prices", "Blacklist", "A:A"),
+    ]
+    monkeypatch.setattr(
+        RowModel, "_iter_references", classmethod(lambda cls, *args: iter(references))
+    )
+    monkeypatch.setattr(
+        models_module.gsheet_cache_manager, "sheets", {("prices", "Min"): min_sheet}
+    )
+    dirty_rows = RecordingDirtyRows()
+
+    with caplog.at_level(logging.WARNING):
+        RowModel.track_references(dirty_rows, "main", "Main", [2, 3])
+
+    assert dirty_rows.dependencies == [(1, min_sheet, "B2")]
+    assert dirty_rows.marked == [2]
+    assert "Mni" in caplog.text
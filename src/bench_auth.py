@@ -0,0 +1,80 @@
+"""Authentication cost of a round of referenced tabs.
+
+Generates throwaway service account keys and compares creating one
+authorized gspread client per tab, as every CacheSheet used to do, with the
+clients shared through KeyPool. Building a client parses the key JSON and
+sets up credentials and a session; each new client also fetches its own
+OAuth token on its first request, which is counted but not timed here since
+it needs the network.
+
+Usage:
+    uv run .\\src\\bench_auth.py --tabs 15 --keys 2
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import rsa
+from gspread import service_account
+
+from app.gsheet_cache import GSheetCacheConfig, KeyPool
+
+
+def write_keys(keys_dir: Path, count: int) -> list[Path]:
+    keys = []
+    # Key files differ by name only, a 2048-bit keygen takes seconds
+    _, private_key = rsa.newkeys(2048)
+    pem = private_key.save_pkcs1().decode()
+    for i in range(count):
+        path = keys_dir / f"bench-{i}.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "type": "service_account",
+                    "project_id": "bench",
+                    "private_key_id": f"key{i}",
+                    "private_key": pem,
+                    "client_email": f"bench-{i}@bench.iam.gserviceaccount.com",
+                    "client_id": str(i),
+                    "token_uri": "https://oauth2.googleapis.com/token",
+                }
+            )
+        )
+        keys.append(path)
+    return keys
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tabs", type=int, default=15)
+    parser.add_argument("--keys", type=int, default=2)
+    args = parser.parse_args()
+
+    keys_dir = Path(tempfile.mkdtemp(prefix="bench_auth_"))
+    keys = write_keys(keys_dir, args.keys)
+
+    started = time.perf_counter()
+    for tab in range(args.tabs):
+        service_account(filename=str(keys[tab % len(keys)]))
+    per_tab = time.perf_counter() - started
+
+    pool = KeyPool.shared(GSheetCacheConfig(cache_dir=keys_dir, keys_dir=keys_dir))
+    started = time.perf_counter()
+    for _ in range(args.tabs):
+        with pool.lease():
+            pass
+    shared = time.perf_counter() - started
+
+    status = pool.status()
+    print(f"{'client per tab':<24}{per_tab * 1000:>10.1f} ms{args.tabs:>6} token fetches")
+    print(
+        f"{'shared key pool':<24}{shared * 1000:>10.1f} ms"
+        f"{status['authentications']:>6} token fetches"
+    )
+
+
+if __name__ == "__main__":
+    main()
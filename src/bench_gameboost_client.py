@@ -0,0 +1,95 @@
+"""Throughput benchmark for GameboostClient against the local mock API.
+
+Starts app.gameboost.mock_server.MockGameboostServer and drives a fresh
+client at several concurrency levels, reporting requests/s, p50/p99
+latency and failures for a read/write mix.
+
+Usage:
+    uv run .\\src\\bench_gameboost_client.py --latency 0.08 --rate-limit 20
+"""
+
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.gameboost.api import GameboostClient
+from app.gameboost.mock_server import MockGameboostServer
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def call(client: GameboostClient, i: int, write_ratio: float) -> tuple[float, bool]:
+    offer_id = str(1000 + i % 50)
+    started = time.perf_counter()
+    try:
+        if (i % 100) < write_ratio * 100:
+            client.update_item_offer(offer_id, price=1.5 + i / 1000, stock=10)
+        else:
+            client.get_item_offer(offer_id)
+        ok = True
+    except Exception:
+        ok = False
+    return time.perf_counter() - started, ok
+
+
+def run_level(
+    server: MockGameboostServer, concurrency: int, requests: int, write_ratio: float
+) -> None:
+    client = GameboostClient(base_url=server.url, api_key="benchmark")
+    before = dict(server.stats)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(
+            executor.map(lambda i: call(client, i, write_ratio), range(requests))
+        )
+    wall = time.perf_counter() - started
+
+    latencies = [latency for latency, ok in results if ok]
+    failures = sum(1 for _, ok in results if not ok)
+    throttled = server.stats["throttled"] - before["throttled"]
+    print(
+        f"{concurrency:>11}{len(latencies) / wall:>10.1f}"
+        f"{percentile(latencies, 50) * 1000:>10.1f}{percentile(latencies, 99) * 1000:>10.1f}"
+        f"{statistics.fmean(latencies) * 1000 if latencies else 0:>10.1f}"
+        f"{failures:>9}{throttled:>10}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=None)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--write-ratio", type=float, default=0.3)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    with MockGameboostServer(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        retry_after=args.retry_after,
+    ) as server:
+        print(f"Mock GameBoost API at {server.url}")
+        print(
+            f"{'concurrency':>11}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}"
+            f"{'mean ms':>10}{'failed':>9}{'429s':>10}"
+        )
+        for concurrency in args.concurrency:
+            run_level(server, concurrency, args.requests, args.write_ratio)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""End-to-end throughput of gsheet_cache against a local Sheets API.
+
+Starts a MockSheetsServer with synthetic tabs and measures, through the real
+gspread and key pool code paths:
+
+- load: cold load of every tab through GSheetCacheManager.add_sheets()
+- read: get_value() calls per second on the loaded cache
+- flush: cells per second pushed by flush_to_sheet()
+- keys: a burst of refreshes using up the server's per-key quota, showing
+  how the key pool spreads them over the keys
+
+Usage:
+    uv run .\\src\\bench_gsheet_cache.py --spreadsheets 4 --tabs 4 --rows 5000
+    uv run .\\src\\bench_gsheet_cache.py --latency 0.2 --quota 30 --keys 3
+"""
+
+import argparse
+import logging
+import random
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from gspread.utils import rowcol_to_a1
+
+from app.gsheet_cache import CacheSheet, GSheetCacheConfig, GSheetCacheManager, KeyPool
+from app.gsheet_cache.mock_server import MockSheetsServer
+
+
+def report(name: str, seconds: float, count: int, unit: str) -> None:
+    print(f"{name:<8}{seconds * 1000:>10.1f} ms{count / seconds:>14,.0f} {unit}/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--spreadsheets", type=int, default=4)
+    parser.add_argument("--tabs", type=int, default=4, help="tabs per spreadsheet")
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--keys", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--quota", type=int, default=20, help="requests per key and minute")
+    parser.add_argument("--reads", type=int, default=200_000)
+    parser.add_argument("--flush-cells", type=int, default=2000)
+    args = parser.parse_args()
+
+    # google-auth's optional lookups and per-request INFO lines drown the report
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger("urllib3").setLevel(logging.ERROR)
+    logging.getLogger("app.gsheet_cache.keys").setLevel(logging.ERROR)
+
+    work_dir = Path(tempfile.mkdtemp(prefix="bench_gsheet_cache_"))
+    # Loaded sheets write their snapshots in the background
+    cached: list[CacheSheet] = []
+    try:
+        with MockSheetsServer(latency=args.latency) as server:
+            sheets = [
+                (f"spreadsheet-{s}", f"Tab {t}")
+                for s in range(args.spreadsheets)
+                for t in range(args.tabs)
+            ]
+            for sheet_id, sheet_name in sheets:
+                server.add_synthetic_sheet(sheet_id, sheet_name, args.rows, args.cols)
+            keys_dir = work_dir / "keys"
+            server.write_keys(keys_dir, args.keys)
+            cache_dir = work_dir / "cache"
+            cache_dir.mkdir()
+
+            config = GSheetCacheConfig(
+                cache_dir=cache_dir,
+                keys_dir=keys_dir,
+                api_url=server.url,
+                key_requests_per_minute=10_000,
+                warm_start=False,
+            )
+            manager = GSheetCacheManager(config)
+
+            started = time.perf_counter()
+            loaded = manager.add_sheets(sheets)
+            cached.extend(loaded)
+            report("load", time.perf_counter() - started, len(loaded) * args.rows, "rows")
+
+            sheet = loaded[0]
+            cells = [
+                rowcol_to_a1(random.randint(1, args.rows), random.randint(1, args.cols))
+                for _ in range(1000)
+            ]
+            started = time.perf_counter()
+            for i in range(args.reads):
+                sheet.get_value(cells[i % len(cells)])
+            report("read", time.perf_counter() - started, args.reads, "reads")
+
+            for i in range(args.flush_cells):
+                sheet.set_cell(i % args.rows + 1, i // args.rows + 1, f"edit{i}")
+            started = time.perf_counter()
+            sheet.flush_to_sheet()
+            report("flush", time.perf_counter() - started, args.flush_cells, "cells")
+
+            # Separate keys directory, so the burst gets a pool of its own
+            # sized to the server's quota
+            server.quota_per_minute = args.quota
+            burst_keys_dir = work_dir / "burst_keys"
+            server.write_keys(burst_keys_dir, args.keys, prefix="burst")
+            burst_config = GSheetCacheConfig(
+                cache_dir=cache_dir,
+                keys_dir=burst_keys_dir,
+                api_url=server.url,
+                key_requests_per_minute=args.quota,
+                check_revisions=False,
+                warm_start=False,
+            )
+            burst_sheet = GSheetCacheManager(burst_config).add_sheet(*sheets[0])
+            cached.append(burst_sheet)
+            # Together with the initial load, exactly the quota of every key
+            burst = args.quota * args.keys - 1
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(lambda _: burst_sheet.refresh(), range(burst)))
+            report("keys", time.perf_counter() - started, burst, "refreshes")
+
+            status = KeyPool.shared(burst_config).status()
+            print(f"{'':8}{server.stats['throttled']} request(s) throttled by the server")
+            for name, usage in status["keys"].items():
+                print(
+                    f"{'':8}{name:<14}{usage['requests']:>6} requests"
+                    f"{usage['rate_limits']:>4} rate limit(s)"
+                )
+    finally:
+        for sheet in cached:
+            sheet.wait_persisted()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
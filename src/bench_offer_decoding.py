@@ -0,0 +1,60 @@
+"""Per-call decoding cost of GameBoost offer responses.
+
+Decodes the sample responses in app/gameboost/samples the way the client
+used to (``res.json()`` + ``model_validate``), straight from bytes with
+``model_validate_json``, and into the pricing views the processes use
+(``PricingResponse.decode``).
+
+Usage:
+    uv run .\\src\\bench_offer_decoding.py
+"""
+
+import json
+import timeit
+
+from app.gameboost.models import (
+    AccountOffer,
+    AccountOfferPricing,
+    CurrencyOffer,
+    CurrencyOfferPricing,
+    ItemOffer,
+    ItemOfferPricing,
+    OfferResponse,
+    PricingResponse,
+)
+from app.shared.paths import APP_PATH
+
+SAMPLES_PATH = APP_PATH / "gameboost" / "samples"
+NUMBER = 2000
+
+CASES = [
+    ("currency_offer.json", CurrencyOffer, CurrencyOfferPricing),
+    ("item_offer.json", ItemOffer, ItemOfferPricing),
+    ("account_offer.json", AccountOffer, AccountOfferPricing),
+]
+
+
+def per_call_us(func) -> float:
+    return min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+
+def main() -> None:
+    print(
+        f"{'sample':<22}{'size':>9}{'dict+validate':>16}{'from json':>12}"
+        f"{'pricing':>12}"
+    )
+    for file_name, model, pricing in CASES:
+        raw = (SAMPLES_PATH / file_name).read_bytes()
+
+        legacy = per_call_us(lambda: OfferResponse[model].model_validate(json.loads(raw)))
+        from_json = per_call_us(lambda: OfferResponse[model].model_validate_json(raw))
+        lean = per_call_us(lambda: PricingResponse[pricing].decode(raw))
+
+        print(
+            f"{file_name:<22}{len(raw):>8}B{legacy:>14.1f}us{from_json:>10.1f}us"
+            f"{lean:>10.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
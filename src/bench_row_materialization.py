@@ -0,0 +1,119 @@
+"""Per-row cost of materializing RowModel from the cached main sheet.
+
+Builds an in-memory main sheet and compares the previous lookup path (one
+A1 string per field parsed by gspread's regex) with RowModel.get, which
+resolves its columns once and reads cells by index. Also compares parsing a
+referenced price cell on every call with the per-snapshot typed accessor.
+
+Usage:
+    uv run .\\src\\bench_row_materialization.py
+"""
+
+import tempfile
+import timeit
+from pathlib import Path
+
+from gspread.utils import a1_to_rowcol
+
+from app.gsheet_cache import CacheSheet, GSheetCacheConfig
+from app.gsheet_cache_manager import gsheet_cache_manager
+from app.sheet.models import RowModel
+
+SHEET_ID = "benchmark"
+SHEET_NAME = "Main"
+ROWS = 2000
+NUMBER = 20_000
+
+
+def build_row(index: int) -> list[str]:
+    values = {
+        "CHECK": "1",
+        "Product_name": f"Product {index}",
+        "Category": "Currency",
+        "Product_link": f"https://gameboost.com/offers/{index}",
+        "Check_product_compare": "1",
+        "Product_compare": "https://gameboost.com/compare",
+        "DONGIAGIAM_MIN": "0.01",
+        "DONGIAGIAM_MAX": "0.05",
+        "DONGIA_LAMTRON": "3",
+        "IDSHEET_MIN": SHEET_ID,
+        "SHEET_MIN": "Min",
+        "CELL_MIN": f"B{index}",
+        "Relax_time": "1.5",
+    }
+    columns = RowModel.column_indices()
+    row = [""] * (max(columns.values()) + 1)
+    for field_name, col in columns.items():
+        row[col] = values.get(field_name, "")
+    return row
+
+
+def legacy_get(sheet: CacheSheet, index: int) -> RowModel:
+    data = sheet._cache_data
+    assert data is not None
+    model_dict: dict = {"index": index, "sheet_id": SHEET_ID, "sheet_name": SHEET_NAME}
+    for k, v in RowModel.mapping_fields().items():
+        row, col = a1_to_rowcol(f"{v}{index}")
+        value = data[row - 1][col - 1] if col - 1 < len(data[row - 1]) else ""
+        model_dict[k] = value or None
+    return RowModel.model_validate(model_dict)
+
+
+def report(name: str, seconds: float, number: int) -> None:
+    print(f"{name:<40}{seconds / number * 1e6:>10.2f} us/call")
+
+
+def main() -> None:
+    # Nothing is fetched, a placeholder key only satisfies CacheSheet's checks
+    tmp_dir = Path(tempfile.mkdtemp(prefix="bench_rows_"))
+    (tmp_dir / "benchmark.json").write_text("{}")
+    config = GSheetCacheConfig(cache_dir=tmp_dir, keys_dir=tmp_dir)
+
+    main_sheet = CacheSheet(
+        SHEET_ID,
+        SHEET_NAME,
+        config,
+        values=[build_row(i) for i in range(1, ROWS + 1)],
+    )
+    min_sheet = CacheSheet(
+        SHEET_ID,
+        "Min",
+        config,
+        values=[["", f"{i / 100:.2f}"] for i in range(1, ROWS + 1)],
+    )
+    gsheet_cache_manager.sheets[(SHEET_ID, SHEET_NAME)] = main_sheet
+    gsheet_cache_manager.sheets[(SHEET_ID, "Min")] = min_sheet
+
+    indexes = [1 + i % ROWS for i in range(NUMBER)]
+    it = iter(indexes * 2)
+
+    report(
+        "row materialization (A1 per field)",
+        timeit.timeit(lambda: legacy_get(main_sheet, next(it)), number=NUMBER),
+        NUMBER,
+    )
+    report(
+        "row materialization (RowModel.get)",
+        timeit.timeit(
+            lambda: RowModel.get(SHEET_ID, SHEET_NAME, next(it)), number=NUMBER
+        ),
+        NUMBER,
+    )
+
+    cells = iter([f"B{i}" for i in indexes] * 2)
+    report(
+        "min price float(get_value())",
+        timeit.timeit(
+            lambda: float(min_sheet.get_value(next(cells)) or 0), number=NUMBER
+        ),
+        NUMBER,
+    )
+    report(
+        "min price get_float()",
+        timeit.timeit(lambda: min_sheet.get_float(next(cells)), number=NUMBER),
+        NUMBER,
+    )
+
+
+if __name__ == "__main__":
+    main()
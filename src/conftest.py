@@ -0,0 +1,13 @@
+import os
+
+# app reads its settings from the environment on import
+for name, value in {
+    "KEYS_PATH": "keys",
+    "SHEET_ID": "test-sheet",
+    "SHEET_NAME": "Main",
+    "GAMEBOOST_API_KEY": "test",
+    "MY_SELLER_NAME": "test-seller",
+    "RELAX_TIME_EACH_ROUND": "0",
+    "THREAD_NUMBER": "1",
+}.items():
+    os.environ.setdefault(name, value)
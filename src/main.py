@@ -15,12 +15,17 @@ from app.shared.paths import SRC_PATH, ROOT_PATH
 from app.shared.utils import formated_datetime, sleep_for
 from app.sheet.models import RowModel
 from app.shared.browser_manager import BrowserManager
+from app.gameboost.outbox import get_price_update_outbox
+from app.gsheet_cache import DirtyRows
 from app.gsheet_cache_manager import (
     initialize_gsheet_cache_manager,
+    register_referenced_sheets,
     gsheet_cache_manager,
 )
 
 browser_manager = BrowserManager()
+# Rows of the main sheet to process first, tracked from the first round on
+dirty_rows: DirtyRows | None = None
 for _ in range(config.THREAD_NUMBER):
     browser_manager.create_browser(uc=True, headless=False, disable_js=False)
 
@@ -101,6 +106,37 @@ def main():
         logger.info("No rows to process")
         return
 
+    referenced_ranges, referenced_roles = RowModel.referenced_sheets(
+        sheet_id=config.SHEET_ID,
+        sheet_name=config.SHEET_NAME,
+        indexes=run_indexes,
+    )
+    register_referenced_sheets(referenced_roles)
+    logger.info(f"Loading {len(referenced_ranges)} referenced sheet(s)")
+    gsheet_cache_manager.add_sparse_sheets(referenced_ranges)
+
+    global dirty_rows
+    if dirty_rows is None:
+        # Every row runs in the first round, later rounds start with the rows
+        # whose own values or referenced cells changed since
+        dirty_rows = DirtyRows(
+            gsheet_cache_manager.get_sheet(
+                sheet_id=config.SHEET_ID, sheet_name=config.SHEET_NAME
+            )
+        )
+    RowModel.track_references(
+        dirty_rows,
+        sheet_id=config.SHEET_ID,
+        sheet_name=config.SHEET_NAME,
+        indexes=run_indexes,
+    )
+    changed_indexes = {row + 1 for row in dirty_rows.take()}
+    run_indexes.sort(key=lambda index: index not in changed_indexes)
+    logger.info(
+        f"{len(changed_indexes.intersection(run_indexes))} row(s) changed since "
+        "the last round, processing them first"
+    )
+
     thread_number = config.THREAD_NUMBER
     logger.info(f"Run indexes: {run_indexes}")
     logger.info(f"Thread number: {thread_number}")
@@ -168,18 +204,13 @@ def main():
             f"Total {updated_count} products updated for batch {batch_idx}/{total_batches}"
         )
 
-        logger.info(f"Flushing batch {batch_idx}/{total_batches} to Google Sheet...")
-        update_cells: list[str] = []
-        for index in batch:
-            update_mappping = RowModel.updated_mapping_fields()
-            update_cells.append(f"{update_mappping['Last_update']}{index}")
-            update_cells.append(f"{update_mappping['Note']}{index}")
-        gsheet_cache_manager.flush_to_sheet(
-            sheet_id=config.SHEET_ID,
-            sheet_name=config.SHEET_NAME,
-            cells=update_cells,
-        )
-        logger.info(f"Batch {batch_idx}/{total_batches} flushed successfully")
+        if not gsheet_cache_manager.write_behind_running:
+            logger.info(f"Flushing batch {batch_idx}/{total_batches} to Google Sheet...")
+            gsheet_cache_manager.flush_to_sheet(
+                sheet_id=config.SHEET_ID,
+                sheet_name=config.SHEET_NAME,
+            )
+            logger.info(f"Batch {batch_idx}/{total_batches} flushed successfully")
         sleep_for(time_sleep)
 
     logger.info(
@@ -187,7 +218,6 @@ def main():
     )
     logger.info(f"Sleep for {os.getenv('RELAX_TIME_EACH_ROUND', '10')}s")
     time.sleep(int(os.getenv("RELAX_TIME_EACH_ROUND", "10")))
-    gsheet_cache_manager.clear_all_sheets()
 
 
 @retry_on_fail(max_retries=10, sleep_interval=1)
@@ -224,6 +254,18 @@ if __name__ == "__main__":
     # if not (ROOT_PATH / "cookies" / "cookies.txt").exists():
     set_cookies()
     logger.info("Cookies set.")
-    while True:
-        main()
-        logger.info("=== SCRIPT COMPLETED ===")
+    if not config.TEST_MODE:
+        logger.info("Starting price update outbox writer...")
+        get_price_update_outbox().start()
+    logger.info("Starting Google Sheet cache revalidation...")
+    gsheet_cache_manager.start_revalidation()
+    logger.info("Starting Google Sheet write-behind flusher...")
+    gsheet_cache_manager.start_write_behind()
+    try:
+        while True:
+            main()
+            logger.info("=== SCRIPT COMPLETED ===")
+    finally:
+        logger.info("Flushing pending Google Sheet updates...")
+        if not gsheet_cache_manager.flush_and_wait(timeout=60):
+            logger.warning("Some Google Sheet updates could not be written")